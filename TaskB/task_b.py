@@ -1,5 +1,12 @@
+import argparse
+import os
+import sys
 from pathlib import Path
-from datetime import datetime
+
+# The date/time field parser lives in shared/ at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared.datetime_fields import parse_date, parse_time  # noqa: E402
+from shared import reservation_store  # noqa: E402
 
 
 def parse_reservation(line: str) -> dict:
@@ -7,8 +14,8 @@ def parse_reservation(line: str) -> dict:
     return {
         "reservation_number": int(parts[0]),
         "booker": parts[1],
-        "date": datetime.strptime(parts[2], "%Y-%m-%d").date(),     # convert
-        "start_time": datetime.strptime(parts[3], "%H:%M").time(),  # convert
+        "date": parse_date(parts[2]),                               # convert
+        "start_time": parse_time(parts[3]),                         # convert
         "hours": int(parts[4]),
         "hourly_rate": float(parts[5].replace(",", ".")),           # safe if comma exists
         "paid": parts[6].strip().lower() in ("yes", "true", "1"),
@@ -18,6 +25,22 @@ def parse_reservation(line: str) -> dict:
     }
 
 
+def reservation_from_store(s: reservation_store.StoredReservation) -> dict:
+    """The same dict as parse_reservation() from a row of the SQLite store."""
+    return {
+        "reservation_number": s.reservation_id,
+        "booker": s.name,
+        "date": s.date,
+        "start_time": s.time,
+        "hours": s.duration,
+        "hourly_rate": s.price,
+        "paid": s.confirmed,
+        "venue": s.resource,
+        "phone": s.phone,
+        "email": s.email,
+    }
+
+
 def fmt_date(d) -> str:
     return d.strftime("%d.%m.%Y")
 
@@ -91,7 +114,22 @@ def print_reservation(r: dict) -> None:
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Print the reservations of reservations.txt.")
+    parser.add_argument(
+        "--db",
+        metavar="PATH",
+        help="SQLite database; the file is imported once and later runs read the database",
+    )
+    args = parser.parse_args()
+
     path = Path(__file__).with_name("reservations.txt")
+    if args.db:
+        conn, source = reservation_store.open_file(args.db, str(path), "taskb")
+        for stored in reservation_store.all_reservations(conn, source):
+            print_reservation(reservation_from_store(stored))
+        conn.close()
+        return
+
     with path.open("r", encoding="utf-8") as f:
         for line in f:
             if line.strip():
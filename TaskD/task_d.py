@@ -1,93 +1,58 @@
-from datetime import datetime
+import os
+import sys
 
+# The phase CSV group-by engine lives in shared/ at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared.phase_groups import PhaseGroups, format_kwh  # noqa: E402
 
-def parse_int(value: str) -> int:
-    """Convert a numeric string into int safely (supports spaces)."""
-    return int(value.strip())
 
+WEEKDAYS = [
+    "Monday", "Tuesday", "Wednesday",
+    "Thursday", "Friday", "Saturday", "Sunday"
+]
 
-def read_data(filename: str) -> list[tuple[str, float, float]]:
-    """
-    Reads the CSV file and returns a list of:
-    (weekday, consumption_kwh, production_kwh)
 
-    Consumption = phase1 + phase2 + phase3 (Wh) -> kWh
-    Production  = phase1 + phase2 + phase3 (Wh) -> kWh
+def read_data(filename: str) -> PhaseGroups:
     """
-    rows: list[tuple[str, float, float]] = []
-
-    with open(filename, "r", encoding="utf-8") as file:
-        next(file, None)  # skip header safely
-
-        for line in file:
-            line = line.strip()
-            if not line:
-                continue
-
-            parts = line.split(";")
-            if len(parts) != 7:
-                continue  # invalid line
-
-            ts = datetime.fromisoformat(parts[0].strip())
-
-            c1 = parse_int(parts[1])
-            c2 = parse_int(parts[2])
-            c3 = parse_int(parts[3])
+    Reads the CSV file and groups it by weekday in one pass
+    (see shared/phase_groups.py).
 
-            p1 = parse_int(parts[4])
-            p2 = parse_int(parts[5])
-            p3 = parse_int(parts[6])
+    Consumption = phase1 + phase2 + phase3 (Wh)
+    Production  = phase1 + phase2 + phase3 (Wh)
 
-            consumption_kwh = (c1 + c2 + c3) / 1000
-            production_kwh = (p1 + p2 + p3) / 1000
-
-            weekday = ts.strftime("%A")
-            rows.append((weekday, consumption_kwh, production_kwh))
-
-    return rows
+    Energy stays in whole Wh and is converted to kWh only when printed.
+    """
+    return PhaseGroups.from_file(filename, ("weekday",))
 
 
-def calculate_daily_totals(rows: list[tuple[str, float, float]]) -> dict[str, tuple[float, float]]:
+def calculate_daily_totals(data: PhaseGroups) -> dict[str, tuple[int, int]]:
     """
-    Calculates totals per weekday.
-    Returns: { weekday: (consumption_total_kwh, production_total_kwh) }
+    Totals per weekday in whole Wh.
+    Returns: { weekday: (consumption_total_wh, production_total_wh) }
     """
-    totals: dict[str, list[float]] = {}
+    return {WEEKDAYS[day]: totals for day, totals in data.energy("weekday").items()}
 
-    for weekday, cons_kwh, prod_kwh in rows:
-        if weekday not in totals:
-            totals[weekday] = [0.0, 0.0]
-        totals[weekday][0] += cons_kwh
-        totals[weekday][1] += prod_kwh
 
-    return {day: (vals[0], vals[1]) for day, vals in totals.items()}
-
-
-def print_results(totals: dict[str, tuple[float, float]]) -> None:
+def print_results(totals: dict[str, tuple[int, int]]) -> None:
     """Prints the results as a clear console report with decimal comma."""
     print("Week 42 electricity consumption and production (kWh)\n")
 
-    weekdays_order = [
-        "Monday", "Tuesday", "Wednesday",
-        "Thursday", "Friday", "Saturday", "Sunday"
-    ]
-
-    for day in weekdays_order:
+    for day in WEEKDAYS:
         if day not in totals:
             continue
 
         consumption, production = totals[day]
 
-        cons_str = f"{consumption:.2f}".replace(".", ",")
-        prod_str = f"{production:.2f}".replace(".", ",")
+        cons_str = format_kwh(consumption)
+        prod_str = format_kwh(production)
 
         print(f"{day:<10} consumption: {cons_str:>8}  production: {prod_str:>8}")
 
 
 def main() -> None:
     filename = "week42.csv"
-    rows = read_data(filename)
-    totals = calculate_daily_totals(rows)
+    data = read_data(filename)
+    totals = calculate_daily_totals(data)
     print_results(totals)
 
 
@@ -3,9 +3,41 @@
 
 from __future__ import annotations
 
-from datetime import datetime, date
-from typing import Dict, List, Tuple
-
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import Dict, Iterable, List, TextIO, Tuple
+
+# The phase CSV reader, group-by engine, archive format and file helpers live in shared/ at the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared.columnar import ARCHIVE_SUFFIX, EPOCH_ORDINAL, OFFSET_COLUMN, ArchiveReader  # noqa: E402
+from shared.files import atomic_write, file_digest  # noqa: E402
+from shared.phase_csv import PhaseBatch, parse_phase_block  # noqa: E402
+from shared.phase_groups import PhaseGroups, format_kwh, iso_week_key  # noqa: E402
+
+
+# Week files read when no files are given on the command line
+DEFAULT_WEEK_FILES = ["week41.csv", "week42.csv", "week43.csv"]
+
+# Inputs at least this big (in total) are read in a process pool
+PARALLEL_MIN_BYTES = 1024 * 1024
+
+# Manifest of parsed week files, written next to the report
+MANIFEST_SUFFIX = ".manifest.json"
+MANIFEST_VERSION = 1
+
+COUNT_WORDS = {
+    2: "two", 3: "three", 4: "four", 5: "five",
+    6: "six", 7: "seven", 8: "eight", 9: "nine", 10: "ten",
+}
+
+WEEK_COLUMNS = "päivä        pvm         kulutus (kWh)  tuotanto (kWh)"
 
 FIN_WEEKDAYS: list[str] = [
     "maanantai",
@@ -18,64 +50,194 @@ FIN_WEEKDAYS: list[str] = [
 ]
 
 
-def parse_int(value: str) -> int:
-    """Convert numeric string to int safely."""
-    return int(value.strip())
+def read_week_data(filename: str) -> Dict[date, Tuple[int, int]]:
+    """
+    Read one week's CSV file (or archive) and return per-day totals.
 
+    The file is grouped by date with PhaseGroups (shared/phase_groups.py);
+    the phase values are summed as whole Wh and format_kwh() converts to
+    kWh only for output, so the totals are exact.
 
-def wh_to_kwh(value_wh: float) -> float:
-    """Convert watt-hours (Wh) to kilowatt-hours (kWh)."""
-    return value_wh / 1000.0
+    Returns:
+        dict mapping date -> (consumption_wh_total, production_wh_total)
+    """
+    groups = PhaseGroups(("date",))
+    if filename.endswith(ARCHIVE_SUFFIX):
+        groups.add_batch(read_week_archive(filename))
+    else:
+        groups.add_file(filename)
+    return {date.fromordinal(ordinal): totals for ordinal, totals in groups.energy("date").items()}
+
+
+def read_week_archive(filename: str) -> PhaseBatch:
+    """
+    Read one week's columnar archive (see shared/columnar.py) as a
+    PhaseBatch, like one block of a week CSV file.
+
+    The six value columns are the three consumption and three production
+    phases in whole Wh.
+    """
+    reader = ArchiveReader(filename)
+    names = [name for name in reader.names if name != OFFSET_COLUMN]
+    if len(names) != 6 or any(reader.scales[name] != 1 for name in names):
+        raise ValueError(f"{filename}: expected six whole-Wh phase columns")
+
+    keys, columns = reader.read()
+    return PhaseBatch(
+        array("q", [EPOCH_ORDINAL + key // 86400 for key in keys]),
+        array("b", [key % 86400 // 3600 for key in keys]),
+        tuple(columns[name] for name in names),
+    )
+
+
+def merge_daily(parts: Iterable[Dict[date, Tuple[int, int]]]) -> Dict[date, Tuple[int, int]]:
+    """
+    Merge per-day totals from several files (e.g. several sites) by adding
+    the values of the same day. Integer sums, so the merge order does not
+    change the result.
+    """
+    merged: Dict[date, List[int]] = {}
+    for daily in parts:
+        for d, (cons, prod) in daily.items():
+            if d not in merged:
+                merged[d] = [0, 0]
+            merged[d][0] += cons
+            merged[d][1] += prod
+    return {d: (vals[0], vals[1]) for d, vals in merged.items()}
 
 
-def read_week_data(filename: str) -> Dict[date, Tuple[float, float]]:
+def split_by_week(daily: Dict[date, Tuple[int, int]]) -> List[Tuple[int, Dict[date, Tuple[int, int]]]]:
     """
-    Read one week's CSV file and return per-day totals.
+    Group per-day totals by ISO week (the 'week' key of PhaseGroups).
 
     Returns:
-        dict mapping date -> (consumption_kwh_total, production_kwh_total)
+        [(week_number, daily totals of that week), ...] in calendar order
     """
-    daily: Dict[date, List[float]] = {}
+    weeks: Dict[int, Dict[date, Tuple[int, int]]] = {}
+    for d in sorted(daily):
+        weeks.setdefault(iso_week_key(d.toordinal()), {})[d] = daily[d]
+    return [(key % 100, days) for key, days in sorted(weeks.items())]
 
-    with open(filename, "r", encoding="utf-8") as f:
-        next(f, None)  # skip header
 
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
+def read_week_files(filenames: List[str], workers: int = 1) -> List[Dict[date, Tuple[int, int]]]:
+    """
+    Read many week files, returning each file's per-day totals in input order.
 
-            parts = line.split(";")
-            if len(parts) != 7:
-                continue  # invalid line, skip
+    With workers > 1 the files are read in a process pool.
+    """
+    if workers > 1 and len(filenames) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(filenames))) as pool:
+            return list(pool.map(read_week_data, filenames))
+    return list(map(read_week_data, filenames))
 
-            ts = datetime.fromisoformat(parts[0].strip())
-            day = ts.date()
 
-            c1 = parse_int(parts[1])
-            c2 = parse_int(parts[2])
-            c3 = parse_int(parts[3])
-            p1 = parse_int(parts[4])
-            p2 = parse_int(parts[5])
-            p3 = parse_int(parts[6])
+def read_all_weeks(filenames: List[str], workers: int = 1) -> Dict[date, Tuple[int, int]]:
+    """Read many week files and merge their per-day totals."""
+    return merge_daily(read_week_files(filenames, workers))
 
-            # sum all three phases
-            consumption_kwh = wh_to_kwh(c1 + c2 + c3)
-            production_kwh = wh_to_kwh(p1 + p2 + p3)
 
-            if day not in daily:
-                daily[day] = [0.0, 0.0]
+def load_manifest(path: str) -> Dict[str, dict]:
+    """
+    Load the manifest entries (absolute file name -> entry).
 
-            daily[day][0] += consumption_kwh
-            daily[day][1] += production_kwh
+    A missing, damaged or old-version manifest gives an empty dict, so
+    every file is simply parsed again.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != MANIFEST_VERSION:
+            return {}
+        return dict(data["files"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return {}
+
+
+def save_manifest(path: str, entries: Dict[str, dict]) -> None:
+    """Write the manifest to a temporary file and rename it into place."""
+    with atomic_write(path, "w", encoding="utf-8") as f:
+        json.dump({"version": MANIFEST_VERSION, "files": entries}, f, indent=1, sort_keys=True)
+
+
+def read_weeks_incremental(
+    filenames: List[str],
+    manifest_path: str,
+    workers: int = 1,
+) -> Tuple[Dict[date, Tuple[int, int]], int]:
+    """
+    Read week files, parsing only the ones that are new or changed.
 
-    # convert inner lists to tuples
-    return {d: (vals[0], vals[1]) for d, vals in daily.items()}
+    The manifest keeps, per file, its size, mtime, sha256 and per-day
+    totals. A file with the same size and mtime is not even read; one with
+    a new mtime but the same contents (e.g. copied or touched) is hashed
+    and reused. Only the rest are parsed (in a process pool when
+    workers > 1). Entries of files that are no longer listed are dropped.
+
+    Returns:
+        (merged per-day totals, number of files parsed)
+    """
+    old = load_manifest(manifest_path)
+    entries: Dict[str, dict] = {}
+    todo: List[Tuple[str, str]] = []
+
+    for name in filenames:
+        key = os.path.abspath(name)
+        st = os.stat(name)
+        entry = old.get(key)
+        if not isinstance(entry, dict) or not isinstance(entry.get("days"), dict):
+            entry = None  # no usable day totals: parse the file again
+        if entry is not None and (entry.get("size"), entry.get("mtime_ns")) == (st.st_size, st.st_mtime_ns):
+            entries[key] = entry
+            continue
+
+        digest = file_digest(name).hex()
+        if entry is not None and entry.get("sha256") == digest:
+            entries[key] = dict(entry, size=st.st_size, mtime_ns=st.st_mtime_ns)
+            continue
+
+        entries[key] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest}
+        todo.append((name, key))
+
+    for (name, key), daily in zip(todo, read_week_files([name for name, _ in todo], workers)):
+        entries[key]["days"] = {d.isoformat(): [cons, prod] for d, (cons, prod) in daily.items()}
+
+    if entries != old:
+        try:
+            save_manifest(manifest_path, entries)
+        except OSError:
+            pass
+
+    parts = (
+        {date.fromisoformat(d): (cons, prod) for d, (cons, prod) in entries[os.path.abspath(name)]["days"].items()}
+        for name in filenames
+    )
+    return merge_daily(parts), len(todo)
 
 
-def format_kwh(value: float) -> str:
-    """Format kWh value using Finnish decimal comma and two decimals."""
-    return f"{value:.2f}".replace(".", ",")
+def resolve_week_files(patterns: List[str]) -> List[str]:
+    """
+    Expand file names and glob patterns to a sorted list of week files.
+
+    A missing weekNN.csv is replaced by its archive weekNN.hcol if there
+    is one (the week has been archived and its CSV removed).
+    """
+    filenames: List[str] = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern))
+        if matches:
+            filenames.extend(matches)
+            continue
+        archive = os.path.splitext(pattern)[0] + ARCHIVE_SUFFIX
+        filenames.append(archive if os.path.exists(archive) else pattern)
+    return sorted(set(filenames))
+
+
+def default_workers(filenames: List[str]) -> int:
+    """Number of reader processes worth using (1 for small inputs)."""
+    total = sum(os.path.getsize(name) for name in filenames if os.path.exists(name))
+    if total < PARALLEL_MIN_BYTES:
+        return 1
+    return os.cpu_count() or 1
 
 
 def format_date(d: date) -> str:
@@ -86,60 +248,162 @@ def format_date(d: date) -> str:
 def write_week_report(
     file,
     week_number: int,
-    daily: Dict[date, Tuple[float, float]],
-) -> Tuple[float, float]:
+    daily: Dict[date, Tuple[int, int]],
+) -> Tuple[int, int]:
     """
     Write one week's daily data to an open file.
 
     Returns:
-        (total_consumption_kwh, total_production_kwh) for the week.
+        (total_consumption_wh, total_production_wh) for the week.
     """
     file.write(f"Week {week_number} electricity consumption and production (kWh)\n")
-    file.write("päivä        pvm         kulutus (kWh)  tuotanto (kWh)\n")
+    file.write(f"{WEEK_COLUMNS}\n")
 
-    week_cons = 0.0
-    week_prod = 0.0
+    week_cons = 0
+    week_prod = 0
 
     for d in sorted(daily.keys()):
-        weekday_name = FIN_WEEKDAYS[d.weekday()]
         cons, prod = daily[d]
 
         week_cons += cons
         week_prod += prod
 
-        file.write(
-            f"{weekday_name:<11} {format_date(d):<10}  "
-            f"{format_kwh(cons):>8}        {format_kwh(prod):>8}\n"
-        )
+        file.write(format_day_line(d, cons, prod) + "\n")
 
-    file.write(
-        f"{'Yhteensä':<21}  "
-        f"{format_kwh(week_cons):>8}        {format_kwh(week_prod):>8}\n"
-    )
+    file.write(format_total_line(week_cons, week_prod) + "\n")
     file.write("\n")
 
     return week_cons, week_prod
 
 
+def format_day_line(d: date, cons: int, prod: int) -> str:
+    """One report row: weekday, date, consumption and production."""
+    weekday_name = FIN_WEEKDAYS[d.weekday()]
+    return (
+        f"{weekday_name:<11} {format_date(d):<10}  "
+        f"{format_kwh(cons):>8}        {format_kwh(prod):>8}"
+    )
+
+
+def format_total_line(cons: int, prod: int) -> str:
+    """The week total row of a report."""
+    return f"{'Yhteensä':<21}  {format_kwh(cons):>8}        {format_kwh(prod):>8}"
+
+
+def read_appended_rows(filename: str, offset: int, groups: PhaseGroups) -> Tuple[int, List[int]]:
+    """
+    Add the complete rows written to a week file after byte offset.
+
+    Only the new bytes are read. A trailing line without its newline yet
+    is left for the next call. Offset 0 means the header is still unread.
+
+    Returns:
+        (new offset, day ordinals whose sums changed)
+    """
+    with open(filename, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+
+    end = data.rfind(b"\n") + 1
+    if end == 0:
+        return offset, []
+
+    start = data.find(b"\n") + 1 if offset == 0 else 0  # header
+    return offset + end, groups.add_batch(parse_phase_block(data[start:end]))
+
+
+def follow_week_file(filename: str, interval: float = 1.0, out: TextIO = sys.stdout) -> None:
+    """
+    Print a week file's report, then keep printing updates as rows are appended.
+
+    The file is tailed from the last byte offset; after each batch of new
+    rows only the lines of the changed days and the new week total are
+    printed. If the file shrinks (replaced or truncated) it is read again
+    from the start. Runs until interrupted.
+    """
+    groups = PhaseGroups(("date",))
+    offset = 0
+    first = True
+
+    while True:
+        try:
+            size = os.path.getsize(filename)
+        except OSError:
+            size = 0
+        if size < offset:
+            groups = PhaseGroups(("date",))
+            offset = 0
+            first = True
+
+        offset, changed = read_appended_rows(filename, offset, groups) if size else (offset, [])
+        if first:
+            out.write(f"{filename} (following, Ctrl+C to stop)\n{WEEK_COLUMNS}\n")
+            changed = list(groups.groups["date"])
+            first = False
+
+        if changed:
+            daily = groups.energy("date")
+            for ordinal in sorted(set(changed)):
+                out.write(format_day_line(date.fromordinal(ordinal), *daily[ordinal]) + "\n")
+            out.write(format_total_line(*groups.total_energy()) + "\n")
+            out.flush()
+
+        time.sleep(interval)
+
+
 def main() -> None:
-    """Main entry point: process three weeks and write summary.txt."""
-    week_files = [
-        (41, "week41.csv"),
-        (42, "week42.csv"),
-        (43, "week43.csv"),
-    ]
-
-    total_cons_all = 0.0
-    total_prod_all = 0.0
-
-    with open("summary.txt", "w", encoding="utf-8") as out:
-        for week_no, filename in week_files:
-            daily = read_week_data(filename)
+    """Main entry point: process the week files and write summary.txt."""
+    parser = argparse.ArgumentParser(description="Weekly electricity summary from week CSV files.")
+    parser.add_argument(
+        "files",
+        nargs="*",
+        default=DEFAULT_WEEK_FILES,
+        help="week files or glob patterns, e.g. 'site*/week*.csv' (default: week41-43.csv)",
+    )
+    parser.add_argument("--workers", type=int, help="reader processes (default: by input size)")
+    parser.add_argument("--output", default="summary.txt", help="report file (default: summary.txt)")
+    parser.add_argument(
+        "--follow",
+        metavar="FILE",
+        help="print FILE's daily totals and keep updating them as rows are appended",
+    )
+    parser.add_argument("--interval", type=float, default=1.0, help="--follow poll interval in seconds")
+    parser.add_argument(
+        "--no-manifest",
+        action="store_true",
+        help="parse every file and do not read or write OUTPUT.manifest.json",
+    )
+    args = parser.parse_args()
+
+    if args.follow:
+        try:
+            follow_week_file(args.follow, args.interval)
+        except KeyboardInterrupt:
+            pass
+        return
+
+    filenames = resolve_week_files(args.files)
+    workers = args.workers if args.workers is not None else default_workers(filenames)
+    if args.no_manifest:
+        daily = read_all_weeks(filenames, workers)
+    else:
+        # Only new or changed files are parsed; see read_weeks_incremental
+        daily, _ = read_weeks_incremental(filenames, args.output + MANIFEST_SUFFIX, workers)
+    weeks = split_by_week(daily)
+
+    total_cons_all = 0
+    total_prod_all = 0
+
+    with open(args.output, "w", encoding="utf-8") as out:
+        for week_no, daily in weeks:
             week_cons, week_prod = write_week_report(out, week_no, daily)
             total_cons_all += week_cons
             total_prod_all += week_prod
 
-        out.write("All three weeks total (kWh)\n")
+        if len(weeks) == 1:
+            out.write("Week total (kWh)\n")
+        else:
+            out.write(f"All {COUNT_WORDS.get(len(weeks), str(len(weeks)))} weeks total (kWh)\n")
         out.write(f"{'Total consumption:':<22} {format_kwh(total_cons_all)}\n")
         out.write(f"{'Total production:':<22} {format_kwh(total_prod_all)}\n")
 
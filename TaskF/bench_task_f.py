@@ -0,0 +1,129 @@
+# Copyright (c) 2026 Ismail Hossain
+# License: MIT
+
+"""
+Benchmarks for TaskF data loading.
+
+Run from the TaskF folder:
+    python3 bench_task_f.py [csv file] [--parallel YEARS]
+
+--parallel also times the parallel loader on a generated file that
+repeats the given CSV for YEARS years.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import timeit
+from datetime import datetime
+from typing import Callable, List
+
+from task_f import Measurement, parse_float, read_data
+
+
+def read_data_rows(filename: str) -> List[Measurement]:
+    """The original row-by-row loader (one Measurement per line), for comparison."""
+    rows: List[Measurement] = []
+
+    with open(filename, "r", encoding="utf-8") as f:
+        header = f.readline()
+        if not header:
+            return rows
+
+        sep = ";" if ";" in header else ","
+
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+
+            parts = line.split(sep)
+            if len(parts) < 4:
+                continue
+
+            rows.append(
+                Measurement(
+                    ts=datetime.fromisoformat(parts[0].strip()),
+                    consumption_kwh=parse_float(parts[1]),
+                    production_kwh=parse_float(parts[2]),
+                    temperature_c=parse_float(parts[3]),
+                )
+            )
+
+    return rows
+
+
+def best_of(func: Callable[[], object], number: int = 10, repeat: int = 7) -> float:
+    """Best average time of one call in seconds."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def write_repeated_csv(source: str, target: str, years: int) -> None:
+    """Write a CSV that repeats the source rows, shifted by one year per copy."""
+    with open(source, "r", encoding="utf-8") as f:
+        header = f.readline()
+        rows = [line.rstrip("\n").split(";", 1) for line in f if line.strip()]
+
+    with open(target, "w", encoding="utf-8") as out:
+        out.write(header)
+        for k in range(years):
+            for stamp, rest in rows:
+                ts = datetime.fromisoformat(stamp)
+                shifted = ts.replace(year=ts.year + k) if not (ts.month == 2 and ts.day == 29) else ts
+                out.write(f"{shifted.isoformat(timespec='milliseconds')};{rest}\n")
+
+
+def bench_loaders(filename: str) -> None:
+    """Compare the original loader with the serial fast and slow paths."""
+    fast = read_data(filename)
+    slow = read_data(filename, fast=False)
+    assert fast.hours == slow.hours and fast.offsets == slow.offsets
+    assert fast.consumption == slow.consumption and fast.production == slow.production
+    assert fast.temperature == slow.temperature
+
+    t_rows = best_of(lambda: read_data_rows(filename))
+    t_slow = best_of(lambda: read_data(filename, fast=False))
+    t_fast = best_of(lambda: read_data(filename))
+
+    print(f"{filename}: {len(fast)} rows")
+    print(f"original row loader       {t_rows * 1000:8.2f} ms")
+    print(f"read_data(fast=False)     {t_slow * 1000:8.2f} ms  ({t_rows / t_slow:4.1f}x)")
+    print(f"read_data (fast path)     {t_fast * 1000:8.2f} ms  ({t_rows / t_fast:4.1f}x)")
+
+
+def bench_parallel(filename: str, years: int) -> None:
+    """Time serial vs parallel parsing of a big generated file."""
+    with tempfile.TemporaryDirectory() as tmp:
+        big = os.path.join(tmp, "big.csv")
+        write_repeated_csv(filename, big, years)
+        serial = read_data(big)
+        t_serial = best_of(lambda: read_data(big), number=1, repeat=3)
+
+        print(f"\n{years} years generated from {filename}: {len(serial)} rows")
+        print(f"serial                    {t_serial * 1000:8.2f} ms")
+
+        cpus = os.cpu_count() or 1
+        for workers in sorted({2, 4, cpus}):
+            parallel = read_data(big, workers=workers)
+            assert parallel.hours == serial.hours and parallel.consumption == serial.consumption
+            assert parallel.offsets == serial.offsets and parallel.temperature == serial.temperature
+            t_par = best_of(lambda: read_data(big, workers=workers), number=1, repeat=3)
+            print(f"workers={workers:<3}               {t_par * 1000:8.2f} ms  ({t_serial / t_par:4.1f}x)")
+        print(f"({cpus} CPUs available)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark TaskF loading.")
+    parser.add_argument("csv", nargs="?", default="2025.csv")
+    parser.add_argument("--parallel", type=int, metavar="YEARS", help="also benchmark parallel ingest")
+    args = parser.parse_args()
+
+    bench_loaders(args.csv)
+    if args.parallel:
+        bench_parallel(args.csv, args.parallel)
+
+
+if __name__ == "__main__":
+    main()
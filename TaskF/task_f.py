@@ -3,9 +3,75 @@
 
 from __future__ import annotations
 
+import hashlib
+import heapq
+import mmap
+import os
+import re
+import struct
+import sys
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime, date
-from typing import Dict, List, Tuple
+from datetime import datetime, date, timedelta, timezone, tzinfo
+from itertools import repeat
+from operator import floordiv, le, mul
+from typing import Callable, Dict, Iterator, List, Protocol, Tuple
+
+# The columnar archive format, the kWh formatter and the file helpers live in shared/ at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Epoch hours are counted from EPOCH_ORDINAL (1970-01-01), and NO_OFFSET marks
+# timestamps without a UTC offset, both as in the archives
+from shared.columnar import (  # noqa: E402
+    ARCHIVE_SUFFIX,
+    EPOCH_ORDINAL,
+    NO_OFFSET,
+    OFFSET_COLUMN,
+    ArchiveReader,
+    date_key,
+)
+from shared.files import atomic_write, file_digest  # noqa: E402
+from shared.phase_groups import format_kwh  # noqa: E402
+
+# Archive keys are seconds; the exclusive end key of a day is its key plus this
+SECONDS_PER_DAY = 86400
+
+# Beyond any Wh value of an int64 store column; the min/max of an empty Cell
+WH_LIMIT = 1 << 63
+
+# Files at least this big are parsed in parallel when workers are available
+PARALLEL_MIN_BYTES = 16 * 1024 * 1024
+
+# Parsed field values kept by a FieldCache before it is cleared
+FIELD_CACHE_SIZE = 1 << 16
+
+# kWh fields with exactly three decimals (whole Wh), one per line
+WH_FIELDS_RE = re.compile(rb"[-+]?[0-9]+\.[0-9]{3}(?:\n[-+]?[0-9]+\.[0-9]{3})*")
+
+# Partition files in a dataset folder: YYYY.csv or YYYY-MM.csv, or the
+# same names as columnar archives (.hcol)
+PARTITION_RE = re.compile(r"^(\d{4})(?:-(\d{2}))?\.(?:csv|hcol)$")
+
+# CSV files without a valid cache are loaded in the background in pieces
+# of about this size, so reports can start before the whole file is parsed
+LOAD_CHUNK_BYTES = 4 * 1024 * 1024
+
+# Default number of rows in the top-N (peak) reports
+PEAK_COUNT = 10
+
+# Rough memory use of the day/month/year rollups per indexed day
+ROLLUP_BYTES_PER_DAY = 1200
+
+# Binary cache sidecar written next to the CSV (e.g. 2025.csv.cache)
+CACHE_SUFFIX = ".cache"
+CACHE_MAGIC = b"TFCACHE\0"
+CACHE_VERSION = 2
+# magic, version, little-endian flag, is_sorted, source size, source mtime (ns),
+# source sha256, row count
+CACHE_HEADER = struct.Struct("<8sIBBQq32sQ")
 
 
 @dataclass(frozen=True)
@@ -17,22 +83,343 @@ class Measurement:
     temperature_c: float
 
 
+class MeasurementStore:
+    """
+    Columnar storage for hourly measurements.
+
+    Timestamps are kept as int64 local wall-clock hours since 1970-01-01
+    (plus the UTC offset in minutes), consumption and production as int64
+    watt-hours and the temperature as a float array. This takes a few dozen
+    bytes per row instead of one Measurement object with its own datetime
+    and floats, and energy sums are exact integers.
+    """
+
+    def __init__(self) -> None:
+        self.hours = array("q")
+        self.offsets = array("h")
+        self.consumption = array("q")  # Wh
+        self.production = array("q")  # Wh
+        self.temperature = array("d")
+        # True while every appended row is at or after the previous one
+        self.is_sorted = True
+
+    @classmethod
+    def from_columns(
+        cls,
+        hours: array,
+        offsets: array,
+        consumption: array,
+        production: array,
+        temperature: array,
+        is_sorted: bool | None = None,
+    ) -> MeasurementStore:
+        """Build a store from already filled column arrays."""
+        store = cls()
+        store.hours = hours
+        store.offsets = offsets
+        store.consumption = consumption
+        store.production = production
+        store.temperature = temperature
+        store.is_sorted = all(map(le, hours, hours[1:])) if is_sorted is None else is_sorted
+        return store
+
+    def __len__(self) -> int:
+        return len(self.hours)
+
+    def __getitem__(self, i: int) -> Measurement:
+        return Measurement(
+            ts=self.timestamp(i),
+            consumption_kwh=self.consumption[i] / 1000,
+            production_kwh=self.production[i] / 1000,
+            temperature_c=self.temperature[i],
+        )
+
+    def __iter__(self) -> Iterator[Measurement]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def append(
+        self,
+        ts: datetime,
+        consumption_wh: int,
+        production_wh: int,
+        temperature_c: float,
+    ) -> None:
+        """Add one row to the end of the store (energy in whole Wh)."""
+        offset = ts.utcoffset()
+        hour = (ts.toordinal() - EPOCH_ORDINAL) * 24 + ts.hour
+        if self.hours and hour < self.hours[-1]:
+            self.is_sorted = False
+        self.hours.append(hour)
+        self.offsets.append(NO_OFFSET if offset is None else int(offset.total_seconds()) // 60)
+        self.consumption.append(consumption_wh)
+        self.production.append(production_wh)
+        self.temperature.append(temperature_c)
+
+    def slice(self, start: int, stop: int) -> MeasurementStore:
+        """A new store with rows [start, stop) (the columns are copied)."""
+        return MeasurementStore.from_columns(
+            self.hours[start:stop],
+            self.offsets[start:stop],
+            self.consumption[start:stop],
+            self.production[start:stop],
+            self.temperature[start:stop],
+            is_sorted=self.is_sorted or None,
+        )
+
+    def timestamp(self, i: int) -> datetime:
+        """Rebuild the datetime of row i."""
+        day, hour = divmod(self.hours[i], 24)
+        d = date.fromordinal(EPOCH_ORDINAL + day)
+        offset = self.offsets[i]
+        tz = None if offset == NO_OFFSET else timezone(timedelta(minutes=offset))
+        return datetime(d.year, d.month, d.day, hour, tzinfo=tz)
+
+    def nbytes(self) -> int:
+        """Size of the column buffers in bytes."""
+        return sum(
+            len(col) * col.itemsize
+            for col in (self.hours, self.offsets, self.consumption, self.production, self.temperature)
+        )
+
+
+@dataclass(frozen=True)
+class Totals:
+    """
+    Summed values over a set of hourly rows (can be added and subtracted).
+
+    Energy is summed in whole Wh, so totals are exact however they are
+    combined; format them with format_kwh().
+    """
+    consumption_wh: int = 0
+    production_wh: int = 0
+    temp_sum: float = 0.0
+    temp_count: int = 0
+    # Sum of per-day average temperatures, used by the monthly report
+    day_temp_sum: float = 0.0
+    day_count: int = 0
+
+    def __add__(self, other: Totals) -> Totals:
+        return Totals(
+            self.consumption_wh + other.consumption_wh,
+            self.production_wh + other.production_wh,
+            self.temp_sum + other.temp_sum,
+            self.temp_count + other.temp_count,
+            self.day_temp_sum + other.day_temp_sum,
+            self.day_count + other.day_count,
+        )
+
+    def __sub__(self, other: Totals) -> Totals:
+        return Totals(
+            self.consumption_wh - other.consumption_wh,
+            self.production_wh - other.production_wh,
+            self.temp_sum - other.temp_sum,
+            self.temp_count - other.temp_count,
+            self.day_temp_sum - other.day_temp_sum,
+            self.day_count - other.day_count,
+        )
+
+    def net_import_wh(self) -> int:
+        """Consumption minus production in Wh."""
+        return self.consumption_wh - self.production_wh
+
+    def avg_temperature(self) -> float:
+        """Average of all hourly temperature values."""
+        return (self.temp_sum / self.temp_count) if self.temp_count > 0 else 0.0
+
+    def avg_daily_temperature(self) -> float:
+        """Average of the per-day average temperatures."""
+        return (self.day_temp_sum / self.day_count) if self.day_count > 0 else 0.0
+
+
+@dataclass(frozen=True)
+class Fit:
+    """Least-squares line consumption = intercept + slope * temperature."""
+    slope: float = 0.0
+    intercept: float = 0.0
+    r_squared: float = 0.0
+    count: int = 0
+
+
+@dataclass(frozen=True)
+class Cell:
+    """
+    Count plus sum, min and max of each value over a group of hourly rows.
+
+    Consumption and production sums, minimums and maximums are whole Wh
+    like the store columns (an empty cell holds the int64 limits as its
+    min and max); the avg_*() helpers return kWh. The sums of squares and
+    the consumption x temperature sum make the cells sufficient statistics
+    for a consumption/temperature fit, so a regression over any group of
+    cells needs no second pass over the rows.
+    """
+    count: int = 0
+    consumption_sum: int = 0
+    consumption_min: int = WH_LIMIT
+    consumption_max: int = -WH_LIMIT
+    production_sum: int = 0
+    production_min: int = WH_LIMIT
+    production_max: int = -WH_LIMIT
+    temperature_sum: float = 0.0
+    temperature_min: float = float("inf")
+    temperature_max: float = float("-inf")
+    consumption_sq_sum: int = 0
+    temperature_sq_sum: float = 0.0
+    cross_sum: float = 0.0
+
+    @classmethod
+    def of(cls, store: MeasurementStore, start: int, stop: int, step: int = 1) -> Cell:
+        """Reduce rows start, start+step, ... below stop with whole-slice reductions."""
+        cons = store.consumption[start:stop:step]
+        if not cons:
+            return cls()
+        prod = store.production[start:stop:step]
+        temp = store.temperature[start:stop:step]
+        return cls(
+            len(cons),
+            sum(cons), min(cons), max(cons),
+            sum(prod), min(prod), max(prod),
+            sum(temp), min(temp), max(temp),
+            sum(map(mul, cons, cons)),
+            sum(map(mul, temp, temp)),
+            sum(map(mul, cons, temp)),
+        )
+
+    def __add__(self, other: Cell) -> Cell:
+        return Cell(
+            self.count + other.count,
+            self.consumption_sum + other.consumption_sum,
+            min(self.consumption_min, other.consumption_min),
+            max(self.consumption_max, other.consumption_max),
+            self.production_sum + other.production_sum,
+            min(self.production_min, other.production_min),
+            max(self.production_max, other.production_max),
+            self.temperature_sum + other.temperature_sum,
+            min(self.temperature_min, other.temperature_min),
+            max(self.temperature_max, other.temperature_max),
+            self.consumption_sq_sum + other.consumption_sq_sum,
+            self.temperature_sq_sum + other.temperature_sq_sum,
+            self.cross_sum + other.cross_sum,
+        )
+
+    def avg_consumption(self) -> float:
+        return (self.consumption_sum / self.count / 1000) if self.count > 0 else 0.0
+
+    def avg_production(self) -> float:
+        return (self.production_sum / self.count / 1000) if self.count > 0 else 0.0
+
+    def avg_temperature(self) -> float:
+        return (self.temperature_sum / self.count) if self.count > 0 else 0.0
+
+    def fit(self) -> Fit:
+        """
+        Fit consumption (kWh) against temperature from the cell's sums.
+
+        Returns a zero Fit (with the row count) when the temperature does
+        not vary, since no slope can be fitted then.
+        """
+        n = self.count
+        if n < 2:
+            return Fit(count=n)
+        sxx = self.temperature_sq_sum - self.temperature_sum * self.temperature_sum / n
+        sxy = self.cross_sum - self.temperature_sum * self.consumption_sum / n
+        syy = self.consumption_sq_sum - self.consumption_sum * self.consumption_sum / n
+        # Centered sums that are only rounding noise count as zero
+        if sxx <= 1e-12 * self.temperature_sq_sum:
+            return Fit(count=n)
+
+        slope = sxy / sxx
+        intercept = (self.consumption_sum - slope * self.temperature_sum) / n
+        # The sums are in Wh; report the line in kWh
+        slope /= 1000
+        intercept /= 1000
+        r_squared = sxy * sxy / (sxx * syy) if syy > 1e-12 * self.consumption_sq_sum else 0.0
+        return Fit(slope, intercept, min(r_squared, 1.0), n)
+
+    def totals(self) -> Totals:
+        """The sums of this cell as Totals."""
+        return Totals(
+            consumption_wh=self.consumption_sum,
+            production_wh=self.production_sum,
+            temp_sum=self.temperature_sum,
+            temp_count=self.count,
+        )
+
+
 def parse_float(value: str) -> float:
     """Parse float safely (supports comma or dot)."""
     v = value.strip().replace(",", ".")
     return float(v)
 
 
+def parse_wh(value: str) -> int:
+    """
+    Parse a kWh value (comma or dot decimals) straight to whole Wh.
+
+    Plain decimals are read digit by digit, so "1,569" is exactly 1569;
+    digits below 1 Wh are rounded half up. Other float spellings
+    (e.g. "1e-3") fall back to float().
+    """
+    v = value.strip().replace(",", ".")
+    whole, _, frac = v.partition(".")
+    if len(frac) == 3 and frac.isdigit():
+        # The usual meter layout: the digits without the dot are the Wh
+        return int(whole + frac)
+
+    sign = -1 if v[:1] == "-" else 1
+    whole, _, frac = (v[1:] if v[:1] in "+-" else v).partition(".")
+    digits = whole + frac
+    if not (digits.isascii() and digits.isdigit()):
+        return round(float(v) * 1000)
+
+    wh = int(whole or "0") * 1000 + int((frac + "000")[:3])
+    if frac[3:4] >= "5":
+        wh += 1
+    return sign * wh
+
+
+class FieldCache(dict):
+    """
+    field -> parsed value, parsed on first sight.
+
+    A year of hourly kWh readings has a few thousand distinct values and
+    a daily temperature repeats 24 times, so most fields cost one dict
+    lookup instead of a parse.
+    """
+
+    def __init__(self, parse: Callable) -> None:
+        super().__init__()
+        self.parse = parse
+
+    def __missing__(self, field):
+        if len(self) >= FIELD_CACHE_SIZE:
+            self.clear()
+        value = self[field] = self.parse(field)
+        return value
+
+
 def finnish_decimal(value: float) -> str:
     """Format a number with 2 decimals and decimal comma."""
     return f"{value:.2f}".replace(".", ",")
 
 
+def finnish_slope(value: float) -> str:
+    """Format a slope (kWh per °C) with 3 decimals and decimal comma."""
+    return f"{value:.3f}".replace(".", ",")
+
+
 def format_date_fi(d: date) -> str:
     """Format date as dd.mm.yyyy."""
     return d.strftime("%d.%m.%Y")
 
 
+def month_bounds(year: int, month: int) -> Tuple[date, date]:
+    """First and last day of a month."""
+    first = date(year, month, 1)
+    last = date(year, 12, 31) if month == 12 else date(year, month + 1, 1) - timedelta(days=1)
+    return first, last
+
+
 def parse_date_fi(s: str) -> date:
     """Parse date from dd.mm.yyyy format into date object."""
     s = s.strip()
@@ -40,71 +427,1146 @@ def parse_date_fi(s: str) -> date:
     return dt.date()
 
 
-def read_data(filename: str) -> List[Measurement]:
+def parse_timestamps(stamps: List[bytes]) -> Tuple[array, array, bool]:
+    """
+    Convert ISO timestamps (ASCII bytes) into local epoch hours and UTC offsets.
+
+    Hourly exports have a strictly regular cadence, so instead of parsing
+    every value we predict the rest of the current day (day prefix plus
+    cached "THH:MM..." suffixes) and check the whole run with a single
+    comparison. Hours for a matching run are derived arithmetically. Only
+    rows that break the pattern (gaps, DST/offset changes, odd formatting)
+    go through datetime.fromisoformat.
+
+    Returns:
+        (hours, offsets, is_sorted) with array("q") hours and array("h") offsets
+    """
+    hours = array("q")
+    offsets = array("h")
+    is_sorted = True
+    suffixes: Dict[bytes, List[bytes]] = {}
+
+    n = len(stamps)
+    i = 0
+    # All timestamps in one buffer; runs are compared as slices of it
+    joined = b"\n".join(stamps)
+    pos = 0
+    # State after the last row: next expected local hour, the prefix of its
+    # day, the suffix table of the current run and its UTC offset
+    expected = -1
+    day_prefix = b""
+    table: List[bytes] = []
+    offset = NO_OFFSET
+    # Rows matched since the last slow-path row; written out in one go
+    matched = 0
+
+    while i < n:
+        hour_of_day = expected % 24
+        run = min(24 - hour_of_day, n - i)
+        if expected >= 0:
+            # Values never contain newlines, so comparing the newline-joined
+            # runs is the same as comparing them one by one
+            want = day_prefix + (b"\n" + day_prefix).join(table[hour_of_day:hour_of_day + run])
+            end = pos + len(want)
+            if joined[pos:end] == want and (end == len(joined) or joined[end] == 10):
+                pos = end + 1
+                i += run
+                matched += run
+                expected += run
+                day_prefix = _day_prefix(expected)
+                continue
+
+        if matched:
+            hours.extend(range(expected - matched, expected))
+            offsets.extend(array("h", [offset]) * matched)
+            matched = 0
+
+        # Slow path: parse this row fully and start a new run from it
+        raw = stamps[i]
+        pos += len(raw) + 1
+        ts = datetime.fromisoformat(raw.decode("utf-8").strip())
+        utc = ts.utcoffset()
+        offset = NO_OFFSET if utc is None else int(utc.total_seconds()) // 60
+        hour = (ts.toordinal() - EPOCH_ORDINAL) * 24 + ts.hour
+        if hours and hour < hours[-1]:
+            is_sorted = False
+        hours.append(hour)
+        offsets.append(offset)
+        i += 1
+
+        expected = -1
+        # Only plain "YYYY-MM-DD?HH<rest>" layouts can be predicted
+        if raw[:10] == _day_prefix(hour) and raw[11:13] == b"%02d" % ts.hour:
+            key = raw[10:11] + raw[13:]
+            if key not in suffixes:
+                suffixes[key] = [raw[10:11] + b"%02d" % h + raw[13:] for h in range(24)]
+            table = suffixes[key]
+            expected = hour + 1
+            day_prefix = _day_prefix(expected)
+
+    if matched:
+        hours.extend(range(expected - matched, expected))
+        offsets.extend(array("h", [offset]) * matched)
+
+    return hours, offsets, is_sorted
+
+
+def _day_prefix(hour: int) -> bytes:
+    """ISO date (YYYY-MM-DD) of a local epoch hour, as bytes."""
+    return date.fromordinal(EPOCH_ORDINAL + hour // 24).isoformat().encode("ascii")
+
+
+def _read_columns_fast(body: bytes, sep: bytes) -> MeasurementStore | None:
+    """
+    Parse the data rows column by column instead of line by line.
+
+    Only used when every row has the same number of columns. Returns None
+    when that does not hold or a value does not parse; the caller then
+    uses the plain row loop (which skips/reports rows like before).
+    """
+    if sep == b";":
+        # Decimal commas can only be decimal marks here: fix them in one pass
+        body = body.replace(b",", b".")
+    body = body.strip(b"\n")
+    if not body:
+        return None
+
+    width = body.split(b"\n", 1)[0].count(sep) + 1
+    # A row with a missing or extra field would shift every later field into
+    # the wrong column, so every line must have exactly width fields (the
+    # row loop skips such rows instead)
+    if not _same_field_count(body, sep, width) and b"\n\n" in body:
+        body = b"\n".join(filter(None, body.split(b"\n")))
+    if width < 4 or not _same_field_count(body, sep, width):
+        return None
+
+    fields = body.replace(b"\n", sep).split(sep)
+    try:
+        hours, offsets, is_sorted = parse_timestamps(fields[0::width])
+        consumption, production = _parse_wh_columns(fields[1::width], fields[2::width])
+        return MeasurementStore.from_columns(
+            hours,
+            offsets,
+            consumption,
+            production,
+            array("d", map(float, fields[3::width])),
+            is_sorted,
+        )
+    except ValueError:
+        return None
+
+
+def _same_field_count(body: bytes, sep: bytes, width: int) -> bool:
+    """Whether every line of body has exactly width fields."""
+    # With every other byte deleted, each line must be just its separators
+    layout = body.translate(None, bytes(set(range(256)) - set(sep + b"\n")))
+    return layout + b"\n" == (sep * (width - 1) + b"\n") * (body.count(b"\n") + 1)
+
+
+def _parse_wh_columns(*columns: List[bytes]) -> List[array]:
+    """
+    Parse kWh fields (dot decimals) to int64 Wh columns.
+
+    Meter readings repeat, so each distinct field is parsed only once.
+    When they all have exactly three decimals (the usual meter export)
+    their digits are read as fixed-point integers in one pass; otherwise
+    each goes through parse_wh().
+    """
+    distinct = list(set().union(*columns))
+    joined = b"\n".join(distinct)
+    if WH_FIELDS_RE.fullmatch(joined):
+        values = map(int, joined.replace(b".", b"").split(b"\n"))
+    else:
+        values = (parse_wh(field.decode("ascii")) for field in distinct)
+    wh = dict(zip(distinct, values)).__getitem__
+    return [array("q", map(wh, column)) for column in columns]
+
+
+def parse_body(body: bytes, sep: str, fast: bool = True) -> MeasurementStore:
+    """Parse data rows (the file without its header line), see parse_data."""
+    if fast:
+        store = _read_columns_fast(body, sep.encode("ascii"))
+        if store is not None:
+            return store
+
+    hours: List[int] = []
+    offsets: List[int] = []
+    consumption: List[int] = []
+    production: List[int] = []
+    temperature: List[float] = []
+    wh = FieldCache(parse_wh)
+    degrees = FieldCache(parse_float)
+    zones = FieldCache(_offset_minutes)
+    for line in body.decode("utf-8").splitlines():
+        line = line.strip()
+        if not line:
+            continue
+
+        parts = line.split(sep)
+
+        # We expect at least 4 columns
+        if len(parts) < 4:
+            continue
+
+        ts = datetime.fromisoformat(parts[0].strip())
+        hours.append((ts.toordinal() - EPOCH_ORDINAL) * 24 + ts.hour)
+        offsets.append(zones[ts.tzinfo])
+        consumption.append(wh[parts[1]])
+        production.append(wh[parts[2]])
+        temperature.append(degrees[parts[3]])
+
+    return MeasurementStore.from_columns(
+        array("q", hours),
+        array("h", offsets),
+        array("q", consumption),
+        array("q", production),
+        array("d", temperature),
+    )
+
+
+def _offset_minutes(tz: tzinfo | None) -> int:
+    """UTC offset of a fixed-offset timezone in minutes (NO_OFFSET for naive times)."""
+    return NO_OFFSET if tz is None else int(tz.utcoffset(None).total_seconds()) // 60
+
+
+def parse_data(raw: bytes, fast: bool = True) -> MeasurementStore:
     """
-    Reads CSV file and returns hourly measurements.
+    Parse the CSV file contents and return hourly measurements in columnar form.
 
     Expected columns:
     - timestamp (ISO like 2025-10-13T00:00:00)
     - consumption (net) kWh
     - production (net) kWh
     - temperature (daily avg or hourly, depending on file)
+
+    With fast=True (default) the data is parsed column-wise from the raw
+    bytes, see parse_timestamps(); fast=False always uses the row loop.
     """
-    rows: List[Measurement] = []
+    if not raw:
+        return MeasurementStore()
+
+    header, _, body = raw.partition(b"\n")
 
-    with open(filename, "r", encoding="utf-8") as f:
+    # Detect separator: ; or ,
+    sep = ";" if b";" in header else ","
+
+    return parse_body(body, sep, fast)
+
+
+def _parse_byte_range(filename: str, start: int, end: int, sep: str, fast: bool) -> MeasurementStore:
+    """Worker: parse the rows in bytes [start, end) of the file."""
+    with open(filename, "rb") as f:
+        f.seek(start)
+        body = f.read(end - start)
+    return parse_body(body, sep, fast)
+
+
+def split_byte_ranges(filename: str, parts: int) -> Tuple[str, List[Tuple[int, int]]]:
+    """
+    Split the data rows of a file into about equal, newline-aligned ranges.
+
+    Returns:
+        (separator, [(start, end), ...]) with the header line excluded
+    """
+    with open(filename, "rb") as f:
         header = f.readline()
-        if not header:
-            return rows
+        sep = ";" if b";" in header else ","
+        first = f.tell()
+        size = os.fstat(f.fileno()).st_size
+
+        bounds = [first]
+        step = max(1, (size - first) // max(1, parts))
+        for k in range(1, parts):
+            f.seek(max(first + k * step, bounds[-1]))
+            f.readline()  # move to the start of the next full line
+            pos = min(f.tell(), size)
+            if pos > bounds[-1]:
+                bounds.append(pos)
+        if bounds[-1] < size:
+            bounds.append(size)
+
+    return sep, list(zip(bounds, bounds[1:]))
+
+
+def merge_stores(parts: List[MeasurementStore]) -> MeasurementStore:
+    """Concatenate stores parsed from consecutive pieces of one file."""
+    merged = MeasurementStore()
+    for part in parts:
+        if len(part) == 0:
+            continue
+        if merged.hours and part.hours[0] < merged.hours[-1]:
+            merged.is_sorted = False
+        merged.is_sorted = merged.is_sorted and part.is_sorted
+        merged.hours.extend(part.hours)
+        merged.offsets.extend(part.offsets)
+        merged.consumption.extend(part.consumption)
+        merged.production.extend(part.production)
+        merged.temperature.extend(part.temperature)
+    return merged
+
+
+def read_data(filename: str, fast: bool = True, workers: int = 1) -> MeasurementStore:
+    """
+    Read a CSV file and return hourly measurements (see parse_data).
 
-        # Detect separator: ; or ,
-        sep = ";" if ";" in header else ","
+    With workers > 1 the file is split into newline-aligned byte ranges
+    that are parsed in a process pool. The pieces are joined back in file
+    order, so the result is exactly the same as a serial read. A columnar
+    archive (.hcol) is read with load_archive().
+    """
+    if filename.endswith(ARCHIVE_SUFFIX):
+        return load_archive(filename)
+    if workers > 1:
+        sep, ranges = split_byte_ranges(filename, workers)
+        if len(ranges) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parts = list(pool.map(
+                    _parse_byte_range,
+                    [filename] * len(ranges),
+                    [start for start, _ in ranges],
+                    [end for _, end in ranges],
+                    [sep] * len(ranges),
+                    [fast] * len(ranges),
+                ))
+            return merge_stores(parts)
+
+    with open(filename, "rb") as f:
+        raw = f.read()
+    return parse_data(raw, fast)
+
+
+def iter_day_chunks(filename: str, chunk_bytes: int = LOAD_CHUNK_BYTES) -> Iterator[MeasurementStore]:
+    """
+    Parse a CSV file piece by piece, yielding stores that hold whole days.
 
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
+    The rows of the last (possibly unfinished) day of each piece are
+    carried over to the next one, so no day is split between two stores.
+    Once the rows turn out not to be in time order, everything is carried
+    to the end and yielded as one store.
+    """
+    size = os.path.getsize(filename)
+    sep, ranges = split_byte_ranges(filename, max(1, size // chunk_bytes))
 
-            parts = line.split(sep)
+    carry = MeasurementStore()
+    for start, end in ranges:
+        store = merge_stores([carry, _parse_byte_range(filename, start, end, sep, True)])
+        cut = 0
+        if store.is_sorted and len(store):
+            cut = bisect_left(store.hours, store.hours[-1] // 24 * 24)
+        if cut:
+            yield store.slice(0, cut)
+            carry = store.slice(cut, len(store))
+        else:
+            carry = store
 
-            # We expect at least 4 columns
-            if len(parts) < 4:
-                continue
+    if len(carry):
+        yield carry
+
+
+def _archive_value_names(reader: ArchiveReader) -> List[str]:
+    """Names of the consumption, production and temperature columns of an archive."""
+    names = [name for name in reader.names if name != OFFSET_COLUMN]
+    if len(names) < 3:
+        raise ValueError(f"{reader.filename}: expected consumption, production and temperature columns")
+    return names[:3]
+
+
+def _fixed_to_wh(value: int, scale: int) -> int:
+    """Convert a fixed-point kWh value (kWh * scale) to whole Wh, rounding half up."""
+    return (value * 1000 + scale // 2) // scale
+
+
+def _wh_from_fixed(values: array, scale: int) -> array:
+    """Convert a fixed-point kWh column to whole Wh."""
+    if scale == 1000:
+        return values
+    if 1000 % scale == 0:
+        return array("q", map(mul, values, repeat(1000 // scale)))
+    return array("q", [_fixed_to_wh(v, scale) for v in values])
+
+
+def load_archive(filename: str, start: date | None = None, end: date | None = None) -> MeasurementStore:
+    """
+    Read measurements from a columnar archive (see shared/columnar.py).
+
+    The first three value columns are consumption and production (kWh)
+    and temperature, as in the CSV. With start/end only the blocks that
+    hold those days are decoded.
+    """
+    reader = ArchiveReader(filename)
+    cons, prod, temp = _archive_value_names(reader)
+    keys, columns = reader.read(
+        None if start is None else date_key(start),
+        None if end is None else date_key(end) + SECONDS_PER_DAY,
+    )
+
+    if OFFSET_COLUMN in columns:
+        offsets = array("h", columns[OFFSET_COLUMN])
+    else:
+        offsets = array("h", [NO_OFFSET]) * len(keys)
+    temp_scale = reader.scales[temp]
+    return MeasurementStore.from_columns(
+        array("q", map(floordiv, keys, repeat(3600))),
+        offsets,
+        _wh_from_fixed(columns[cons], reader.scales[cons]),
+        _wh_from_fixed(columns[prod], reader.scales[prod]),
+        array("d", [v / temp_scale for v in columns[temp]]),
+        is_sorted=True,
+    )
+
+
+def archive_range_totals(reader: ArchiveReader, start: date, end: date) -> Totals:
+    """
+    Totals for [start..end] inclusive straight from an archive's block summaries.
+
+    Only the blocks at the range edges are decoded. The per-day
+    temperature fields (day_temp_sum, day_count) are not filled in.
+    """
+    cons, prod, temp = _archive_value_names(reader)
+    rows, sums = reader.totals(date_key(start), date_key(end) + SECONDS_PER_DAY)
+    return Totals(
+        consumption_wh=_fixed_to_wh(sums[cons], reader.scales[cons]),
+        production_wh=_fixed_to_wh(sums[prod], reader.scales[prod]),
+        temp_sum=sums[temp] / reader.scales[temp],
+        temp_count=rows,
+    )
+
+
+def default_workers(filename: str) -> int:
+    """Number of parse workers worth using for a file (1 for small files)."""
+    if os.path.getsize(filename) < PARALLEL_MIN_BYTES:
+        return 1
+    return os.cpu_count() or 1
+
+
+def _cache_columns(store: MeasurementStore) -> List[array]:
+    """Columns in the order they are stored in the cache file."""
+    return [store.hours, store.consumption, store.production, store.temperature, store.offsets]
+
+
+def read_cache(cache_name: str, size: int, mtime_ns: int, digest: bytes | None = None) -> MeasurementStore | None:
+    """
+    Load measurements from a binary cache file.
+
+    The cache is used only if it was written from a source file with the
+    same size and mtime, or (when digest is given) the same sha256.
+    Returns None when the cache is missing, stale or damaged.
+    """
+    try:
+        with open(cache_name, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if len(mm) < CACHE_HEADER.size:
+                return None
+            magic, version, little, is_sorted, c_size, c_mtime, c_digest, rows = \
+                CACHE_HEADER.unpack_from(mm, 0)
+            if magic != CACHE_MAGIC or version != CACHE_VERSION:
+                return None
+            if little != (sys.byteorder == "little"):
+                return None
+            if (c_size, c_mtime) != (size, mtime_ns) and c_digest != digest:
+                return None
+
+            store = MeasurementStore()
+            pos = CACHE_HEADER.size
+            for col in _cache_columns(store):
+                end = pos + rows * col.itemsize
+                if end > len(mm):
+                    return None
+                col.frombytes(mm[pos:end])
+                pos = end
+            store.is_sorted = bool(is_sorted)
+            return store
+    except (OSError, ValueError):
+        return None
+
+
+def write_cache(cache_name: str, store: MeasurementStore, size: int, mtime_ns: int, digest: bytes) -> None:
+    """
+    Write measurements to a binary cache file.
+
+    Each column is stored as fixed-width native values after a small
+    header. The file is written to a temporary name and then renamed, so
+    readers never see a half-written cache.
+    """
+    with atomic_write(cache_name, "wb", fsync=True) as f:
+        f.write(CACHE_HEADER.pack(
+            CACHE_MAGIC,
+            CACHE_VERSION,
+            sys.byteorder == "little",
+            store.is_sorted,
+            size,
+            mtime_ns,
+            digest,
+            len(store),
+        ))
+        for col in _cache_columns(store):
+            col.tofile(f)
+
+
+def load_data(filename: str, use_cache: bool = True, workers: int | None = None) -> MeasurementStore:
+    """
+    Return the measurements of a CSV file, using the binary cache when valid.
+
+    The CSV is always the source of truth: the cache sidecar is rebuilt
+    automatically when the file's size, mtime or contents change. A cache
+    that cannot be written (e.g. read-only folder) is simply skipped.
+    workers=None picks parallel parsing for big files, see default_workers.
+    Columnar archives are already binary and are read without a cache.
+    """
+    if filename.endswith(ARCHIVE_SUFFIX):
+        return load_archive(filename)
+    if workers is None:
+        workers = default_workers(filename)
+    if not use_cache:
+        return read_data(filename, workers=workers)
+
+    cache_name = filename + CACHE_SUFFIX
+    st = os.stat(filename)
+    store = read_cache(cache_name, st.st_size, st.st_mtime_ns)
+    if store is not None:
+        return store
+
+    with open(filename, "rb") as f:
+        raw = f.read()
+        st = os.fstat(f.fileno())
+    digest = hashlib.sha256(raw).digest()
+
+    # Same contents with a new mtime (e.g. copied or touched): reuse the
+    # cached columns, but rewrite the header with the new file details
+    store = read_cache(cache_name, st.st_size, st.st_mtime_ns, digest)
+    if store is None:
+        if workers > 1:
+            del raw
+            store = read_data(filename, workers=workers)
+        else:
+            store = parse_data(raw)
+
+    try:
+        write_cache(cache_name, store, st.st_size, st.st_mtime_ns, digest)
+    except OSError:
+        pass
+    return store
+
+
+def build_daily_index(store: MeasurementStore) -> Dict[date, List[Tuple[int, int]]]:
+    """
+    Group rows by day.
+
+    Returns:
+        dict mapping date -> list of (start, stop) row slices for that day
+        (one slice per contiguous run, so normally exactly one)
+    """
+    daily: Dict[date, List[Tuple[int, int]]] = {}
+    hours = store.hours
+    n = len(hours)
+
+    start = 0
+    while start < n:
+        day = hours[start] // 24
+        if store.is_sorted:
+            # Rows are in time order, so the day ends where the next day begins
+            stop = bisect_left(hours, (day + 1) * 24, start)
+        else:
+            stop = start + 1
+            while stop < n and hours[stop] // 24 == day:
+                stop += 1
+        d = date.fromordinal(EPOCH_ORDINAL + day)
+        daily.setdefault(d, []).append((start, stop))
+        start = stop
 
-            ts = datetime.fromisoformat(parts[0].strip())
-            consumption = parse_float(parts[1])
-            production = parse_float(parts[2])
-            temperature = parse_float(parts[3])
-
-            rows.append(
-                Measurement(
-                    ts=ts,
-                    consumption_kwh=consumption,
-                    production_kwh=production,
-                    temperature_c=temperature,
-                )
-            )
-
-    return rows
-
-
-def build_daily_index(data: List[Measurement]) -> Dict[date, List[Measurement]]:
-    """Group measurements by day."""
-    daily: Dict[date, List[Measurement]] = {}
-    for m in data:
-        d = m.ts.date()
-        daily.setdefault(d, []).append(m)
     return daily
 
 
-def show_main_menu() -> str:
+class RollupCube:
+    """
+    Pre-aggregated cells over hour-of-day x day x month.
+
+    Built in one pass when the data is loaded. Each cell holds count, sum,
+    min and max of consumption, production and temperature:
+    - days[date]                 one cell per day
+    - hours[(year, month)][h]    one cell per hour of day (0-23) per month
+    - months[(year, month)], years[year]
+    - peak_days[(year, month)]   the month's days, highest hourly
+                                 consumption first (for top-N hour queries)
+
+    Reports (and new ones like hourly load profiles) are answered from
+    these cells without touching the raw measurements again.
+    """
+
+    def __init__(self, store: MeasurementStore) -> None:
+        self.days: Dict[date, Cell] = {}
+        self.hours: Dict[Tuple[int, int], List[Cell]] = {}
+        self.months: Dict[Tuple[int, int], Cell] = {}
+        self.years: Dict[int, Cell] = {}
+        self.peak_days: Dict[Tuple[int, int], List[date]] = {}
+
+        # Row ranges per month, collected from the per-day slices
+        month_rows: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+        daily = build_daily_index(store)
+        self.day_rows = daily
+
+        for d in sorted(daily):
+            ranges = daily[d]
+            cell = Cell.of(store, *ranges[0])
+            for start, stop in ranges[1:]:
+                cell = cell + Cell.of(store, start, stop)
+            self.days[d] = cell
+            month_rows.setdefault((d.year, d.month), []).extend(ranges)
+            self.peak_days.setdefault((d.year, d.month), []).append(d)
+
+        for month_days in self.peak_days.values():
+            month_days.sort(key=lambda d: self.days[d].consumption_max, reverse=True)
+
+        # Months are reduced from their own row ranges (normally one
+        # slice), not by adding up ~30 day cells
+        for key, ranges in month_rows.items():
+            month = Cell()
+            cells = [Cell()] * 24
+            for start, stop in _merge_ranges(ranges):
+                month = month + Cell.of(store, start, stop)
+                _add_hour_cells(cells, store, start, stop)
+            self.months[key] = month
+            self.hours[key] = cells
+            self.years[key[0]] = self.years.get(key[0], Cell()) + month
+
+    def day_totals(self) -> Dict[date, Totals]:
+        """Per-day Totals, including the day's average temperature."""
+        result: Dict[date, Totals] = {}
+        for d, cell in self.days.items():
+            totals = cell.totals()
+            if cell.count:
+                totals = totals + Totals(day_temp_sum=cell.avg_temperature(), day_count=1)
+            result[d] = totals
+        return result
+
+
+def _merge_ranges(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Join touching (start, stop) row ranges."""
+    merged: List[Tuple[int, int]] = []
+    for start, stop in sorted(ranges):
+        if merged and merged[-1][1] == start:
+            merged[-1] = (merged[-1][0], stop)
+        else:
+            merged.append((start, stop))
+    return merged
+
+
+def _add_hour_cells(cells: List[Cell], store: MeasurementStore, start: int, stop: int) -> None:
+    """
+    Add rows [start, stop) to the 24 hour-of-day cells.
+
+    A run of strictly consecutive hours is reduced with 24 strided slices
+    (every 24th row has the same hour of day). Runs with a gap or a
+    repeated hour (DST changes) are split in half until they are regular.
+    """
+    n = stop - start
+    if n <= 0:
+        return
+    hours = store.hours
+    first = hours[start]
+
+    if hours[start:stop] == array("q", range(first, first + n)):
+        for k in range(min(24, n)):
+            h = (first + k) % 24
+            cells[h] = cells[h] + Cell.of(store, start + k, stop, 24)
+    elif n == 1:
+        h = first % 24
+        cells[h] = cells[h] + Cell.of(store, start, stop)
+    else:
+        middle = start + n // 2
+        _add_hour_cells(cells, store, start, middle)
+        _add_hour_cells(cells, store, middle, stop)
+
+
+class RangeIndex:
+    """
+    Cumulative (prefix) sums per day.
+
+    Built once from the per-day totals; any [start..end] query is then two
+    binary searches and one subtraction instead of a scan over all rows.
+    """
+
+    def __init__(self, day_totals: Dict[date, Totals]) -> None:
+        self.days: List[date] = sorted(day_totals.keys())
+        # prefix[i] holds the totals of days[0..i-1]
+        self.prefix: List[Totals] = [Totals()]
+
+        running = Totals()
+        for d in self.days:
+            running = running + day_totals[d]
+            self.prefix.append(running)
+
+    def day_totals(self, i: int) -> Totals:
+        """Return the totals of days[i]."""
+        return self.prefix[i + 1] - self.prefix[i]
+
+    def query(self, start: date, end: date) -> Totals:
+        """Return totals for [start..end] inclusive in O(log n)."""
+        i = bisect_left(self.days, start)
+        j = bisect_right(self.days, end)
+        if j <= i:
+            return Totals()
+        return self.prefix[j] - self.prefix[i]
+
+
+class ReportSession:
+    """
+    Loaded measurements plus the day/month/year rollups built from them.
+
+    The rollups are built once when the session is created and every
+    report is served from them. Call invalidate() (or replace_data())
+    when the underlying data changes; the rollups are rebuilt on next use.
+    """
+
+    def __init__(self, store: MeasurementStore) -> None:
+        self.store = store
+        self._cube: RollupCube | None = None
+        self._index: RangeIndex | None = None
+        self._months: Dict[Tuple[int, int], Totals] = {}
+        self._years: Dict[int, Totals] = {}
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Build the rollup cube, the day index and the month and year rollups."""
+        cube = RollupCube(self.store)
+        index = RangeIndex(cube.day_totals())
+        months: Dict[Tuple[int, int], Totals] = {}
+        years: Dict[int, Totals] = {}
+
+        for year, month in cube.months:
+            months[(year, month)] = index.query(*month_bounds(year, month))
+        for year in cube.years:
+            years[year] = index.query(date(year, 1, 1), date(year, 12, 31))
+
+        self._cube = cube
+        self._index = index
+        self._months = months
+        self._years = years
+
+    def invalidate(self) -> None:
+        """Drop the rollups; they are rebuilt the next time a report needs them."""
+        self._cube = None
+        self._index = None
+        self._months = {}
+        self._years = {}
+
+    def replace_data(self, store: MeasurementStore) -> None:
+        """Switch to new measurements and invalidate the rollups."""
+        self.store = store
+        self.invalidate()
+
+    @property
+    def index(self) -> RangeIndex:
+        if self._index is None:
+            self.rebuild()
+        return self._index
+
+    @property
+    def cube(self) -> RollupCube:
+        if self._cube is None:
+            self.rebuild()
+        return self._cube
+
+    def range_totals(self, start: date, end: date) -> Totals:
+        """Totals for [start..end] inclusive."""
+        return self.index.query(start, end)
+
+    def month_totals(self, year: int, month: int) -> Totals:
+        """Totals for one calendar month."""
+        if self._index is None:
+            self.rebuild()
+        return self._months.get((year, month), Totals())
+
+    def year_totals(self, year: int) -> Totals:
+        """Totals for one calendar year."""
+        if self._index is None:
+            self.rebuild()
+        return self._years.get(year, Totals())
+
+    def years(self) -> List[int]:
+        """Years that have measurements."""
+        return sorted(self.cube.years)
+
+    def hour_cells(self, year: int, month: int) -> List[Cell]:
+        """The 24 hour-of-day cells of one month."""
+        return self.cube.hours.get((year, month), [Cell()] * 24)
+
+    def peak_hours(self, start: date, end: date, n: int = PEAK_COUNT) -> List[Tuple[datetime, int]]:
+        """
+        The n hours with the highest consumption in [start..end], highest first.
+
+        Days are visited in order of their hourly maximum (merged from the
+        per-month peak_days lists) and their rows are pushed through a
+        bounded heap. The scan stops at the first day whose maximum cannot
+        beat the current n-th value, so only a few days are read.
+        """
+        cube = self.cube
+        days = cube.days
+        consumption = self.store.consumption
+        day_lists = [
+            [d for d in month_days if start <= d <= end]
+            for (year, month), month_days in cube.peak_days.items()
+            if date(year, month, 1) <= end and start <= month_bounds(year, month)[1]
+        ]
+
+        # Min-heap of (wh, -row): on equal wh the earlier hour ranks higher
+        heap: List[Tuple[int, int]] = []
+        for d in heapq.merge(*day_lists, key=lambda d: days[d].consumption_max, reverse=True):
+            if n <= 0 or (len(heap) == n and days[d].consumption_max < heap[0][0]):
+                break
+            for row_start, row_stop in cube.day_rows[d]:
+                for i in range(row_start, row_stop):
+                    item = (consumption[i], -i)
+                    if len(heap) < n:
+                        heapq.heappush(heap, item)
+                    elif item > heap[0]:
+                        heapq.heapreplace(heap, item)
+
+        return [(self.store.timestamp(-i), wh) for wh, i in sorted(heap, reverse=True)]
+
+    def peak_days(self, start: date, end: date, n: int = PEAK_COUNT) -> List[Tuple[date, Totals]]:
+        """The n days with the highest net import (consumption - production) in [start..end]."""
+        index = self.index
+        i = bisect_left(index.days, start)
+        j = bisect_right(index.days, end)
+        cells = self.cube.days
+        top = heapq.nlargest(
+            n,
+            range(i, j),
+            key=lambda k: cells[index.days[k]].consumption_sum - cells[index.days[k]].production_sum,
+        )
+        return [(index.days[k], index.day_totals(k)) for k in top]
+
+    def nbytes(self) -> int:
+        """Approximate memory used by the data and its rollups."""
+        days = len(self._index.days) if self._index is not None else 0
+        return self.store.nbytes() + days * ROLLUP_BYTES_PER_DAY
+
+
+class ReportSource(Protocol):
+    """Anything the reports can be built from (ReportSession or Dataset)."""
+
+    def years(self) -> List[int]: ...
+
+    def range_totals(self, start: date, end: date) -> Totals: ...
+
+    def month_totals(self, year: int, month: int) -> Totals: ...
+
+    def year_totals(self, year: int) -> Totals: ...
+
+    def hour_cells(self, year: int, month: int) -> List[Cell]: ...
+
+    def peak_hours(self, start: date, end: date, n: int = PEAK_COUNT) -> List[Tuple[datetime, int]]: ...
+
+    def peak_days(self, start: date, end: date, n: int = PEAK_COUNT) -> List[Tuple[date, Totals]]: ...
+
+
+class Dataset:
+    """
+    A folder of CSV partitions, one per year (YYYY.csv) or month (YYYY-MM.csv).
+
+    Only the folder listing is read up front. A query loads just the
+    partitions it touches; loaded partitions are kept in an LRU cache
+    that is trimmed to memory_budget bytes, so a long archive can be
+    queried without holding all of it in memory.
+
+    Partitions can also be columnar archives (YYYY.hcol); a CSV with the
+    same name wins. Range totals over an archive that is not loaded are
+    answered from its block summaries without loading it.
+    """
+
+    def __init__(self, folder: str, memory_budget: int = 512 * 1024 * 1024) -> None:
+        self.folder = folder
+        self.memory_budget = memory_budget
+        # (first day, last day, path) per partition, sorted by first day
+        self.partitions: List[Tuple[date, date, str]] = []
+        self._loaded: OrderedDict[str, ReportSession] = OrderedDict()
+        self._loaded_bytes = 0
+        self._archives: Dict[str, ArchiveReader] = {}
+
+        names = set(os.listdir(folder))
+        for name in names:
+            match = PARTITION_RE.match(name)
+            if not match:
+                continue
+            if name.endswith(ARCHIVE_SUFFIX) and name[:-len(ARCHIVE_SUFFIX)] + ".csv" in names:
+                continue
+            year = int(match.group(1))
+            if match.group(2):
+                month = int(match.group(2))
+                first, last = month_bounds(year, month)
+            else:
+                first, last = date(year, 1, 1), date(year, 12, 31)
+            self.partitions.append((first, last, os.path.join(folder, name)))
+        self.partitions.sort()
+
+        if not self.partitions:
+            raise FileNotFoundError(f"No YYYY.csv, YYYY-MM.csv or .hcol files in {folder!r}")
+
+    def years(self) -> List[int]:
+        """Years that have at least one partition."""
+        return sorted({first.year for first, _, _ in self.partitions})
+
+    def session(self, path: str) -> ReportSession:
+        """Return the loaded partition, loading it (and evicting old ones) if needed."""
+        session = self._loaded.get(path)
+        if session is not None:
+            self._loaded.move_to_end(path)
+            return session
+
+        return self.add_session(path, ReportSession(load_data(path)))
+
+    def add_session(self, path: str, session: ReportSession) -> ReportSession:
+        """Keep a loaded partition, evicting old ones if over the memory budget."""
+        self._loaded[path] = session
+        self._loaded_bytes += session.nbytes()
+
+        # Drop least recently used partitions, but always keep the new one
+        while self._loaded_bytes > self.memory_budget and len(self._loaded) > 1:
+            _, old = self._loaded.popitem(last=False)
+            self._loaded_bytes -= old.nbytes()
+        return session
+
+    def sessions_for(self, start: date, end: date, exclude: Tuple[str, ...] = ()) -> List[ReportSession]:
+        """Sessions of all partitions overlapping [start..end] (except the exclude paths)."""
+        return [
+            self.session(path)
+            for first, last, path in self.partitions
+            if first <= end and start <= last and path not in exclude
+        ]
+
+    def range_totals(self, start: date, end: date) -> Totals:
+        """Totals for [start..end] inclusive."""
+        totals = Totals()
+        archived = tuple(
+            path
+            for first, last, path in self.partitions
+            if first <= end and start <= last and path.endswith(ARCHIVE_SUFFIX) and path not in self._loaded
+        )
+        for path in archived:
+            if path not in self._archives:
+                self._archives[path] = ArchiveReader(path)
+            totals = totals + archive_range_totals(self._archives[path], start, end)
+
+        for session in self.sessions_for(start, end, archived):
+            totals = totals + session.range_totals(start, end)
+        return totals
+
+    def month_totals(self, year: int, month: int) -> Totals:
+        """Totals for one calendar month."""
+        if not 1 <= month <= 12:
+            return Totals()
+        first, last = month_bounds(year, month)
+        totals = Totals()
+        for session in self.sessions_for(first, last):
+            totals = totals + session.month_totals(year, month)
+        return totals
+
+    def year_totals(self, year: int) -> Totals:
+        """Totals for one calendar year."""
+        totals = Totals()
+        for session in self.sessions_for(date(year, 1, 1), date(year, 12, 31)):
+            totals = totals + session.year_totals(year)
+        return totals
+
+    def hour_cells(self, year: int, month: int) -> List[Cell]:
+        """The 24 hour-of-day cells of one month."""
+        cells = [Cell()] * 24
+        if not 1 <= month <= 12:
+            return cells
+        first, last = month_bounds(year, month)
+        for session in self.sessions_for(first, last):
+            cells = [a + b for a, b in zip(cells, session.hour_cells(year, month))]
+        return cells
+
+    def peak_hours(self, start: date, end: date, n: int = PEAK_COUNT) -> List[Tuple[datetime, int]]:
+        """The n hours with the highest consumption in [start..end], highest first."""
+        candidates = [p for session in self.sessions_for(start, end) for p in session.peak_hours(start, end, n)]
+        return heapq.nlargest(n, candidates, key=lambda p: p[1])
+
+    def peak_days(self, start: date, end: date, n: int = PEAK_COUNT) -> List[Tuple[date, Totals]]:
+        """The n days with the highest net import in [start..end]."""
+        candidates = [p for session in self.sessions_for(start, end) for p in session.peak_days(start, end, n)]
+        return heapq.nlargest(n, candidates, key=lambda p: p[1].net_import_wh())
+
+
+class LiveDataset(Dataset):
+    """
+    A Dataset whose partitions are loaded on a background thread.
+
+    The menu can start right away. Partitions are loaded newest first
+    until the memory budget is used; a CSV without a valid cache is
+    parsed in day-aligned pieces (see iter_day_chunks), and the days of
+    each piece can be reported on as soon as the piece is indexed. A query
+    waits only while a day it needs is still being loaded; a partition
+    the loader has not reached yet is loaded on demand as in Dataset.
+    """
+
+    def __init__(self, folder: str, memory_budget: int = 512 * 1024 * 1024) -> None:
+        super().__init__(folder, memory_budget)
+        self._cond = threading.Condition()
+        # Partition being loaded: its path, indexed pieces and last complete day
+        self._loading: str | None = None
+        self._pieces: List[ReportSession] = []
+        self._horizon: date | None = None
+        self.files_done = 0
+        self.finished = False
+        self.error: Exception | None = None
+        # Called with a status line while a query waits for data
+        self.on_wait = None
+
+        self._thread = threading.Thread(target=self._load_all, name="task-f-loader", daemon=True)
+        self._thread.start()
+
+    def _load_all(self) -> None:
+        """Worker thread: load partitions newest first."""
+        try:
+            for first, last, path in reversed(self.partitions):
+                with self._cond:
+                    if self._loaded_bytes >= self.memory_budget:
+                        break
+                    if path in self._loaded:
+                        self.files_done += 1
+                        continue
+                    self._loading = path
+                    self._pieces = []
+                    self._horizon = None
+
+                session = ReportSession(self._load_partition(path))
+
+                with self._cond:
+                    if path not in self._loaded:
+                        self.add_session(path, session)
+                    self._loading = None
+                    self._pieces = []
+                    self.files_done += 1
+                    self._cond.notify_all()
+        except Exception as e:
+            with self._cond:
+                self.error = e
+        finally:
+            with self._cond:
+                self._loading = None
+                self._pieces = []
+                self.finished = True
+                self._cond.notify_all()
+
+    def _load_partition(self, path: str) -> MeasurementStore:
+        """Load one partition, publishing the indexed pieces of a big uncached CSV."""
+        if path.endswith(ARCHIVE_SUFFIX):
+            return load_archive(path)
+        st = os.stat(path)
+        store = read_cache(path + CACHE_SUFFIX, st.st_size, st.st_mtime_ns)
+        if store is not None:
+            return store
+        if st.st_size < 2 * LOAD_CHUNK_BYTES:
+            return load_data(path)
+
+        pieces: List[MeasurementStore] = []
+        for piece in iter_day_chunks(path):
+            pieces.append(piece)
+            session = ReportSession(piece)
+            with self._cond:
+                self._pieces.append(session)
+                self._horizon = date.fromordinal(EPOCH_ORDINAL + piece.hours[-1] // 24)
+                self._cond.notify_all()
+        store = merge_stores(pieces)
+
+        try:
+            write_cache(path + CACHE_SUFFIX, store, st.st_size, st.st_mtime_ns, file_digest(path))
+        except OSError:
+            pass
+        return store
+
+    def status(self) -> str:
+        """One line describing the loading progress."""
+        with self._cond:
+            if self.error is not None:
+                return f"Background loading failed: {self.error}"
+            text = f"{self.files_done}/{len(self.partitions)} data files loaded"
+            if self._loading is not None:
+                text += f", loading {os.path.basename(self._loading)}"
+                if self._horizon is not None:
+                    text += f" (ready through {format_date_fi(self._horizon)})"
+            return text
+
+    def session(self, path: str) -> ReportSession:
+        with self._cond:
+            session = self._loaded.get(path)
+            if session is not None:
+                self._loaded.move_to_end(path)
+                return session
+
+        # Load without holding the lock, so the loader thread can go on publishing
+        session = ReportSession(load_data(path))
+        with self._cond:
+            if path in self._loaded:
+                return super().session(path)
+            return self.add_session(path, session)
+
+    def _ready(
+        self, start: date, end: date, exclude: Tuple[str, ...], fetched: Dict[str, ReportSession]
+    ) -> List[ReportSession] | str | None:
+        """
+        Sessions covering [start..end], None while a needed day is loading,
+        or the path of a partition that has to be loaded on demand first.
+        """
+        sessions: List[ReportSession] = []
+        for first, last, path in self.partitions:
+            if not (first <= end and start <= last) or path in exclude:
+                continue
+            if path in fetched:
+                sessions.append(fetched[path])
+            elif path in self._loaded:
+                self._loaded.move_to_end(path)
+                sessions.append(self._loaded[path])
+            elif path != self._loading:
+                return path
+            elif self._horizon is not None and self._horizon >= min(end, last):
+                sessions.extend(self._pieces)
+            else:
+                return None
+        return sessions
+
+    def sessions_for(self, start: date, end: date, exclude: Tuple[str, ...] = ()) -> List[ReportSession]:
+        """Sessions of all partitions overlapping [start..end], waiting for loading days."""
+        # Partitions loaded on demand for this query; kept here even if the
+        # memory budget evicts them before the query has all it needs
+        fetched: Dict[str, ReportSession] = {}
+        shown = None
+        while True:
+            with self._cond:
+                ready = self._ready(start, end, exclude, fetched)
+                if isinstance(ready, list):
+                    return ready
+                if ready is None:
+                    status = self.status()
+                    if self.on_wait is not None and status != shown:
+                        self.on_wait(f"Waiting for data... {status}")
+                        shown = status
+                    self._cond.wait()
+                    continue
+            fetched[ready] = self.session(ready)
+
+
+def open_source(path: str) -> ReportSource:
+    """Open a single CSV file as a ReportSession, or a folder as a Dataset."""
+    if os.path.isdir(path):
+        return Dataset(path)
+    return ReportSession(load_data(path))
+
+
+def show_main_menu(year: int = 2025) -> str:
     """Print main menu and return user selection."""
     print("\nChoose a report type:")
     print("1) Daily summary for a date range")
     print("2) Monthly summary for one month")
-    print("3) Full year 2025 summary")
-    print("4) Exit the program")
-    return input("Select (1-4): ").strip()
+    print(f"3) Full year {year} summary")
+    print("4) Hourly load profile for one month")
+    print("5) Top consumption hours for a date range")
+    print("6) Top net import days for a date range")
+    print(f"7) Consumption vs. temperature for {year}")
+    print("8) Exit the program")
+    return input("Select (1-8): ").strip()
 
 
 def show_next_menu() -> str:
@@ -116,56 +1578,34 @@ def show_next_menu() -> str:
     return input("Select (1-3): ").strip()
 
 
-def compute_range_summary(
-    daily: Dict[date, List[Measurement]],
-    start: date,
-    end: date,
-) -> Tuple[float, float, float]:
-    """
-    Compute totals for [start..end] inclusive.
-
-    Returns:
-        total_consumption_kwh, total_production_kwh, avg_temperature_c
-    """
-    total_cons = 0.0
-    total_prod = 0.0
-    temp_sum = 0.0
-    temp_count = 0
+def daily_report(source: ReportSource, start: date, end: date) -> List[str]:
+    """Build the daily summary report lines for [start..end]."""
+    if end < start:
+        start, end = end, start
 
-    for d, rows in daily.items():
-        if start <= d <= end:
-            for m in rows:
-                total_cons += m.consumption_kwh
-                total_prod += m.production_kwh
-                temp_sum += m.temperature_c
-                temp_count += 1
+    totals = source.range_totals(start, end)
+    total_cons = totals.consumption_wh
+    total_prod = totals.production_wh
+    avg_temp = totals.avg_temperature()
 
-    avg_temp = (temp_sum / temp_count) if temp_count > 0 else 0.0
-    return total_cons, total_prod, avg_temp
+    lines: List[str] = []
+    lines.append("-" * 53)
+    lines.append(f"Report for the period {format_date_fi(start)}–{format_date_fi(end)}")
+    lines.append(f"- Total consumption: {format_kwh(total_cons)} kWh")
+    lines.append(f"- Total production: {format_kwh(total_prod)} kWh")
+    lines.append(f"- Average temperature: {finnish_decimal(avg_temp)} °C")
+    return lines
 
 
-def create_daily_report(data: List[Measurement]) -> List[str]:
+def create_daily_report(source: ReportSource) -> List[str]:
     """Build a daily summary report for a selected date range."""
-    daily = build_daily_index(data)
-
     start_str = input("Enter start date (dd.mm.yyyy): ")
     end_str = input("Enter end date (dd.mm.yyyy): ")
 
     start = parse_date_fi(start_str)
     end = parse_date_fi(end_str)
 
-    if end < start:
-        start, end = end, start
-
-    total_cons, total_prod, avg_temp = compute_range_summary(daily, start, end)
-
-    lines: List[str] = []
-    lines.append("-" * 53)
-    lines.append(f"Report for the period {format_date_fi(start)}–{format_date_fi(end)}")
-    lines.append(f"- Total consumption: {finnish_decimal(total_cons)} kWh")
-    lines.append(f"- Total production: {finnish_decimal(total_prod)} kWh")
-    lines.append(f"- Average temperature: {finnish_decimal(avg_temp)} °C")
-    return lines
+    return daily_report(source, start, end)
 
 
 def month_name(month: int) -> str:
@@ -177,62 +1617,174 @@ def month_name(month: int) -> str:
     return names[month - 1]
 
 
-def create_monthly_report(data: List[Measurement]) -> List[str]:
-    """Build a monthly summary report for a selected month number."""
-    daily = build_daily_index(data)
+def monthly_report(source: ReportSource, month: int, year: int = 2025) -> List[str]:
+    """Build the monthly summary report lines for one month."""
+    # For “average daily temperature for the month”
+    # We compute average temperature per day (avg of all hourly temp values in that day),
+    # then average those daily averages across the month.
+    totals = source.month_totals(year, month)
 
+    total_cons = totals.consumption_wh
+    total_prod = totals.production_wh
+    avg_temp = totals.avg_daily_temperature()
+
+    lines: List[str] = []
+    lines.append("-" * 53)
+    lines.append(f"Report for the month: {month_name(month)}")
+    lines.append(f"- Total consumption: {format_kwh(total_cons)} kWh")
+    lines.append(f"- Total production: {format_kwh(total_prod)} kWh")
+    lines.append(f"- Average temperature: {finnish_decimal(avg_temp)} °C")
+    return lines
+
+
+def create_monthly_report(source: ReportSource, year: int = 2025) -> List[str]:
+    """Build a monthly summary report for a selected month number."""
     month_str = input("Enter month number (1–12): ").strip()
     month = int(month_str)
 
-    total_cons = 0.0
-    total_prod = 0.0
+    return monthly_report(source, month, year)
 
-    # For “average daily temperature for the month”
-    # We compute average temperature per day (avg of all hourly temp values in that day),
-    # then average those daily averages across the month.
-    daily_avgs: List[float] = []
 
-    for d in sorted(daily.keys()):
-        if d.year == 2025 and d.month == month:
-            rows = daily[d]
-            total_cons += sum(m.consumption_kwh for m in rows)
-            total_prod += sum(m.production_kwh for m in rows)
+def yearly_report(source: ReportSource, year: int = 2025) -> List[str]:
+    """Build the full-year summary report lines."""
+    totals = source.year_totals(year)
+
+    total_cons = totals.consumption_wh
+    total_prod = totals.production_wh
+    avg_temp = totals.avg_temperature()
+
+    lines: List[str] = []
+    lines.append(f"Report for the year: {year}")
+    lines.append(f"- Total consumption: {format_kwh(total_cons)} kWh")
+    lines.append(f"- Total production: {format_kwh(total_prod)} kWh")
+    lines.append(f"- Average temperature: {finnish_decimal(avg_temp)} °C")
+    return lines
+
 
-            if rows:
-                day_avg = sum(m.temperature_c for m in rows) / len(rows)
-                daily_avgs.append(day_avg)
+def create_yearly_report(source: ReportSource, year: int = 2025) -> List[str]:
+    """Build a full-year summary report."""
+    return yearly_report(source, year)
 
-    avg_temp = (sum(daily_avgs) / len(daily_avgs)) if daily_avgs else 0.0
+
+def profile_report(source: ReportSource, month: int, year: int = 2025) -> List[str]:
+    """Build the hourly load profile lines (average per hour of day) for one month."""
+    cells = source.hour_cells(year, month)
 
     lines: List[str] = []
     lines.append("-" * 53)
-    lines.append(f"Report for the month: {month_name(month)}")
-    lines.append(f"- Total consumption: {finnish_decimal(total_cons)} kWh")
-    lines.append(f"- Total production: {finnish_decimal(total_prod)} kWh")
-    lines.append(f"- Average temperature: {finnish_decimal(avg_temp)} °C")
+    lines.append(f"Hourly load profile for the month: {month_name(month)}")
+    lines.append("Hour   cons avg  cons min  cons max  prod avg  temp avg")
+    for hour, cell in enumerate(cells):
+        if cell.count == 0:
+            continue
+        lines.append(
+            f"{hour:02d}:00  "
+            f"{finnish_decimal(cell.avg_consumption()):>8}  "
+            f"{format_kwh(cell.consumption_min):>8}  "
+            f"{format_kwh(cell.consumption_max):>8}  "
+            f"{finnish_decimal(cell.avg_production()):>8}  "
+            f"{finnish_decimal(cell.avg_temperature()):>8}"
+        )
+    lines.append("(consumption and production in kWh per hour, temperature in °C)")
     return lines
 
 
-def create_yearly_report(data: List[Measurement]) -> List[str]:
-    """Build a full-year 2025 summary report."""
-    # All values are for 2025.csv, but we still filter by year to follow the rules
-    year_rows = [m for m in data if m.ts.year == 2025]
+def create_profile_report(source: ReportSource, year: int = 2025) -> List[str]:
+    """Build an hourly load profile report for a selected month number."""
+    month_str = input("Enter month number (1–12): ").strip()
+    month = int(month_str)
+
+    return profile_report(source, month, year)
 
-    total_cons = sum(m.consumption_kwh for m in year_rows)
-    total_prod = sum(m.production_kwh for m in year_rows)
 
-    temp_sum = sum(m.temperature_c for m in year_rows)
-    temp_count = len(year_rows)
-    avg_temp = (temp_sum / temp_count) if temp_count > 0 else 0.0
+def regression_report(source: ReportSource, year: int = 2025) -> List[str]:
+    """
+    Build the heating sensitivity report lines: consumption fitted against
+    temperature per month and per hour of day over one year.
+    """
+    month_cells = {month: source.hour_cells(year, month) for month in range(1, 13)}
 
     lines: List[str] = []
-    lines.append("Report for the year: 2025")
-    lines.append(f"- Total consumption: {finnish_decimal(total_cons)} kWh")
-    lines.append(f"- Total production: {finnish_decimal(total_prod)} kWh")
-    lines.append(f"- Average temperature: {finnish_decimal(avg_temp)} °C")
+    lines.append("-" * 53)
+    lines.append(f"Consumption vs. temperature for the year: {year}")
+    lines.append("(consumption kWh = intercept + slope × temperature °C)")
+    lines.append("Month         slope  intercept     R²")
+    for month, cells in month_cells.items():
+        fit = sum(cells, Cell()).fit()
+        if fit.count == 0:
+            continue
+        lines.append(
+            f"{month_name(month):<10} {finnish_slope(fit.slope):>8} "
+            f"{finnish_decimal(fit.intercept):>10} {finnish_decimal(fit.r_squared):>6}"
+        )
+    lines.append("Hour          slope  intercept     R²")
+    for hour in range(24):
+        fit = sum((cells[hour] for cells in month_cells.values()), Cell()).fit()
+        if fit.count == 0:
+            continue
+        lines.append(
+            f"{hour:02d}:00      {finnish_slope(fit.slope):>8} "
+            f"{finnish_decimal(fit.intercept):>10} {finnish_decimal(fit.r_squared):>6}"
+        )
     return lines
 
 
+def create_regression_report(source: ReportSource, year: int = 2025) -> List[str]:
+    """Build the consumption vs. temperature report for the year."""
+    return regression_report(source, year)
+
+
+def peak_hours_report(source: ReportSource, start: date, end: date, n: int = PEAK_COUNT) -> List[str]:
+    """Build the top-N consumption hours report lines for [start..end]."""
+    if end < start:
+        start, end = end, start
+
+    lines: List[str] = []
+    lines.append("-" * 53)
+    lines.append(f"Top {n} consumption hours for the period {format_date_fi(start)}–{format_date_fi(end)}")
+    for rank, (ts, wh) in enumerate(source.peak_hours(start, end, n), start=1):
+        lines.append(f"{rank:>3}. {format_date_fi(ts.date())} {ts.hour:02d}:00  {format_kwh(wh)} kWh")
+    return lines
+
+
+def peak_days_report(source: ReportSource, start: date, end: date, n: int = PEAK_COUNT) -> List[str]:
+    """Build the top-N net import days report lines for [start..end]."""
+    if end < start:
+        start, end = end, start
+
+    lines: List[str] = []
+    lines.append("-" * 53)
+    lines.append(f"Top {n} net import days for the period {format_date_fi(start)}–{format_date_fi(end)}")
+    for rank, (d, totals) in enumerate(source.peak_days(start, end, n), start=1):
+        lines.append(
+            f"{rank:>3}. {format_date_fi(d)}  {format_kwh(totals.net_import_wh())} kWh "
+            f"(consumption {format_kwh(totals.consumption_wh)}, "
+            f"production {format_kwh(totals.production_wh)})"
+        )
+    return lines
+
+
+def read_peak_query() -> Tuple[date, date, int]:
+    """Ask for a date range and the number of rows for a peak report."""
+    start = parse_date_fi(input("Enter start date (dd.mm.yyyy): "))
+    end = parse_date_fi(input("Enter end date (dd.mm.yyyy): "))
+    n_str = input(f"How many rows? (default {PEAK_COUNT}): ").strip()
+    n = int(n_str) if n_str else PEAK_COUNT
+    if n < 1:
+        raise ValueError("The number of rows must be at least 1.")
+    return start, end, n
+
+
+def create_peak_hours_report(source: ReportSource) -> List[str]:
+    """Build a top consumption hours report for a selected date range."""
+    return peak_hours_report(source, *read_peak_query())
+
+
+def create_peak_days_report(source: ReportSource) -> List[str]:
+    """Build a top net import days report for a selected date range."""
+    return peak_days_report(source, *read_peak_query())
+
+
 def print_report_to_console(lines: List[str]) -> None:
     """Print report lines to the console."""
     print()
@@ -248,31 +1800,53 @@ def write_report_to_file(lines: List[str]) -> None:
 
 
 def main() -> None:
-    """Main function: reads data, shows menus, and controls report generation."""
-    data = read_data("2025.csv")
+    """Main function: finds the data, shows menus, and controls report generation."""
+    # Every YYYY.csv / YYYY-MM.csv here is a partition; the menu reports on the latest year.
+    # The data is loaded in the background while the menu is shown
+    dataset = LiveDataset(".")
+    dataset.on_wait = print
+    year = dataset.years()[-1]
     last_report: List[str] = []
 
     while True:
-        choice = show_main_menu()
+        if not dataset.finished:
+            print(f"[{dataset.status()}]")
+        choice = show_main_menu(year)
 
         try:
             if choice == "1":
-                last_report = create_daily_report(data)
+                last_report = create_daily_report(dataset)
                 print_report_to_console(last_report)
 
             elif choice == "2":
-                last_report = create_monthly_report(data)
+                last_report = create_monthly_report(dataset, year)
                 print_report_to_console(last_report)
 
             elif choice == "3":
-                last_report = create_yearly_report(data)
+                last_report = create_yearly_report(dataset, year)
                 print_report_to_console(last_report)
 
             elif choice == "4":
+                last_report = create_profile_report(dataset, year)
+                print_report_to_console(last_report)
+
+            elif choice == "5":
+                last_report = create_peak_hours_report(dataset)
+                print_report_to_console(last_report)
+
+            elif choice == "6":
+                last_report = create_peak_days_report(dataset)
+                print_report_to_console(last_report)
+
+            elif choice == "7":
+                last_report = create_regression_report(dataset, year)
+                print_report_to_console(last_report)
+
+            elif choice == "8":
                 break
 
             else:
-                print("Invalid selection. Please choose 1–4.")
+                print("Invalid selection. Please choose 1–8.")
                 continue
 
         except Exception as e:
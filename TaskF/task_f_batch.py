@@ -0,0 +1,192 @@
+# Copyright (c) 2026 Ismail Hossain
+# License: MIT
+
+"""
+Batch (non-interactive) reporting for TaskF.
+
+The data is loaded once and every report in the query spec file is
+answered from the same ReportSession (or Dataset) rollups, then streamed to the
+output file(s).
+
+Spec file format, one query per line ('#' starts a comment):
+
+    range 01.01.2025 31.01.2025    daily summary for a date range
+    month 3                        monthly summary (year defaults to the
+                                   latest year in the data)
+    month 3 2025
+    year 2025                      full-year summary
+    regression 2025                consumption vs. temperature fits of a year
+    profile 3 [2025]               hourly load profile of a month
+    peakhours 01.01.2025 31.12.2025 [10]
+                                   top consumption hours of a date range
+    peakdays 01.01.2025 31.12.2025 [10]
+                                   top net import days of a date range
+    output march.txt               later reports go to this file ('-' = stdout)
+
+Usage (from the TaskF folder):
+    python3 task_f_batch.py queries.txt [--data 2025.csv] [--output report.txt]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from contextlib import ExitStack
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Iterable, List, TextIO, Tuple
+
+from task_f import (
+    PEAK_COUNT,
+    ReportSource,
+    daily_report,
+    monthly_report,
+    open_source,
+    parse_date_fi,
+    peak_days_report,
+    peak_hours_report,
+    profile_report,
+    regression_report,
+    yearly_report,
+)
+
+
+# Years the date arithmetic of the reports can handle
+MIN_YEAR, MAX_YEAR = 1, 9998
+
+
+@dataclass(frozen=True)
+class Query:
+    """One report request from the spec file (a year of None means the latest year)."""
+    kind: str
+    args: Tuple
+    output: str
+
+
+def parse_year(text: str) -> int:
+    """A year argument, range-checked (ValueError if out of range)."""
+    year = int(text)
+    if not MIN_YEAR <= year <= MAX_YEAR:
+        raise ValueError(f"year must be {MIN_YEAR}-{MAX_YEAR}, got {year}")
+    return year
+
+
+def latest_year(source: ReportSource) -> int:
+    """The last year with data (the current year if there is none)."""
+    years = source.years()
+    return years[-1] if years else date.today().year
+
+
+def parse_spec(lines: Iterable[str], default_output: str = "-") -> List[Query]:
+    """
+    Parse query spec lines into Query objects.
+
+    Raises ValueError with the line number for unknown or malformed lines.
+    """
+    queries: List[Query] = []
+    output = default_output
+
+    for line_no, line in enumerate(lines, start=1):
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+
+        kind, *args = line.split()
+        kind = kind.lower()
+
+        try:
+            if kind == "output" and len(args) == 1:
+                output = args[0]
+            elif kind == "range" and len(args) == 2:
+                queries.append(Query("range", (parse_date_fi(args[0]), parse_date_fi(args[1])), output))
+            elif kind in ("month", "profile") and len(args) in (1, 2):
+                month = int(args[0])
+                year = parse_year(args[1]) if len(args) == 2 else None
+                if not 1 <= month <= 12:
+                    raise ValueError(f"month must be 1-12, got {month}")
+                queries.append(Query(kind, (month, year), output))
+            elif kind in ("peakhours", "peakdays") and len(args) in (2, 3):
+                n = int(args[2]) if len(args) == 3 else PEAK_COUNT
+                if n < 1:
+                    raise ValueError(f"row count must be at least 1, got {n}")
+                queries.append(Query(kind, (parse_date_fi(args[0]), parse_date_fi(args[1]), n), output))
+            elif kind in ("year", "regression") and len(args) == 1:
+                queries.append(Query(kind, (parse_year(args[0]),), output))
+            else:
+                raise ValueError(f"unknown query {line!r}")
+        except ValueError as e:
+            raise ValueError(f"line {line_no}: {e}") from None
+
+    return queries
+
+
+def build_report(source: ReportSource, query: Query) -> List[str]:
+    """Build the report lines for one query."""
+    if query.kind in ("month", "profile", "year", "regression") and query.args[-1] is None:
+        query = Query(query.kind, query.args[:-1] + (latest_year(source),), query.output)
+    if query.kind == "range":
+        return daily_report(source, *query.args)
+    if query.kind == "month":
+        return monthly_report(source, *query.args)
+    if query.kind == "profile":
+        return profile_report(source, *query.args)
+    if query.kind == "peakhours":
+        return peak_hours_report(source, *query.args)
+    if query.kind == "peakdays":
+        return peak_days_report(source, *query.args)
+    if query.kind == "regression":
+        return regression_report(source, *query.args)
+    return yearly_report(source, *query.args)
+
+
+def run_batch(source: ReportSource, queries: List[Query]) -> int:
+    """
+    Write every query's report to its output, in spec order.
+
+    Output files are opened once (overwritten) and reports are written as
+    soon as they are built. Returns the number of reports written.
+    """
+    with ExitStack() as stack:
+        files: Dict[str, TextIO] = {}
+        for query in queries:
+            if query.output not in files:
+                if query.output == "-":
+                    files["-"] = sys.stdout
+                else:
+                    files[query.output] = stack.enter_context(
+                        open(query.output, "w", encoding="utf-8")
+                    )
+
+            out = files[query.output]
+            for line in build_report(source, query):
+                out.write(line + "\n")
+            out.write("\n")
+
+    return len(queries)
+
+
+def main() -> None:
+    """Parse arguments, load the data once and run all queries."""
+    parser = argparse.ArgumentParser(description="Generate TaskF reports from a query spec file.")
+    parser.add_argument("spec", help="query spec file")
+    parser.add_argument(
+        "--data",
+        default="2025.csv",
+        help="hourly CSV file, or a folder of YYYY.csv / YYYY-MM.csv files (default: 2025.csv)",
+    )
+    parser.add_argument("--output", default="-", help="default output file (default: stdout)")
+    args = parser.parse_args()
+
+    with open(args.spec, "r", encoding="utf-8") as f:
+        try:
+            queries = parse_spec(f, args.output)
+        except ValueError as e:
+            parser.error(f"{args.spec}: {e}")
+
+    source = open_source(args.data)
+    count = run_batch(source, queries)
+    print(f"{count} reports written.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+# Copyright (c) 2026 Ismail Hossain
+# License: MIT
+
+"""
+Report server for TaskF.
+
+Loads and indexes the CSV once, then answers report queries over plain
+HTTP on localhost (or a Unix socket). All clients share the same
+in-memory ReportSession (or Dataset), so a query costs a dictionary lookup or a
+prefix-sum subtraction instead of a CSV parse.
+
+Queries (GET, answers are the same text lines as the menu reports):
+
+    /range?start=01.01.2025&end=31.01.2025
+    /month?month=3&year=2025      (year defaults to the latest year in the data)
+    /year?year=2025
+    /regression?year=2025         (consumption vs. temperature fits)
+    /profile?month=3&year=2025    (hourly load profile)
+    /peakhours?start=01.01.2025&end=31.12.2025&n=10
+    /peakdays?start=01.01.2025&end=31.12.2025&n=10
+
+Usage (from the TaskF folder):
+    python3 task_f_server.py [--data 2025.csv] [--port 8765]
+    python3 task_f_server.py --unix /tmp/task_f.sock
+
+Example:
+    curl 'http://127.0.0.1:8765/month?month=3'
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import threading
+from typing import Dict, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from task_f import PEAK_COUNT, ReportSource, open_source, parse_date_fi
+from task_f_batch import Query, build_report, parse_year
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+}
+
+# Upper limit for one request line or header line
+MAX_LINE = 8192
+
+# Largest request body skipped on a kept-alive connection
+MAX_BODY = 64 * 1024
+
+
+def parse_query(target: str) -> Query:
+    """
+    Turn a request target like '/month?month=3' into a Query.
+
+    Raises KeyError for unknown paths and ValueError for bad parameters.
+    """
+    url = urlsplit(target)
+    params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+    path = url.path.rstrip("/")
+
+    if path == "/range":
+        if "start" not in params or "end" not in params:
+            raise ValueError("range needs start and end (dd.mm.yyyy)")
+        return Query("range", (parse_date_fi(params["start"]), parse_date_fi(params["end"])), "-")
+    if path in ("/month", "/profile"):
+        if "month" not in params:
+            raise ValueError(f"{path[1:]} needs month=1..12")
+        month = int(params["month"])
+        if not 1 <= month <= 12:
+            raise ValueError(f"month must be 1-12, got {month}")
+        return Query(path[1:], (month, parse_year(params["year"]) if "year" in params else None), "-")
+    if path in ("/peakhours", "/peakdays"):
+        if "start" not in params or "end" not in params:
+            raise ValueError(f"{path[1:]} needs start and end (dd.mm.yyyy)")
+        n = int(params.get("n", str(PEAK_COUNT)))
+        if n < 1:
+            raise ValueError(f"n must be at least 1, got {n}")
+        return Query(path[1:], (parse_date_fi(params["start"]), parse_date_fi(params["end"]), n), "-")
+    if path in ("/year", "/regression"):
+        return Query(path[1:], (parse_year(params["year"]) if "year" in params else None,), "-")
+
+    raise KeyError(path)
+
+
+def answer(source: ReportSource, method: str, target: str) -> Tuple[int, str]:
+    """Return (status, body) for one request."""
+    if method != "GET":
+        return 405, "Only GET is supported.\n"
+    try:
+        query = parse_query(target)
+    except KeyError:
+        return 404, "Unknown report. Use /range, /month, /year, /profile, /peakhours, /peakdays or /regression.\n"
+    except ValueError as e:
+        return 400, f"Error: {e}\n"
+
+    try:
+        lines = build_report(source, query)
+    except (ValueError, OverflowError) as e:
+        return 400, f"Error: {e}\n"
+    return 200, "\n".join(lines) + "\n"
+
+
+async def read_request(reader: asyncio.StreamReader) -> Tuple[str, str, str, Dict[str, str]] | None:
+    """Read one HTTP request head. Returns None when the client is done."""
+    line = await reader.readline()
+    if not line or len(line) > MAX_LINE:
+        return None
+
+    parts = line.decode("latin-1").split()
+    if len(parts) != 3:
+        return None
+    method, target, version = parts
+
+    headers: Dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if not line or len(line) > MAX_LINE:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    return method, target, version, headers
+
+
+class ReportServer:
+    """Serves reports from one shared report source to many clients."""
+
+    def __init__(self, source: ReportSource) -> None:
+        self.source = source
+        # Report sources are not thread-safe, so reports are built one at a time
+        self._lock = threading.Lock()
+
+    def answer(self, method: str, target: str) -> Tuple[int, str]:
+        """answer() for the shared source, one report at a time."""
+        with self._lock:
+            return answer(self.source, method, target)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one connection (keep-alive until the client stops)."""
+        try:
+            while True:
+                request = await read_request(reader)
+                if request is None:
+                    break
+                method, target, version, headers = request
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = (
+                    connection == "keep-alive"
+                    if version == "HTTP/1.0"
+                    else connection != "close"
+                )
+
+                # No report takes a request body; skip a small one so the next
+                # request starts in the right place, otherwise close afterwards
+                length = headers.get("content-length", "0")
+                if "transfer-encoding" in headers or not length.isdigit() or int(length) > MAX_BODY:
+                    keep_alive = False
+                elif length != "0":
+                    await reader.readexactly(int(length))
+
+                # Building a report on a large dataset takes a while; keep the event loop free
+                status, body = await asyncio.to_thread(self.answer, method, target)
+                data = body.encode("utf-8")
+
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                        "Content-Type: text/plain; charset=utf-8\r\n"
+                        f"Content-Length: {len(data)}\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                        "\r\n"
+                    ).encode("latin-1")
+                    + data
+                )
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(source: ReportSource, host: str, port: int, unix_path: str | None) -> None:
+    """Start the server and run until cancelled."""
+    server = ReportServer(source)
+    if unix_path:
+        srv = await asyncio.start_unix_server(server.handle, path=unix_path)
+        where = unix_path
+    else:
+        srv = await asyncio.start_server(server.handle, host, port)
+        where = f"http://{host}:{port}"
+
+    print(f"Serving TaskF reports on {where} (Ctrl+C to stop)")
+    async with srv:
+        await srv.serve_forever()
+
+
+def main() -> None:
+    """Parse arguments, load and index the data once, then serve."""
+    parser = argparse.ArgumentParser(description="Serve TaskF reports from memory.")
+    parser.add_argument(
+        "--data",
+        default="2025.csv",
+        help="hourly CSV file, or a folder of YYYY.csv / YYYY-MM.csv files (default: 2025.csv)",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port (default: 8765)")
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    args = parser.parse_args()
+
+    source = open_source(args.data)
+    try:
+        asyncio.run(serve(source, args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
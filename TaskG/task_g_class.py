@@ -2,9 +2,15 @@
 # License: MIT
 
 from __future__ import annotations
+import os
+import sys
 from dataclasses import dataclass
 from datetime import datetime, date, time
 
+# The date/time field parser lives in shared/ at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared.datetime_fields import parse_date, parse_datetime, parse_time  # noqa: E402
+
 
 def parse_bool(value: str) -> bool:
     return value.strip().lower() == "true"
@@ -40,13 +46,13 @@ def convert_reservation(parts: list[str]) -> Reservation:
         name=parts[1],
         email=parts[2],
         phone=parts[3],
-        date=datetime.strptime(parts[4], "%Y-%m-%d").date(),
-        time=datetime.strptime(parts[5], "%H:%M").time(),
+        date=parse_date(parts[4]),
+        time=parse_time(parts[5]),
         duration=int(parts[6]),
         price=float(parts[7]),
         confirmed=parse_bool(parts[8]),
         resource=parts[9],
-        created=datetime.strptime(parts[10], "%Y-%m-%d %H:%M:%S"),
+        created=parse_datetime(parts[10]),
     )
 
 
@@ -0,0 +1,259 @@
+# Copyright (c) 2026 Ismail Hossain
+# License: MIT
+
+"""
+Indexed queries over a ReservationTable (task_g_table.py).
+
+ReservationIndex builds its secondary indexes once after loading:
+
+    confirmed     rows of confirmed bookings
+    resource      per resource, its rows sorted by start (date, time)
+    date          all rows sorted by start, with their dates for bisect
+    duration      rows per booked hours
+
+A Query combines optional filters. Its candidate rows come from the most
+selective index that applies (a resource's date range is two bisects), so
+e.g. the confirmed bookings of one resource in one month touch only that
+resource's rows in that month. scan() answers several queries, with their
+rows and confirmed revenue, in one pass over the union of their candidates.
+
+Usage (from the TaskG folder):
+    python3 task_g_query.py
+    python3 task_g_query.py --resource "Red Room" --start 2025-10-01 --end 2025-10-31 --confirmed
+
+With --db PATH the file is imported into a SQLite database once (see
+shared/reservation_store.py) and the report and queries run as indexed
+SQL on later runs, without parsing the file.
+"""
+
+from __future__ import annotations
+import argparse
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import date
+from itertools import compress
+from operator import add, mul
+from typing import Callable, Iterable
+
+from task_g_table import ReservationTable, fetch_reservations, parse_date
+from shared import reservation_store  # shared/ is on sys.path via task_g_table
+
+# Bookings of at least this many hours are "long" (Reservation.is_long)
+LONG_HOURS = 3
+
+
+@dataclass(frozen=True)
+class Query:
+    """Filters of one query; None means no filter. Dates are inclusive."""
+    confirmed: bool | None = None
+    resource: str | None = None
+    start: date | None = None
+    end: date | None = None
+    min_duration: int | None = None
+    max_duration: int | None = None
+
+
+@dataclass
+class QueryResult:
+    """Matching rows (in file order) and the summed total price of the confirmed ones."""
+    rows: list[int] = field(default_factory=list)
+    revenue: float = 0.0
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+class ReservationIndex:
+    """Secondary indexes of one ReservationTable."""
+
+    def __init__(self, table: ReservationTable) -> None:
+        self.table = table
+        n = len(table)
+
+        starts = list(map(add, map(mul, table.dates, [1440] * n), table.times))
+        order = sorted(range(n), key=starts.__getitem__)
+        self.by_start = array("I", order)
+        self.start_dates = array("i", map(table.dates.__getitem__, order))
+
+        self.confirmed_rows = array("I", compress(range(n), table.confirmed))
+
+        self.by_resource: dict[int, tuple[array, array]] = {}
+        for row in order:
+            rows, dates = self.by_resource.setdefault(table.resources[row], (array("I"), array("i")))
+            rows.append(row)
+            dates.append(table.dates[row])
+
+        self.by_duration: dict[int, array] = {}
+        for row, duration in enumerate(table.durations):
+            self.by_duration.setdefault(duration, array("I")).append(row)
+
+    def candidates(self, query: Query) -> Iterable[int] | None:
+        """
+        Rows from the most selective index for the query, or None if no
+        index applies (every row is a candidate).
+        """
+        options: list[tuple[int, Iterable[int]]] = []
+
+        if query.resource is not None:
+            code = self.table.strings.codes.get(query.resource)
+            if code is None or code not in self.by_resource:
+                return ()
+            rows, dates = self.by_resource[code]
+            lo, hi = self._date_bounds(dates, query)
+            options.append((hi - lo, rows[lo:hi]))
+        elif query.start is not None or query.end is not None:
+            lo, hi = self._date_bounds(self.start_dates, query)
+            options.append((hi - lo, self.by_start[lo:hi]))
+
+        if query.confirmed:
+            options.append((len(self.confirmed_rows), self.confirmed_rows))
+
+        if query.min_duration is not None or query.max_duration is not None:
+            low = query.min_duration if query.min_duration is not None else min(self.by_duration, default=0)
+            high = query.max_duration if query.max_duration is not None else max(self.by_duration, default=0)
+            buckets = [self.by_duration[d] for d in self.by_duration if low <= d <= high]
+            options.append((sum(map(len, buckets)), [row for bucket in buckets for row in bucket]))
+
+        if not options:
+            return None
+        return min(options, key=lambda option: option[0])[1]
+
+    @staticmethod
+    def _date_bounds(dates: array, query: Query) -> tuple[int, int]:
+        """Slice of a date-sorted array inside the query's date range."""
+        lo = 0 if query.start is None else bisect_left(dates, query.start.toordinal())
+        hi = len(dates) if query.end is None else bisect_right(dates, query.end.toordinal())
+        return lo, max(lo, hi)
+
+    def predicate(self, query: Query) -> Callable[[int], bool]:
+        """Row test for all filters of the query."""
+        t = self.table
+        code = None if query.resource is None else t.strings.codes.get(query.resource, -1)
+        first = None if query.start is None else query.start.toordinal()
+        last = None if query.end is None else query.end.toordinal()
+
+        def matches(row: int) -> bool:
+            return (
+                (query.confirmed is None or bool(t.confirmed[row]) == query.confirmed)
+                and (code is None or t.resources[row] == code)
+                and (first is None or t.dates[row] >= first)
+                and (last is None or t.dates[row] <= last)
+                and (query.min_duration is None or t.durations[row] >= query.min_duration)
+                and (query.max_duration is None or t.durations[row] <= query.max_duration)
+            )
+
+        return matches
+
+    def select(self, query: Query) -> list[int]:
+        """Matching rows in file order."""
+        return self.scan({"": query})[""].rows
+
+    def scan(self, queries: dict[str, Query]) -> dict[str, QueryResult]:
+        """
+        Answer several queries in one pass.
+
+        The rows visited are the union of the queries' candidates (all rows
+        if one of them has no usable index), in file order, so the revenue
+        sums add up in the same order as a plain loop over the file.
+        """
+        results = {name: QueryResult() for name in queries}
+        tests = [(self.predicate(query), results[name]) for name, query in queries.items()]
+
+        rows: Iterable[int] = set()
+        for query in queries.values():
+            found = self.candidates(query)
+            if found is None:
+                rows = range(len(self.table))
+                break
+            rows.update(found)
+        else:
+            rows = sorted(rows)
+
+        t = self.table
+        for row in rows:
+            for matches, result in tests:
+                if matches(row):
+                    result.rows.append(row)
+                    if t.confirmed[row]:
+                        result.revenue += t.durations[row] * t.prices[row]
+
+        return results
+
+
+def print_report(table: ReservationTable, index: ReservationIndex) -> None:
+    """The TaskG report (confirmed list, long bookings, confirmed revenue) from one scan."""
+    results = index.scan({
+        "confirmed": Query(confirmed=True),
+        "long": Query(min_duration=LONG_HOURS),
+    })
+
+    print("Confirmed reservations:")
+    for row in results["confirmed"].rows:
+        r = table[row]
+        print(
+            f"- {r.name}, {r.resource}, "
+            f"{r.date.strftime('%d.%m.%Y')} at {r.time.strftime('%H.%M')}"
+        )
+
+    print("\nLong reservations (duration >= 3h):")
+    for row in results["long"].rows:
+        r = table[row]
+        print(f"- {r.name} ({r.duration}h), total {r.total_price():.2f} €")
+
+    print(f"\nTotal revenue (confirmed): {results['confirmed'].revenue:.2f} €")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="TaskG reservation report and queries.")
+    parser.add_argument("--file", default="reservations.txt", help="reservations file (default: reservations.txt)")
+    parser.add_argument("--resource", help="only this resource")
+    parser.add_argument("--start", type=parse_date, help="first date, YYYY-MM-DD")
+    parser.add_argument("--end", type=parse_date, help="last date, YYYY-MM-DD")
+    parser.add_argument("--confirmed", action="store_true", help="only confirmed bookings")
+    parser.add_argument("--min-hours", type=int, help="only bookings of at least this many hours")
+    parser.add_argument("--db", metavar="PATH", help="use (and fill) this SQLite database instead of parsing the file")
+    args = parser.parse_args()
+
+    query = Query(
+        confirmed=True if args.confirmed else None,
+        resource=args.resource,
+        start=args.start,
+        end=args.end,
+        min_duration=args.min_hours,
+    )
+
+    if args.db:
+        conn, source = reservation_store.open_file(args.db, args.file, "taskg")
+        if query == Query():
+            reservation_store.print_report(conn, source)
+        else:
+            print_matches(list(reservation_store.find_reservations(conn, source, **vars(query))))
+        conn.close()
+        return
+
+    table = fetch_reservations(args.file)
+    index = ReservationIndex(table)
+    if query == Query():
+        print_report(table, index)
+        return
+
+    result = index.scan({"query": query})["query"]
+    print_matches([table[row] for row in result.rows])
+
+
+def print_matches(reservations: list) -> None:
+    """One line per matching reservation, then the count and confirmed revenue."""
+    revenue = 0.0
+    for r in reservations:
+        print(
+            f"- {r.reservation_id} {r.name}, {r.resource}, {r.date.strftime('%d.%m.%Y')} "
+            f"at {r.time.strftime('%H.%M')} ({r.duration}h, {'confirmed' if r.confirmed else 'not confirmed'})"
+        )
+        if r.confirmed:
+            revenue += r.total_price()
+    print(f"\n{len(reservations)} reservations, confirmed revenue {revenue:.2f} €")
+
+
+if __name__ == "__main__":
+    main()
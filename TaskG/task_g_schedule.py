@@ -0,0 +1,214 @@
+# Copyright (c) 2026 Ismail Hossain
+# License: MIT
+
+"""
+Per-resource booking intervals for conflict checks and free-slot search.
+
+Times are minutes on one timeline (day ordinal * 1440 + minutes from
+midnight); a booking covers [start, start + duration * 60). For each
+resource the bookings are kept sorted by start (from ReservationIndex)
+with:
+
+    reach     running maximum of the end times, so "does [s, e) overlap a
+              booking" is one bisect: the last booking starting before e
+              overlaps iff reach at that position is after s
+    blocks    the union of the bookings as sorted, disjoint busy blocks
+    gaps      a max tree over the free gaps between blocks, so the first
+              gap of at least N hours after a time is found in O(log n)
+
+conflicts() lists every overlapping pair with one sweep per resource
+(O(n log n + number of conflicts)).
+
+Usage (from the TaskG folder):
+    python3 task_g_schedule.py
+    python3 task_g_schedule.py --free "Red Room" --after "2025-10-22 15:00" --hours 2
+"""
+
+from __future__ import annotations
+import argparse
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from itertools import accumulate
+
+from task_g_query import ReservationIndex
+from task_g_table import ReservationTable, fetch_reservations
+
+MINUTES_PER_DAY = 1440
+
+
+def to_minutes(moment: datetime) -> int:
+    """Timeline minute of a datetime (seconds are ignored)."""
+    return moment.toordinal() * MINUTES_PER_DAY + moment.hour * 60 + moment.minute
+
+
+def from_minutes(minutes: int) -> datetime:
+    day, minute = divmod(minutes, MINUTES_PER_DAY)
+    return datetime.fromordinal(day) + timedelta(minutes=minute)
+
+
+class MaxTree:
+    """Maximum over array positions, with 'first position >= i holding >= x'."""
+
+    __slots__ = ("size", "tree")
+
+    def __init__(self, values: list[int]) -> None:
+        size = 1
+        while size < max(1, len(values)):
+            size *= 2
+        tree = [-1] * (2 * size)
+        tree[size:size + len(values)] = values
+        for i in range(size - 1, 0, -1):
+            tree[i] = max(tree[2 * i], tree[2 * i + 1])
+        self.size = size
+        self.tree = tree
+
+    def first_at_least(self, start: int, value: int) -> int:
+        """Smallest position >= start with a value >= value, or -1."""
+        if start >= self.size:
+            return -1
+        tree = self.tree
+        i = start + self.size
+        # Climb until a node to the right of start holds a big enough value
+        while tree[i] < value:
+            while i & 1:
+                i >>= 1
+            i += 1
+            if i & (i - 1) == 0:
+                return -1  # walked off the right edge
+        while i < self.size:
+            i = 2 * i if tree[2 * i] >= value else 2 * i + 1
+        return i - self.size
+
+
+class ResourceSchedule:
+    """Bookings of one resource, sorted by start."""
+
+    def __init__(self, rows: array, starts: list[int], ends: list[int]) -> None:
+        self.rows = rows
+        self.starts = array("q", starts)
+        self.ends = array("q", ends)
+        self.reach = array("q", accumulate(ends, max))
+
+        block_starts: list[int] = []
+        block_ends: list[int] = []
+        for start, end in zip(starts, ends):
+            if block_ends and start <= block_ends[-1]:
+                block_ends[-1] = max(block_ends[-1], end)
+            else:
+                block_starts.append(start)
+                block_ends.append(end)
+        self.block_starts = array("q", block_starts)
+        self.block_ends = array("q", block_ends)
+        # gap i lies between block i and block i + 1
+        self.gaps = MaxTree([s - e for s, e in zip(block_starts[1:], block_ends)])
+
+    def overlapping(self, start: int, end: int) -> list[int]:
+        """Rows of the bookings overlapping [start, end)."""
+        found: list[int] = []
+        i = bisect_left(self.starts, end) - 1
+        while i >= 0 and self.reach[i] > start:
+            if self.ends[i] > start:
+                found.append(self.rows[i])
+            i -= 1
+        found.reverse()
+        return found
+
+    def first_free(self, after: int, length: int) -> int:
+        """Earliest start >= after of a free stretch of length minutes."""
+        k = bisect_right(self.block_starts, after) - 1
+        if k >= 0 and self.block_ends[k] > after:
+            gap = k  # inside block k: the first chance is where it ends
+        else:
+            following = k + 1
+            if following == len(self.block_starts) or self.block_starts[following] - after >= length:
+                return after
+            gap = following
+
+        i = self.gaps.first_at_least(gap, length)
+        if i == -1 or i >= len(self.block_starts) - 1:
+            return self.block_ends[-1]
+        return self.block_ends[i]
+
+    def conflicts(self) -> list[tuple[int, int]]:
+        """Overlapping (earlier row, later row) pairs, by start."""
+        pairs: list[tuple[int, int]] = []
+        active: list[tuple[int, int]] = []  # (end, position) heap
+        for position, (start, end) in enumerate(zip(self.starts, self.ends)):
+            while active and active[0][0] <= start:
+                heapq.heappop(active)
+            for _, other in sorted(active, key=lambda item: item[1]):
+                pairs.append((self.rows[other], self.rows[position]))
+            heapq.heappush(active, (end, position))
+        return pairs
+
+
+class ScheduleIndex:
+    """ResourceSchedule of every resource of a table."""
+
+    def __init__(self, index: ReservationIndex) -> None:
+        table = index.table
+        self.table: ReservationTable = table
+        self.resources: dict[str, ResourceSchedule] = {}
+        for code, (rows, _) in index.by_resource.items():
+            starts = [table.dates[row] * MINUTES_PER_DAY + table.times[row] for row in rows]
+            ends = [start + table.durations[row] * 60 for start, row in zip(starts, rows)]
+            self.resources[table.strings.values[code]] = ResourceSchedule(rows, starts, ends)
+
+    def conflicts(self) -> dict[str, list[tuple[int, int]]]:
+        """Overlapping booking pairs per resource (only resources that have some)."""
+        found = {name: schedule.conflicts() for name, schedule in sorted(self.resources.items())}
+        return {name: pairs for name, pairs in found.items() if pairs}
+
+    def overlapping(self, resource: str, start: datetime, hours: int) -> list[int]:
+        """Rows of the bookings a new booking of the resource would overlap."""
+        schedule = self.resources.get(resource)
+        if schedule is None:
+            return []
+        first = to_minutes(start)
+        return schedule.overlapping(first, first + hours * 60)
+
+    def first_free_slot(self, resource: str, after: datetime, hours: int) -> datetime:
+        """Start of the first free stretch of hours for the resource at or after a time."""
+        if hours < 1:
+            raise ValueError(f"hours must be at least 1, got {hours}")
+        schedule = self.resources.get(resource)
+        if schedule is None:
+            return after
+        return from_minutes(schedule.first_free(to_minutes(after), hours * 60))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="TaskG booking conflicts and free slots.")
+    parser.add_argument("--file", default="reservations.txt", help="reservations file (default: reservations.txt)")
+    parser.add_argument("--free", metavar="RESOURCE", help="find a free slot for this resource")
+    parser.add_argument(
+        "--after",
+        type=lambda value: datetime.strptime(value, "%Y-%m-%d %H:%M"),
+        help="earliest start, 'YYYY-MM-DD HH:MM' (default: now)",
+    )
+    parser.add_argument("--hours", type=int, default=1, help="length of the free slot (default: 1)")
+    args = parser.parse_args()
+
+    table = fetch_reservations(args.file)
+    schedule = ScheduleIndex(ReservationIndex(table))
+
+    if args.free:
+        after = args.after or datetime.now().replace(second=0, microsecond=0)
+        slot = schedule.first_free_slot(args.free, after, args.hours)
+        print(f"First free {args.hours}h slot for {args.free}: {slot.strftime('%d.%m.%Y at %H.%M')}")
+        return
+
+    conflicts = schedule.conflicts()
+    if not conflicts:
+        print("No conflicting reservations.")
+        return
+    print("Conflicting reservations:")
+    for resource, pairs in conflicts.items():
+        for a, b in pairs:
+            print(f"- {resource}: {table[a].reservation_id} and {table[b].reservation_id}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+# Copyright (c) 2026 Ismail Hossain
+# License: MIT
+
+"""
+Columnar version of TaskG for large reservation files.
+
+Instead of one dict or object per reservation, ReservationTable keeps one
+compact array per field:
+
+    dates     day ordinals (date.toordinal())
+    times     minutes from midnight
+    created   seconds since 1970-01-01 (local time)
+    text      codes into a StringPool, so a resource, name, email or phone
+              that repeats is stored once
+
+table[i] gives a small slotted Reservation view with the same fields and
+is_confirmed() / is_long() / total_price() as task_g_class.py.
+"""
+
+from __future__ import annotations
+import os
+import sys
+from array import array
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Iterator
+
+# The date/time field parser lives in shared/ at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared.datetime_fields import parse_date, parse_datetime, parse_time  # noqa: E402
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def parse_bool(value: str) -> bool:
+    return value.strip().lower() == "true"
+
+
+class StringPool:
+    """Each distinct string once; rows hold its int code."""
+
+    __slots__ = ("codes", "values")
+
+    def __init__(self) -> None:
+        self.codes: dict[str, int] = {}
+        self.values: list[str] = []
+
+    def add(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class ReservationTable:
+    """Reservations stored column by column."""
+
+    def __init__(self) -> None:
+        self.strings = StringPool()
+        self.ids = array("q")
+        self.names = array("I")
+        self.emails = array("I")
+        self.phones = array("I")
+        self.resources = array("I")
+        self.dates = array("i")
+        self.times = array("h")
+        self.durations = array("i")
+        self.prices = array("d")
+        self.confirmed = array("b")
+        self.created = array("q")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> Reservation:
+        if not -len(self) <= index < len(self):
+            raise IndexError("reservation index out of range")
+        return Reservation(self, index % len(self))
+
+    def __iter__(self) -> Iterator[Reservation]:
+        for index in range(len(self)):
+            yield Reservation(self, index)
+
+    def append_parts(self, parts: list[str]) -> None:
+        reservation_id = int(parts[0])
+        day = parse_date(parts[4]).toordinal()
+        start = parse_time(parts[5])
+        duration = int(parts[6])
+        price = float(parts[7])
+        created = parse_datetime(parts[10])
+
+        # A value too big for its column raises OverflowError part-way
+        # through; cut the columns back so a bad line leaves no partial row
+        rows = len(self)
+        add = self.strings.add
+        try:
+            self.ids.append(reservation_id)
+            self.names.append(add(parts[1]))
+            self.emails.append(add(parts[2]))
+            self.phones.append(add(parts[3]))
+            self.dates.append(day)
+            self.times.append(start.hour * 60 + start.minute)
+            self.durations.append(duration)
+            self.prices.append(price)
+            self.confirmed.append(parse_bool(parts[8]))
+            self.resources.append(add(parts[9]))
+            self.created.append((created - EPOCH) // timedelta(seconds=1))
+        except OverflowError:
+            for column in self.columns():
+                del column[rows:]
+            raise
+
+    def columns(self) -> tuple[array, ...]:
+        """All column arrays."""
+        return (
+            self.ids, self.names, self.emails, self.phones, self.resources, self.dates,
+            self.times, self.durations, self.prices, self.confirmed, self.created,
+        )
+
+    def nbytes(self) -> int:
+        """Bytes used by the column arrays (not counting the pooled strings)."""
+        return sum(column.itemsize * len(column) for column in self.columns())
+
+
+@dataclass(frozen=True, slots=True)
+class Reservation:
+    """One row of a ReservationTable, read on access."""
+    table: ReservationTable
+    index: int
+
+    @property
+    def reservation_id(self) -> int:
+        return self.table.ids[self.index]
+
+    @property
+    def name(self) -> str:
+        return self.table.strings.values[self.table.names[self.index]]
+
+    @property
+    def email(self) -> str:
+        return self.table.strings.values[self.table.emails[self.index]]
+
+    @property
+    def phone(self) -> str:
+        return self.table.strings.values[self.table.phones[self.index]]
+
+    @property
+    def resource(self) -> str:
+        return self.table.strings.values[self.table.resources[self.index]]
+
+    @property
+    def date(self) -> date:
+        return date.fromordinal(self.table.dates[self.index])
+
+    @property
+    def time(self) -> time:
+        return time(*divmod(self.table.times[self.index], 60))
+
+    @property
+    def duration(self) -> int:
+        return self.table.durations[self.index]
+
+    @property
+    def price(self) -> float:
+        return self.table.prices[self.index]
+
+    @property
+    def confirmed(self) -> bool:
+        return bool(self.table.confirmed[self.index])
+
+    @property
+    def created(self) -> datetime:
+        return EPOCH + timedelta(seconds=self.table.created[self.index])
+
+    def is_confirmed(self) -> bool:
+        return self.confirmed
+
+    def is_long(self) -> bool:
+        return self.duration >= 3
+
+    def total_price(self) -> float:
+        return self.duration * self.price
+
+
+def fetch_reservations(filename: str) -> ReservationTable:
+    table = ReservationTable()
+    with open(filename, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            table.append_parts(line.split("|"))
+    return table
+
+
+def main() -> None:
+    reservations = fetch_reservations("reservations.txt")
+
+    print("Confirmed reservations:")
+    for r in reservations:
+        if r.is_confirmed():
+            print(
+                f"- {r.name}, {r.resource}, "
+                f"{r.date.strftime('%d.%m.%Y')} at {r.time.strftime('%H.%M')}"
+            )
+
+    print("\nLong reservations (duration >= 3h):")
+    for r in reservations:
+        if r.is_long():
+            print(f"- {r.name} ({r.duration}h), total {r.total_price():.2f} €")
+
+    revenue = sum(r.total_price() for r in reservations if r.is_confirmed())
+    print(f"\nTotal revenue (confirmed): {revenue:.2f} €")
+
+
+if __name__ == "__main__":
+    main()
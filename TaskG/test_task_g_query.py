@@ -0,0 +1,99 @@
+# Copyright (c) 2026 Ismail Hossain
+# License: MIT
+
+"""
+Checks ReservationIndex.select() and scan() against a plain loop over
+random reservation tables.
+
+Run from the TaskG folder:
+    python3 -m unittest test_task_g_query
+"""
+
+from __future__ import annotations
+import os
+import random
+import sys
+import unittest
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from task_g_query import Query, ReservationIndex  # noqa: E402
+from task_g_table import ReservationTable  # noqa: E402
+
+RESOURCES = ["Red Room", "Flower Room", "Botanical Lab", "Forest Area 1"]
+FIRST_DAY = date(2025, 9, 1)
+DAYS = 90
+
+
+def random_table(rng: random.Random, rows: int, days: int = DAYS) -> ReservationTable:
+    table = ReservationTable()
+    for i in range(rows):
+        day = FIRST_DAY + timedelta(days=rng.randrange(days))
+        table.append_parts([
+            str(i), f"Guest {rng.randrange(50)}", f"guest{i}@example.org", "0400000000",
+            day.isoformat(), f"{rng.randrange(24):02d}:{rng.choice([0, 15, 30, 45]):02d}",
+            str(rng.randint(1, 6)), f"{rng.randint(500, 4000) / 100:.2f}", rng.choice(["True", "False"]),
+            rng.choice(RESOURCES), "2025-08-01 10:00:00",
+        ])
+    return table
+
+
+def random_query(rng: random.Random) -> Query:
+    start = end = None
+    if rng.random() < 0.6:
+        start = FIRST_DAY + timedelta(days=rng.randrange(-5, DAYS + 5))
+    if rng.random() < 0.6:
+        end = FIRST_DAY + timedelta(days=rng.randrange(-5, DAYS + 5))
+    return Query(
+        confirmed=rng.choice([None, None, True, False]),
+        resource=rng.choice([None, None, "Storage Area N", *RESOURCES]),
+        start=start,
+        end=end,
+        min_duration=rng.choice([None, None, 1, 3, 5, 7]),
+        max_duration=rng.choice([None, None, 0, 2, 4]),
+    )
+
+
+def brute_force(table: ReservationTable, query: Query) -> list[int]:
+    """Matching rows in file order, testing every row."""
+    return [
+        row for row, r in enumerate(table)
+        if (query.confirmed is None or r.confirmed == query.confirmed)
+        and (query.resource is None or r.resource == query.resource)
+        and (query.start is None or r.date >= query.start)
+        and (query.end is None or r.date <= query.end)
+        and (query.min_duration is None or r.duration >= query.min_duration)
+        and (query.max_duration is None or r.duration <= query.max_duration)
+    ]
+
+
+class ReservationIndexTest(unittest.TestCase):
+
+    def test_select_matches_brute_force(self) -> None:
+        rng = random.Random(23)
+        for rows in (0, 1, 5, 300):
+            table = random_table(rng, rows)
+            index = ReservationIndex(table)
+            for _ in range(200):
+                query = random_query(rng)
+                self.assertEqual(index.select(query), brute_force(table, query), query)
+
+    def test_scan_matches_brute_force(self) -> None:
+        rng = random.Random(230)
+        table = random_table(rng, 300)
+        index = ReservationIndex(table)
+        for _ in range(50):
+            queries = {str(i): random_query(rng) for i in range(rng.randint(1, 4))}
+            results = index.scan(queries)
+            for name, query in queries.items():
+                rows = brute_force(table, query)
+                revenue = 0.0
+                for row in rows:
+                    if table[row].confirmed:
+                        revenue += table[row].total_price()
+                self.assertEqual(results[name].rows, rows, query)
+                self.assertEqual(results[name].revenue, revenue, query)
+
+
+if __name__ == "__main__":
+    unittest.main()
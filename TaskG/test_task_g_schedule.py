@@ -0,0 +1,124 @@
+# Copyright (c) 2026 Ismail Hossain
+# License: MIT
+
+"""
+Checks MaxTree and ScheduleIndex (conflicts, overlapping bookings, first
+free slot) against brute force over random reservation tables.
+
+Run from the TaskG folder:
+    python3 -m unittest test_task_g_schedule
+"""
+
+from __future__ import annotations
+import os
+import random
+import sys
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from task_g_query import ReservationIndex  # noqa: E402
+from task_g_schedule import MaxTree, ScheduleIndex  # noqa: E402
+from task_g_table import ReservationTable  # noqa: E402
+from test_task_g_query import FIRST_DAY, DAYS, RESOURCES, random_table  # noqa: E402
+
+
+def bookings(table: ReservationTable, resource: str) -> list[tuple[int, datetime, datetime]]:
+    """(row, start, end) of every booking of the resource."""
+    found = []
+    for row, r in enumerate(table):
+        if r.resource == resource:
+            start = datetime.combine(r.date, r.time)
+            found.append((row, start, start + timedelta(hours=r.duration)))
+    return found
+
+
+def random_moment(rng: random.Random) -> datetime:
+    day = FIRST_DAY + timedelta(days=rng.randrange(-2, DAYS + 2))
+    return datetime.combine(day, datetime.min.time()) + timedelta(minutes=rng.randrange(0, 1440, 5))
+
+
+class MaxTreeTest(unittest.TestCase):
+
+    def test_first_at_least_matches_brute_force(self) -> None:
+        rng = random.Random(24)
+        for size in range(0, 40):
+            values = [rng.randrange(100) for _ in range(size)]
+            tree = MaxTree(values)
+            for start in range(size + 3):
+                for value in (0, 1, 50, 99, 100):
+                    expected = next((i for i in range(start, size) if values[i] >= value), -1)
+                    self.assertEqual(tree.first_at_least(start, value), expected, (values, start, value))
+
+
+class ScheduleIndexTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.rng = random.Random(240)
+        self.tables = [random_table(self.rng, rows) for rows in (0, 1, 2, 10, 300)]
+        # Busy days: long runs of back-to-back bookings with short gaps
+        self.tables.append(random_table(self.rng, 300, days=7))
+
+    def test_conflicts_match_brute_force(self) -> None:
+        for table in self.tables:
+            expected = {}
+            for resource in RESOURCES:
+                found = bookings(table, resource)
+                pairs = {
+                    frozenset((a, b))
+                    for i, (a, a_start, a_end) in enumerate(found)
+                    for b, b_start, b_end in found[i + 1:]
+                    if a_start < b_end and b_start < a_end
+                }
+                if pairs:
+                    expected[resource] = pairs
+
+            conflicts = ScheduleIndex(ReservationIndex(table)).conflicts()
+            self.assertEqual({name: set(map(frozenset, pairs)) for name, pairs in conflicts.items()}, expected)
+            for pairs in conflicts.values():
+                self.assertEqual(len(pairs), len(set(map(frozenset, pairs))))
+                for a, b in pairs:
+                    self.assertLessEqual((table[a].date, table[a].time), (table[b].date, table[b].time))
+
+    def test_overlapping_matches_brute_force(self) -> None:
+        for table in self.tables:
+            schedule = ScheduleIndex(ReservationIndex(table))
+            for _ in range(300):
+                resource = self.rng.choice(RESOURCES)
+                start = random_moment(self.rng)
+                hours = self.rng.randint(1, 8)
+                end = start + timedelta(hours=hours)
+                expected = [row for row, b_start, b_end in bookings(table, resource) if b_start < end and start < b_end]
+                self.assertEqual(sorted(schedule.overlapping(resource, start, hours)), expected)
+
+    def test_first_free_slot_matches_brute_force(self) -> None:
+        for table in self.tables:
+            schedule = ScheduleIndex(ReservationIndex(table))
+            for _ in range(300):
+                resource = self.rng.choice(RESOURCES)
+                hours = self.rng.randint(1, 8)
+                found = bookings(table, resource)
+                after = random_moment(self.rng)
+                if found and self.rng.random() < 0.5:
+                    # Exactly at a booking's end, or exactly hours before its start
+                    _, b_start, b_end = self.rng.choice(found)
+                    after = self.rng.choice([b_end, b_start - timedelta(hours=hours)])
+                # The first free start is either the requested time or the end of a booking
+                candidates = sorted({after} | {end for _, _, end in found if end > after})
+                expected = next(
+                    start for start in candidates
+                    if all(start + timedelta(hours=hours) <= b_start or b_end <= start for _, b_start, b_end in found)
+                )
+                self.assertEqual(schedule.first_free_slot(resource, after, hours), expected, (resource, after, hours))
+
+    def test_unknown_resource_and_bad_hours(self) -> None:
+        schedule = ScheduleIndex(ReservationIndex(self.tables[-1]))
+        after = datetime(2025, 10, 1, 12, 0)
+        self.assertEqual(schedule.first_free_slot("Storage Area N", after, 2), after)
+        self.assertEqual(schedule.overlapping("Storage Area N", after, 2), [])
+        with self.assertRaises(ValueError):
+            schedule.first_free_slot("Red Room", after, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
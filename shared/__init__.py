@@ -0,0 +1,4 @@
+# Copyright (c) 2026 Ismail Hossain
+# License: MIT
+
+"""Code shared by the Task folders (file formats and readers)."""
@@ -0,0 +1,125 @@
+# Copyright (c) 2026 Ismail Hossain
+# License: MIT
+
+"""
+Benchmark for the reservation date/time field parser used by TaskB and TaskG.
+
+Run from the repository root:
+    python3 shared/bench_datetime_fields.py [--lines N]
+
+A TaskG-style reservations file of N lines (default 1,000,000) with
+random dates, start times and created stamps is generated into a
+temporary folder. Loading it with the original strptime() conversion is
+timed against task_g_class.fetch_reservations(), and the three fields are
+also timed on their own.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time as clock
+from datetime import date, datetime, timedelta
+from typing import Callable, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "TaskG")]
+
+from shared.datetime_fields import parse_date, parse_datetime, parse_time  # noqa: E402
+from task_g_class import Reservation, fetch_reservations, parse_bool  # noqa: E402
+
+
+def convert_reservation_strptime(parts: List[str]) -> Reservation:
+    """The original TaskG conversion with three strptime() calls, for comparison."""
+    return Reservation(
+        reservation_id=int(parts[0]),
+        name=parts[1],
+        email=parts[2],
+        phone=parts[3],
+        date=datetime.strptime(parts[4], "%Y-%m-%d").date(),
+        time=datetime.strptime(parts[5], "%H:%M").time(),
+        duration=int(parts[6]),
+        price=float(parts[7]),
+        confirmed=parse_bool(parts[8]),
+        resource=parts[9],
+        created=datetime.strptime(parts[10], "%Y-%m-%d %H:%M:%S"),
+    )
+
+
+def fetch_reservations_strptime(filename: str) -> List[Reservation]:
+    reservations: List[Reservation] = []
+    with open(filename, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            reservations.append(convert_reservation_strptime(line.split("|")))
+    return reservations
+
+
+def write_reservations(filename: str, lines: int) -> None:
+    """Write random reservations over two years in the TaskG layout."""
+    rng = random.Random(42)
+    first_day = date(2025, 1, 1).toordinal()
+    with open(filename, "w", encoding="utf-8") as out:
+        for n in range(lines):
+            day = date.fromordinal(first_day + rng.randrange(730))
+            created = datetime.combine(day, datetime.min.time()) - timedelta(seconds=rng.randrange(90 * 86400))
+            out.write(
+                f"{n + 1}|Guest {n % 5000}|guest{n % 5000}@example.org|040{n % 5000:07d}|"
+                f"{day.isoformat()}|{rng.randrange(7, 21):02d}:{rng.choice((0, 15, 30, 45)):02d}|"
+                f"{rng.randrange(1, 6)}|{rng.randrange(1000, 5000) / 100:.2f}|{rng.random() < 0.7}|"
+                f"Room {n % 40}|{created:%Y-%m-%d %H:%M:%S}\n"
+            )
+
+
+def timed(func: Callable[[], object]) -> float:
+    """Seconds for one call."""
+    start = clock.perf_counter()
+    func()
+    return clock.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark reservation date/time parsing.")
+    parser.add_argument("--lines", type=int, default=1_000_000, help="lines in the generated file (default: 1000000)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "reservations.txt")
+        write_reservations(filename, args.lines)
+
+        with open(filename, "r", encoding="utf-8") as f:
+            fields = [line.split("|") for line in f]
+        dates = [parts[4] for parts in fields]
+        times = [parts[5] for parts in fields]
+        stamps = [parts[10].rstrip("\n") for parts in fields]
+        del fields
+
+        t_strptime = timed(lambda: (
+            [datetime.strptime(v, "%Y-%m-%d").date() for v in dates],
+            [datetime.strptime(v, "%H:%M").time() for v in times],
+            [datetime.strptime(v, "%Y-%m-%d %H:%M:%S") for v in stamps],
+        ))
+        t_fields = timed(lambda: (
+            list(map(parse_date, dates)),
+            list(map(parse_time, times)),
+            list(map(parse_datetime, stamps)),
+        ))
+        assert list(map(parse_datetime, stamps)) == [datetime.strptime(v, "%Y-%m-%d %H:%M:%S") for v in stamps]
+
+        t_load_strptime = timed(lambda: fetch_reservations_strptime(filename))
+        t_load = timed(lambda: fetch_reservations(filename))
+
+    print(f"{args.lines} lines")
+    print(f"3 fields, strptime()        {t_strptime:8.2f} s")
+    print(f"3 fields, datetime_fields   {t_fields:8.2f} s  ({t_strptime / t_fields:4.1f}x)")
+    print(f"TaskG load, strptime()      {t_load_strptime:8.2f} s")
+    print(f"TaskG load, datetime_fields {t_load:8.2f} s  ({t_load_strptime / t_load:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
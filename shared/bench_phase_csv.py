@@ -0,0 +1,132 @@
+# Copyright (c) 2026 Ismail Hossain
+# License: MIT
+
+"""
+Benchmark for the block phase CSV reader used by TaskD and TaskE.
+
+Run from the repository root:
+    python3 shared/bench_phase_csv.py [csv file] [--weeks N]
+
+The given week file is repeated for N weeks (default 520) into a
+temporary file, and the original per-line loops of TaskD and TaskE are
+timed against the current readers, which group the rows with
+PhaseGroups. A scan filling all four group-by dimensions is timed too.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "TaskD"), os.path.join(ROOT, "TaskE")]
+
+from shared.phase_csv import read_phase_columns  # noqa: E402
+from shared.phase_groups import DIMENSIONS, PhaseGroups  # noqa: E402
+from task_d import WEEKDAYS, calculate_daily_totals, read_data  # noqa: E402
+from task_e import read_week_data  # noqa: E402
+
+
+def weekday_totals_lines(filename: str) -> Dict[str, Tuple[int, int]]:
+    """The original TaskD per-line loader and weekday totals, for comparison."""
+    totals: Dict[str, List[int]] = {}
+
+    with open(filename, "r", encoding="utf-8") as file:
+        next(file, None)
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            parts = line.split(";")
+            if len(parts) != 7:
+                continue
+            day = WEEKDAYS[datetime.fromisoformat(parts[0].strip()).weekday()]
+            values = [int(part.strip()) for part in parts[1:]]
+            if day not in totals:
+                totals[day] = [0, 0]
+            totals[day][0] += values[0] + values[1] + values[2]
+            totals[day][1] += values[3] + values[4] + values[5]
+
+    return {day: (vals[0], vals[1]) for day, vals in totals.items()}
+
+
+def read_week_lines(filename: str) -> Dict[date, Tuple[int, int]]:
+    """The original TaskE per-line loader, for comparison."""
+    daily: Dict[date, List[int]] = {}
+
+    with open(filename, "r", encoding="utf-8") as f:
+        next(f, None)
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            parts = line.split(";")
+            if len(parts) != 7:
+                continue
+            day = datetime.fromisoformat(parts[0].strip()).date()
+            values = [int(part.strip()) for part in parts[1:]]
+            if day not in daily:
+                daily[day] = [0, 0]
+            daily[day][0] += values[0] + values[1] + values[2]
+            daily[day][1] += values[3] + values[4] + values[5]
+
+    return {d: (vals[0], vals[1]) for d, vals in daily.items()}
+
+
+def best_of(func: Callable[[], object], number: int = 1, repeat: int = 5) -> float:
+    """Best average time of one call in seconds."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def write_repeated_week(source: str, target: str, weeks: int) -> None:
+    """Write a file that repeats the source rows, shifted by one week per copy."""
+    with open(source, "r", encoding="utf-8") as f:
+        header = f.readline()
+        rows = [line.strip().split(";", 1) for line in f if line.strip()]
+
+    with open(target, "w", encoding="utf-8") as out:
+        out.write(header)
+        for k in range(weeks):
+            for stamp, rest in rows:
+                ts = datetime.fromisoformat(stamp) + timedelta(weeks=k)
+                out.write(f"{ts.isoformat()};{rest}\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the phase CSV reader.")
+    parser.add_argument("csv", nargs="?", default=os.path.join(ROOT, "TaskD", "week42.csv"))
+    parser.add_argument("--weeks", type=int, default=520, help="weeks in the generated file (default: 520)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        big = os.path.join(tmp, "weeks.csv")
+        write_repeated_week(args.csv, big, args.weeks)
+        rows = len(read_phase_columns(big))
+        size = os.path.getsize(big)
+
+        assert calculate_daily_totals(read_data(big)) == weekday_totals_lines(big)
+        assert read_week_data(big) == read_week_lines(big)
+
+        t_columns = best_of(lambda: read_phase_columns(big))
+        t_groups = best_of(lambda: PhaseGroups.from_file(big))
+        t_d_lines = best_of(lambda: weekday_totals_lines(big))
+        t_d = best_of(lambda: calculate_daily_totals(read_data(big)))
+        t_e_lines = best_of(lambda: read_week_lines(big))
+        t_e = best_of(lambda: read_week_data(big))
+
+    print(f"{args.weeks} weeks from {args.csv}: {rows} rows, {size / 1e6:.1f} MB")
+    print(f"read_phase_columns          {t_columns * 1000:8.2f} ms  ({rows / t_columns / 1e6:4.2f} M rows/s)")
+    print(f"PhaseGroups, {len(DIMENSIONS)} dimensions    {t_groups * 1000:8.2f} ms  ({', '.join(DIMENSIONS)})")
+    print(f"TaskD per-line loop         {t_d_lines * 1000:8.2f} ms")
+    print(f"TaskD weekday totals        {t_d * 1000:8.2f} ms  ({t_d_lines / t_d:4.1f}x)")
+    print(f"TaskE per-line loop         {t_e_lines * 1000:8.2f} ms")
+    print(f"TaskE read_week_data        {t_e * 1000:8.2f} ms  ({t_e_lines / t_e:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,437 @@
+# Copyright (c) 2026 Ismail Hossain
+# License: MIT
+
+"""
+Compact columnar archive for time-keyed integer data (hourly energy files).
+
+An archive holds one int64 key column (local wall-clock seconds since
+1970-01-01) and any number of fixed-point integer value columns, each
+with its own scale (the stored integer is value * scale). Rows are split
+into blocks of block_rows rows:
+
+- the keys are stored as the block's first key plus deltas,
+- every column is stored in the narrowest array type that fits the block,
+- the block payload is optionally zlib-compressed,
+- the block directory at the end of the file keeps the first/last key and
+  per-column min, max and sum of every block.
+
+Readers load only the directory up front. read() decodes just the blocks
+that overlap the requested key range, and totals() answers range sums
+from the block summaries, decoding only the (at most two) partial blocks
+at the range edges.
+
+File layout (all integers little-endian):
+
+    header     MAGIC, version, column count, then per column:
+               name length (H), UTF-8 name, scale (q)
+    blocks     payload of each block, one after another
+    directory  per block: BLOCK_ENTRY, key typecode, then per column
+               typecode + COLUMN_STATS
+    trailer    directory offset (Q), block count (I), MAGIC
+
+Usage from the command line (any Task folder):
+    python3 ../shared/columnar.py convert 2025.csv [--block-rows 4096] [--no-compress]
+    python3 ../shared/columnar.py info 2025.hcol
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import date, datetime
+from itertools import accumulate
+from typing import Dict, List, Sequence, Tuple
+
+ARCHIVE_SUFFIX = ".hcol"
+MAGIC = b"HCOL\0\0\0\1"
+VERSION = 1
+DEFAULT_BLOCK_ROWS = 4096
+
+# Name of the optional column holding each row's UTC offset in minutes
+OFFSET_COLUMN = "utc_offset_min"
+# Marker in the offset column for timestamps without a UTC offset
+NO_OFFSET = -32768
+
+HEADER = struct.Struct("<8sHH")
+COLUMN_HEADER = struct.Struct("<H")
+SCALE = struct.Struct("<q")
+# payload offset, stored length, raw length, rows, first key, last key, flags
+BLOCK_ENTRY = struct.Struct("<QIIIqqB")
+# min, max, sum of one column in one block
+COLUMN_STATS = struct.Struct("<qqq")
+TRAILER = struct.Struct("<QI8s")
+
+FLAG_ZLIB = 1
+
+# Narrowest array typecode for a value range, smallest first
+INT_TYPECODES = ("b", "h", "i", "q")
+
+# date.toordinal() of 1970-01-01; keys are counted from here
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+NUMBER_RE = re.compile(r"^[-+]?(\d*)(?:\.(\d*))?$")
+
+
+@dataclass(frozen=True)
+class ColumnStats:
+    """Min, max and sum of one column over one block."""
+    min: int
+    max: int
+    sum: int
+
+
+@dataclass(frozen=True)
+class Block:
+    """Directory entry of one block."""
+    offset: int
+    length: int
+    raw_length: int
+    rows: int
+    first_key: int
+    last_key: int
+    compressed: bool
+    key_typecode: str
+    typecodes: Tuple[str, ...]
+    stats: Tuple[ColumnStats, ...]
+
+
+def _typecode_for(lo: int, hi: int) -> str:
+    """Smallest signed array typecode that holds every value in [lo, hi]."""
+    for code in INT_TYPECODES:
+        bits = array(code).itemsize * 8
+        if -(1 << (bits - 1)) <= lo and hi < (1 << (bits - 1)):
+            return code
+    raise OverflowError(f"value range {lo}..{hi} does not fit in 64 bits")
+
+
+def _to_le_bytes(values: array) -> bytes:
+    """Array contents as little-endian bytes."""
+    if sys.byteorder != "little" and values.itemsize > 1:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_le_bytes(typecode: str, data: bytes) -> array:
+    """Array from little-endian bytes."""
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder != "little" and values.itemsize > 1:
+        values.byteswap()
+    return values
+
+
+def write_archive(
+    filename: str,
+    keys: Sequence[int],
+    columns: Dict[str, Sequence[int]],
+    scales: Dict[str, int] | None = None,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+    compress: bool = True,
+) -> int:
+    """
+    Write keys and fixed-point integer columns to an archive file.
+
+    The keys must be in ascending order (blocks are found by key). scales
+    gives the fixed-point scale per column (default 1). Returns the
+    number of blocks written.
+    """
+    if any(len(values) != len(keys) for values in columns.values()):
+        raise ValueError("every column must have one value per key")
+    if any(a > b for a, b in zip(keys, keys[1:])):
+        raise ValueError("keys must be in ascending order")
+    if block_rows < 1:
+        raise ValueError("block_rows must be at least 1")
+
+    names = list(columns)
+    scales = scales or {}
+    entries: List[bytes] = []
+
+    with open(filename, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(names)))
+        for name in names:
+            encoded = name.encode("utf-8")
+            f.write(COLUMN_HEADER.pack(len(encoded)) + encoded + SCALE.pack(scales.get(name, 1)))
+
+        for start in range(0, len(keys), block_rows):
+            stop = min(start + block_rows, len(keys))
+            block_keys = keys[start:stop]
+            deltas = array("q", [b - a for a, b in zip(block_keys, block_keys[1:])])
+            key_code = _typecode_for(min(deltas), max(deltas)) if deltas else "b"
+
+            parts = [_to_le_bytes(array(key_code, deltas))]
+            directory = []
+            for name in names:
+                values = columns[name][start:stop]
+                lo, hi = min(values), max(values)
+                code = _typecode_for(lo, hi)
+                parts.append(_to_le_bytes(array(code, values)))
+                directory.append(code.encode("ascii") + COLUMN_STATS.pack(lo, hi, sum(values)))
+
+            raw = b"".join(parts)
+            payload = zlib.compress(raw, 6) if compress else raw
+            entries.append(
+                BLOCK_ENTRY.pack(
+                    f.tell(), len(payload), len(raw), stop - start,
+                    block_keys[0], block_keys[-1], FLAG_ZLIB if compress else 0,
+                )
+                + key_code.encode("ascii")
+                + b"".join(directory)
+            )
+            f.write(payload)
+
+        directory_offset = f.tell()
+        for entry in entries:
+            f.write(entry)
+        f.write(TRAILER.pack(directory_offset, len(entries), MAGIC))
+
+    return len(entries)
+
+
+class ArchiveReader:
+    """
+    Read access to an archive file.
+
+    Only the header and the block directory are read when the reader is
+    created; blocks are decoded on demand.
+    """
+
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+        self.names: List[str] = []
+        self.scales: Dict[str, int] = {}
+        self.blocks: List[Block] = []
+
+        with open(filename, "rb") as f:
+            magic, version, count = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{filename}: not a version {VERSION} columnar archive")
+            for _ in range(count):
+                (length,) = COLUMN_HEADER.unpack(f.read(COLUMN_HEADER.size))
+                name = f.read(length).decode("utf-8")
+                (scale,) = SCALE.unpack(f.read(SCALE.size))
+                self.names.append(name)
+                self.scales[name] = scale
+
+            f.seek(-TRAILER.size, os.SEEK_END)
+            directory_offset, block_count, end_magic = TRAILER.unpack(f.read(TRAILER.size))
+            if end_magic != MAGIC:
+                raise ValueError(f"{filename}: truncated columnar archive")
+
+            f.seek(directory_offset)
+            entry_size = BLOCK_ENTRY.size + 1 + len(self.names) * (1 + COLUMN_STATS.size)
+            directory = f.read(entry_size * block_count)
+
+        for k in range(block_count):
+            pos = k * entry_size
+            offset, length, raw_length, rows, first_key, last_key, flags = \
+                BLOCK_ENTRY.unpack_from(directory, pos)
+            pos += BLOCK_ENTRY.size
+            key_code = chr(directory[pos])
+            pos += 1
+            typecodes = []
+            stats = []
+            for _ in self.names:
+                typecodes.append(chr(directory[pos]))
+                stats.append(ColumnStats(*COLUMN_STATS.unpack_from(directory, pos + 1)))
+                pos += 1 + COLUMN_STATS.size
+            self.blocks.append(Block(
+                offset, length, raw_length, rows, first_key, last_key,
+                bool(flags & FLAG_ZLIB), key_code, tuple(typecodes), tuple(stats),
+            ))
+
+        self._first_keys = [block.first_key for block in self.blocks]
+        self._last_keys = [block.last_key for block in self.blocks]
+
+    def __len__(self) -> int:
+        return sum(block.rows for block in self.blocks)
+
+    def blocks_in(self, start_key: int, end_key: int) -> range:
+        """Indexes of the blocks with keys in [start_key, end_key)."""
+        return range(
+            bisect_left(self._last_keys, start_key),
+            bisect_left(self._first_keys, end_key),
+        )
+
+    def decode(self, k: int) -> Tuple[array, Dict[str, array]]:
+        """Decode block k to its key array and int64 column arrays."""
+        block = self.blocks[k]
+        with open(self.filename, "rb") as f:
+            f.seek(block.offset)
+            payload = f.read(block.length)
+        raw = zlib.decompress(payload) if block.compressed else payload
+        if len(raw) != block.raw_length:
+            raise ValueError(f"{self.filename}: damaged block {k}")
+
+        pos = (block.rows - 1) * array(block.key_typecode).itemsize
+        deltas = _from_le_bytes(block.key_typecode, raw[:pos])
+        keys = array("q", accumulate(deltas, initial=block.first_key))
+
+        columns: Dict[str, array] = {}
+        for name, code in zip(self.names, block.typecodes):
+            size = block.rows * array(code).itemsize
+            columns[name] = array("q", _from_le_bytes(code, raw[pos:pos + size]))
+            pos += size
+        return keys, columns
+
+    def read(self, start_key: int | None = None, end_key: int | None = None) -> Tuple[array, Dict[str, array]]:
+        """
+        Keys and columns of the rows with start_key <= key < end_key.
+
+        Blocks outside the range are skipped without being read.
+        """
+        keys = array("q")
+        columns: Dict[str, array] = {name: array("q") for name in self.names}
+        if not self.blocks:
+            return keys, columns
+        lo = self.blocks[0].first_key if start_key is None else start_key
+        hi = self.blocks[-1].last_key + 1 if end_key is None else end_key
+
+        for k in self.blocks_in(lo, hi):
+            block_keys, block_columns = self.decode(k)
+            i = bisect_left(block_keys, lo)
+            j = bisect_left(block_keys, hi)
+            keys.extend(block_keys[i:j])
+            for name in self.names:
+                columns[name].extend(block_columns[name][i:j])
+        return keys, columns
+
+    def totals(self, start_key: int, end_key: int) -> Tuple[int, Dict[str, int]]:
+        """
+        Row count and per-column sums for start_key <= key < end_key.
+
+        Blocks that lie completely inside the range are answered from
+        their directory summaries; only partial edge blocks are decoded.
+        """
+        rows = 0
+        sums = {name: 0 for name in self.names}
+        for k in self.blocks_in(start_key, end_key):
+            block = self.blocks[k]
+            if start_key <= block.first_key and block.last_key < end_key:
+                rows += block.rows
+                for name, stats in zip(self.names, block.stats):
+                    sums[name] += stats.sum
+                continue
+
+            block_keys, block_columns = self.decode(k)
+            i = bisect_left(block_keys, start_key)
+            j = bisect_left(block_keys, end_key)
+            rows += j - i
+            for name in self.names:
+                sums[name] += sum(block_columns[name][i:j])
+        return rows, sums
+
+
+def datetime_key(ts: datetime) -> int:
+    """Local wall-clock seconds since 1970-01-01 (the UTC offset is ignored)."""
+    return (ts.toordinal() - EPOCH_ORDINAL) * 86400 + ts.hour * 3600 + ts.minute * 60 + ts.second
+
+
+def date_key(d: date) -> int:
+    """Key of midnight at the start of a date."""
+    return (d.toordinal() - EPOCH_ORDINAL) * 86400
+
+
+def read_csv_columns(filename: str) -> Tuple[array, Dict[str, array], Dict[str, int]]:
+    """
+    Read a 'timestamp;value;value;...' CSV file as archive columns.
+
+    Decimal commas or dots are both accepted (with ';' as separator).
+    Each value column gets the scale 10**d, where d is the largest number
+    of decimals in that column, so every value is stored exactly. A
+    utc_offset_min column is added when the timestamps carry an offset.
+
+    Returns:
+        (keys, columns, scales)
+    """
+    with open(filename, "r", encoding="utf-8") as f:
+        header = f.readline().strip()
+        sep = ";" if ";" in header else ","
+        names = [name.strip() for name in header.split(sep)[1:]]
+        stamps: List[datetime] = []
+        texts: List[List[str]] = [[] for _ in names]
+        for line_no, line in enumerate(f, start=2):
+            line = line.strip()
+            if not line:
+                continue
+            parts = line.split(sep)
+            if len(parts) != len(names) + 1:
+                raise ValueError(f"{filename}:{line_no}: expected {len(names) + 1} columns")
+            stamps.append(datetime.fromisoformat(parts[0].strip()))
+            for column, text in zip(texts, parts[1:]):
+                column.append(text.strip().replace(",", "."))
+
+    order = sorted(range(len(stamps)), key=lambda i: datetime_key(stamps[i]))
+    keys = array("q", [datetime_key(stamps[i]) for i in order])
+
+    columns: Dict[str, array] = {}
+    scales: Dict[str, int] = {}
+    for name, column in zip(names, texts):
+        decimals = 0
+        for text in column:
+            match = NUMBER_RE.match(text)
+            if not match or not (match.group(1) or match.group(2)):
+                raise ValueError(f"{filename}: bad number {text!r} in column {name!r}")
+            decimals = max(decimals, len(match.group(2) or ""))
+        values = array("q")
+        for i in order:
+            whole, _, frac = column[i].partition(".")
+            sign = -1 if whole.startswith("-") else 1
+            digits = whole.lstrip("+-") + frac.ljust(decimals, "0")
+            values.append(sign * int(digits or "0"))
+        columns[name] = values
+        scales[name] = 10 ** decimals
+
+    if any(ts.utcoffset() is not None for ts in stamps):
+        offsets = array("q")
+        for i in order:
+            offset = stamps[i].utcoffset()
+            offsets.append(NO_OFFSET if offset is None else int(offset.total_seconds()) // 60)
+        columns[OFFSET_COLUMN] = offsets
+        scales[OFFSET_COLUMN] = 1
+
+    return keys, columns, scales
+
+
+def main() -> None:
+    """Command line: convert CSV files to archives, or show an archive's blocks."""
+    parser = argparse.ArgumentParser(description="Columnar archive files for hourly data.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser("convert", help="write FILE.hcol next to each CSV file")
+    convert.add_argument("csv", nargs="+")
+    convert.add_argument("--block-rows", type=int, default=DEFAULT_BLOCK_ROWS)
+    convert.add_argument("--no-compress", action="store_true", help="store blocks without zlib")
+
+    info = commands.add_parser("info", help="print the columns and block summaries")
+    info.add_argument("archive")
+    args = parser.parse_args()
+
+    if args.command == "convert":
+        for name in args.csv:
+            target = os.path.splitext(name)[0] + ARCHIVE_SUFFIX
+            keys, columns, scales = read_csv_columns(name)
+            blocks = write_archive(target, keys, columns, scales, args.block_rows, not args.no_compress)
+            print(
+                f"{name} -> {target}: {len(keys)} rows, {blocks} blocks, "
+                f"{os.path.getsize(name)} -> {os.path.getsize(target)} bytes"
+            )
+    else:
+        reader = ArchiveReader(args.archive)
+        print(f"{args.archive}: {len(reader)} rows in {len(reader.blocks)} blocks")
+        print("columns: " + ", ".join(f"{name} (scale {reader.scales[name]})" for name in reader.names))
+        for k, block in enumerate(reader.blocks):
+            print(f"block {k}: {block.rows} rows, keys {block.first_key}..{block.last_key}, {block.length} bytes")
+            for name, stats in zip(reader.names, block.stats):
+                print(f"  {name}: min {stats.min}, max {stats.max}, sum {stats.sum}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# Copyright (c) 2026 Ismail Hossain
+# License: MIT
+
+"""
+Fast parsing of the fixed-layout date and time fields of reservation files
+(TaskB and TaskG):
+
+    YYYY-MM-DD            parse_date()
+    HH:MM                 parse_time()
+    YYYY-MM-DD HH:MM:SS   parse_datetime()
+
+A field in exactly this layout is decoded by slicing and int(); dates and
+times repeat a lot, so they are also kept in bounded LRU caches. Anything
+else (other widths, stray spaces, out-of-range values) is handed to
+datetime.strptime() with the same format, so the results and the
+ValueErrors are the same as calling strptime() directly.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time
+from functools import lru_cache
+
+DATE_FORMAT = "%Y-%m-%d"
+TIME_FORMAT = "%H:%M"
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Distinct dates / times remembered by the caches
+DATE_CACHE_SIZE = 4096
+TIME_CACHE_SIZE = 2048
+
+
+def _digits(value: str) -> bool:
+    """Only ASCII digits (int() would also take spaces, signs and '_')."""
+    return value.isascii() and value.isdigit()
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_date(value: str) -> date:
+    """'YYYY-MM-DD' -> date, like datetime.strptime(value, '%Y-%m-%d').date()."""
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        year, month, day = value[:4], value[5:7], value[8:]
+        if _digits(year) and _digits(month) and _digits(day):
+            try:
+                return date(int(year), int(month), int(day))
+            except ValueError:
+                pass  # let strptime() raise its own error
+    return datetime.strptime(value, DATE_FORMAT).date()
+
+
+@lru_cache(maxsize=TIME_CACHE_SIZE)
+def parse_time(value: str) -> time:
+    """'HH:MM' -> time, like datetime.strptime(value, '%H:%M').time()."""
+    if len(value) == 5 and value[2] == ":":
+        hour, minute = value[:2], value[3:]
+        if _digits(hour) and _digits(minute):
+            try:
+                return time(int(hour), int(minute))
+            except ValueError:
+                pass
+    return datetime.strptime(value, TIME_FORMAT).time()
+
+
+def parse_datetime(value: str) -> datetime:
+    """'YYYY-MM-DD HH:MM:SS' -> datetime, like datetime.strptime(value, '%Y-%m-%d %H:%M:%S')."""
+    if len(value) == 19 and value[10] == " " and value[13] == ":" and value[16] == ":":
+        hour, minute, second = value[11:13], value[14:16], value[17:]
+        if _digits(hour) and _digits(minute) and _digits(second):
+            try:
+                d = parse_date(value[:10])
+                return datetime(d.year, d.month, d.day, int(hour), int(minute), int(second))
+            except ValueError:
+                pass
+    return datetime.strptime(value, DATETIME_FORMAT)
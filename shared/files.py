@@ -0,0 +1,55 @@
+# Copyright (c) 2026 Ismail Hossain
+# License: MIT
+
+"""
+File helpers shared by TaskE and TaskF for their sidecar files (the
+TaskE manifest and the TaskF binary cache).
+
+atomic_write() writes to a temporary file in the target's folder and
+renames it into place, so a reader never sees a half-written file.
+file_digest() hashes a file in blocks without reading it into memory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import IO, Iterator
+
+# Bytes read per block when hashing a file
+DIGEST_BLOCK_SIZE = 1024 * 1024
+
+
+@contextmanager
+def atomic_write(path: str, mode: str = "w", encoding: str | None = None, fsync: bool = False) -> Iterator[IO]:
+    """
+    Open a temporary file next to path for writing; rename it to path on
+    success, delete it if the block raises (the exception propagates).
+    With fsync=True the data is flushed to disk before the rename.
+    """
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp_name = tempfile.mkstemp(prefix=".tmp-", suffix=os.path.splitext(path)[1], dir=folder)
+    try:
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def file_digest(filename: str) -> bytes:
+    """sha256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for block in iter(lambda: f.read(DIGEST_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.digest()
@@ -0,0 +1,224 @@
+# Copyright (c) 2026 Ismail Hossain
+# License: MIT
+
+"""
+Reader for the hourly phase CSV format used by TaskD and TaskE:
+
+    Time;Consumption phase 1 Wh;...phase 3 Wh;Production phase 1 Wh;...phase 3 Wh
+    2025-10-13T00:00:00;462;89;143;0;0;0
+
+The file is read as bytes in large blocks. Each block is split into
+fields with one bytes.split() and the columns are taken as strided
+slices, so the phase values go straight from bytes to int64 arrays
+without per-line strip/split or str objects; repeated values are looked
+up in a small cache instead of parsed again. Timestamps are turned into
+day ordinals and hours through caches keyed by the date and time parts,
+so each distinct date and time-of-day is parsed and validated once.
+
+Before that, every line of the block is checked to have exactly seven
+fields. A block that does not fit this shape (blank lines, a row with a
+missing or extra column, odd timestamps) is parsed with the plain
+per-line loop, which skips the bad lines and raises the same errors as
+before.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from datetime import date, datetime
+from itertools import compress, islice
+from operator import add, ne
+from typing import Dict, Iterator, List, Tuple
+
+# Bytes read per block
+BLOCK_SIZE = 1024 * 1024
+
+COLUMNS = 7
+PHASES = 6
+
+# Every byte except the field and line separators, and what is left of one
+# row after deleting them
+NOT_SEPARATORS = bytes(set(range(256)) - set(b";\n"))
+ROW_LAYOUT = b";" * (COLUMNS - 1) + b"\n"
+
+# Parsed field values kept by IntCache before it is cleared
+INT_CACHE_SIZE = 1 << 16
+
+
+class IntCache(dict):
+    """
+    bytes field -> int, parsed with int() on first sight.
+
+    Hourly phase readings repeat a few hundred distinct values, so most
+    fields cost one dict lookup instead of an int() call.
+    """
+
+    def __missing__(self, field: bytes) -> int:
+        if len(self) >= INT_CACHE_SIZE:
+            self.clear()
+        value = self[field] = int(field)
+        return value
+
+
+@dataclass(frozen=True)
+class PhaseBatch:
+    """Parsed rows of one block: day ordinals, hours of day and the six phase columns (Wh)."""
+    ordinals: array
+    hours: array
+    phases: Tuple[array, ...]
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    def consumption(self) -> array:
+        """Consumption phases 1-3 added together, per row."""
+        c1, c2, c3 = self.phases[:3]
+        return array("q", map(add, map(add, c1, c2), c3))
+
+    def production(self) -> array:
+        """Production phases 1-3 added together, per row."""
+        p1, p2, p3 = self.phases[3:]
+        return array("q", map(add, map(add, p1, p2), p3))
+
+    def day_runs(self) -> List[Tuple[int, int, int]]:
+        """
+        (ordinal, start, stop) for each run of rows with the same day.
+
+        Rows of a file in time order give one run per day, so per-day sums
+        are sum(column[start:stop]) instead of a Python loop over rows.
+        """
+        ordinals = self.ordinals
+        if not ordinals:
+            return []
+        bounds = [0, *compress(range(1, len(ordinals)), map(ne, ordinals, islice(ordinals, 1, None))), len(ordinals)]
+        return [(ordinals[start], start, stop) for start, stop in zip(bounds, islice(bounds, 1, None))]
+
+
+def _empty_batch() -> PhaseBatch:
+    return PhaseBatch(array("q"), array("b"), tuple(array("q") for _ in range(PHASES)))
+
+
+def _parse_block_fast(
+    block: bytes,
+    day_cache: Dict[bytes, int],
+    hour_cache: Dict[bytes, int],
+    values: IntCache,
+) -> PhaseBatch | None:
+    """Column-wise parse of complete lines; None if the block needs the line loop."""
+    block = block.replace(b"\r\n", b"\n").strip(b"\n")
+    if not block:
+        return _empty_batch()
+    if b"\n\n" in block:
+        return None
+
+    # Every line must have exactly COLUMNS fields; a missing or extra one
+    # would shift later fields into the wrong columns. With every other
+    # byte deleted, each line is just its separators.
+    rows = block.count(b"\n") + 1
+    if block.translate(None, NOT_SEPARATORS) + b"\n" != ROW_LAYOUT * rows:
+        return None
+
+    fields = block.replace(b"\n", b";").split(b";")
+    stamps = fields[0::COLUMNS]
+    days = [stamp[:10] for stamp in stamps]
+    times = [stamp[10:] for stamp in stamps]
+
+    # Each distinct date and time-of-day part is checked once
+    try:
+        for key in set(days).difference(day_cache):
+            day_cache[key] = date.fromisoformat(key.decode("ascii")).toordinal()
+        for key in set(times).difference(hour_cache):
+            hour_cache[key] = datetime.fromisoformat("0001-01-01" + key.decode("ascii")).hour
+        ordinals = array("q", map(day_cache.__getitem__, days))
+        hours = array("b", map(hour_cache.__getitem__, times))
+        phases = tuple(
+            array("q", map(values.__getitem__, fields[k::COLUMNS])) for k in range(1, COLUMNS)
+        )
+    except ValueError:
+        return None
+    return PhaseBatch(ordinals, hours, phases)
+
+
+def _parse_block_lines(block: bytes) -> PhaseBatch:
+    """The plain per-line loop: skips blank and short/long lines, raises on bad values."""
+    batch = _empty_batch()
+    for line in block.decode("utf-8").splitlines():
+        line = line.strip()
+        if not line:
+            continue
+
+        parts = line.split(";")
+        if len(parts) != COLUMNS:
+            continue  # invalid line, skip
+
+        ts = datetime.fromisoformat(parts[0].strip())
+        values = [int(part.strip()) for part in parts[1:]]
+        batch.ordinals.append(ts.toordinal())
+        batch.hours.append(ts.hour)
+        for column, value in zip(batch.phases, values):
+            column.append(value)
+    return batch
+
+
+def parse_phase_block(
+    block: bytes,
+    day_cache: Dict[bytes, int] | None = None,
+    hour_cache: Dict[bytes, int] | None = None,
+    values: IntCache | None = None,
+) -> PhaseBatch:
+    """
+    Parse complete data lines (no header) of the phase format.
+
+    The caches (b'YYYY-MM-DD' -> day ordinal, b'THH:MM:SS' -> hour,
+    field -> int) can be shared between calls.
+    """
+    batch = _parse_block_fast(
+        block,
+        {} if day_cache is None else day_cache,
+        {} if hour_cache is None else hour_cache,
+        IntCache() if values is None else values,
+    )
+    if batch is None:
+        batch = _parse_block_lines(block)
+    return batch
+
+
+def iter_phase_batches(filename: str, block_size: int = BLOCK_SIZE) -> Iterator[PhaseBatch]:
+    """
+    Read a phase CSV file in blocks of about block_size bytes.
+
+    The header line is skipped. Every batch holds whole lines; a line cut
+    by the block boundary is carried over to the next block.
+    """
+    day_cache: Dict[bytes, int] = {}
+    hour_cache: Dict[bytes, int] = {}
+    values = IntCache()
+    with open(filename, "rb") as f:
+        f.readline()  # header
+        carry = b""
+        while True:
+            data = f.read(block_size)
+            if not data:
+                break
+            data = carry + data
+            end = data.rfind(b"\n") + 1
+            carry = data[end:]
+            if end:
+                yield parse_phase_block(data[:end], day_cache, hour_cache, values)
+        if carry:
+            yield parse_phase_block(carry, day_cache, hour_cache, values)
+
+
+def read_phase_columns(filename: str) -> PhaseBatch:
+    """Read a whole phase CSV file into one batch."""
+    batches: List[PhaseBatch] = list(iter_phase_batches(filename))
+    if len(batches) == 1:
+        return batches[0]
+    merged = _empty_batch()
+    for batch in batches:
+        merged.ordinals.extend(batch.ordinals)
+        merged.hours.extend(batch.hours)
+        for column, part in zip(merged.phases, batch.phases):
+            column.extend(part)
+    return merged
@@ -0,0 +1,155 @@
+# Copyright (c) 2026 Ismail Hossain
+# License: MIT
+
+"""
+One-pass group-by over phase data (see phase_csv.py).
+
+A PhaseGroups object keeps six phase sums (consumption phases 1-3 and
+production phases 1-3, whole Wh) per group key for each requested
+dimension, and fills all of them from the same scan of the batches.
+Keys are integers computed from the day ordinal and hour, never from
+formatted strings:
+
+    weekday  0=Monday..6=Sunday
+    date     date.toordinal()
+    week     ISO year * 100 + ISO week, e.g. 202542
+    hour     hour of day 0..23
+
+Per-phase totals of everything added are kept in phase_sums.
+format_kwh() turns such Wh sums into the kWh text of the TaskD, TaskE and
+TaskF reports.
+
+Day-level dimensions are updated once per run of rows of the same day
+with sum() over array slices. The hour dimension uses strided slices
+when the rows step hour by hour (the usual case) and an index per hour
+otherwise (e.g. around a daylight saving change).
+"""
+
+from __future__ import annotations
+
+from array import array
+from datetime import date
+from operator import add
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from shared.phase_csv import PHASES, PhaseBatch, iter_phase_batches
+
+DIMENSIONS = ("weekday", "date", "week", "hour")
+
+# One day of hours, repeated to build the expected hour column of a batch
+HOUR_CYCLE = array("b", range(24))
+
+
+def weekday_key(ordinal: int) -> int:
+    """0=Monday..6=Sunday; day ordinal 1 (0001-01-01) is a Monday."""
+    return (ordinal + 6) % 7
+
+
+def day_key(ordinal: int) -> int:
+    """The date dimension is keyed by the day ordinal itself."""
+    return ordinal
+
+
+def iso_week_key(ordinal: int) -> int:
+    """ISO year * 100 + ISO week of a day ordinal."""
+    thursday = ordinal - weekday_key(ordinal) + 3
+    year = date.fromordinal(thursday).year
+    return year * 100 + (thursday - date(year, 1, 1).toordinal()) // 7 + 1
+
+
+DAY_KEYS: Dict[str, Callable[[int], int]] = {
+    "weekday": weekday_key,
+    "date": day_key,
+    "week": iso_week_key,
+}
+
+
+def format_kwh(value_wh: int) -> str:
+    """Format whole Wh as kWh with two decimals (rounded half up) and decimal comma."""
+    sign = "-" if value_wh < 0 else ""
+    hundredths = (abs(value_wh) + 5) // 10
+    return f"{sign}{hundredths // 100},{hundredths % 100:02d}"
+
+
+def _add_sums(groups: Dict[int, List[int]], key: int, sums: List[int]) -> None:
+    """Add six phase sums to one group."""
+    old = groups.get(key)
+    groups[key] = sums if old is None else list(map(add, old, sums))
+
+
+class PhaseGroups:
+    """Phase sums per group key for several dimensions, filled in one scan."""
+
+    def __init__(self, dimensions: Iterable[str] = DIMENSIONS) -> None:
+        self.dimensions = tuple(dimensions)
+        for name in self.dimensions:
+            if name not in DIMENSIONS:
+                raise ValueError(f"unknown dimension {name!r}, expected one of {', '.join(DIMENSIONS)}")
+        self.groups: Dict[str, Dict[int, List[int]]] = {name: {} for name in self.dimensions}
+        self.phase_sums = [0] * PHASES
+        self.rows = 0
+
+    @classmethod
+    def from_file(cls, filename: str, dimensions: Iterable[str] = DIMENSIONS) -> "PhaseGroups":
+        """Group one phase CSV file."""
+        groups = cls(dimensions)
+        groups.add_file(filename)
+        return groups
+
+    def add_file(self, filename: str) -> None:
+        """Add every row of a phase CSV file."""
+        for batch in iter_phase_batches(filename):
+            self.add_batch(batch)
+
+    def add_batch(self, batch: PhaseBatch) -> List[int]:
+        """
+        Add the rows of one batch to every dimension.
+
+        Returns:
+            the day ordinals of the batch's day runs, in row order
+        """
+        runs = batch.day_runs()
+        day_dims = [(self.groups[name], DAY_KEYS[name]) for name in self.dimensions if name in DAY_KEYS]
+
+        if day_dims:
+            for ordinal, start, stop in runs:
+                sums = [sum(column[start:stop]) for column in batch.phases]
+                for groups, key in day_dims:
+                    _add_sums(groups, key(ordinal), sums)
+
+        if "hour" in self.groups:
+            self._add_hours(batch)
+
+        self.phase_sums = list(map(add, self.phase_sums, map(sum, batch.phases)))
+        self.rows += len(batch)
+        return [ordinal for ordinal, _, _ in runs]
+
+    def _add_hours(self, batch: PhaseBatch) -> None:
+        """Hour-of-day sums of one batch."""
+        hours = batch.hours
+        n = len(hours)
+        if not n:
+            return
+        groups = self.groups["hour"]
+        first = hours[0]
+
+        if hours == (HOUR_CYCLE * (n // 24 + 2))[first:first + n]:
+            # Row k, k+24, k+48, ... all fall on the same hour
+            for k in range(min(24, n)):
+                _add_sums(groups, (first + k) % 24, [sum(column[k::24]) for column in batch.phases])
+            return
+
+        positions: Dict[int, List[int]] = {}
+        for i, hour in enumerate(hours):
+            positions.setdefault(hour, []).append(i)
+        for hour, index in positions.items():
+            _add_sums(groups, hour, [sum(map(column.__getitem__, index)) for column in batch.phases])
+
+    def energy(self, dimension: str) -> Dict[int, Tuple[int, int]]:
+        """(consumption_wh, production_wh) per key of one dimension, in key order."""
+        groups = self.groups[dimension]
+        return {key: (sum(groups[key][:3]), sum(groups[key][3:])) for key in sorted(groups)}
+
+    def total_energy(self) -> Tuple[int, int]:
+        """(consumption_wh, production_wh) of all rows."""
+        return sum(self.phase_sums[:3]), sum(self.phase_sums[3:])
@@ -0,0 +1,329 @@
+# Copyright (c) 2026 Ismail Hossain
+# License: MIT
+
+"""
+Optional SQLite store for the pipe-delimited reservation files of TaskB
+and TaskG.
+
+A file is imported once: its lines are parsed and inserted in batches
+with one prepared INSERT per transaction, and the file's size and mtime
+are remembered. Later runs open the database, see that the file has not
+changed and go straight to the queries; a changed file is re-imported.
+The reports are SQL queries on indexed columns and stream their rows from
+the cursor, so the data does not have to fit in memory.
+
+Both layouts go into one table:
+
+    taskg  id|name|email|phone|date|time|duration|price|confirmed|resource|created
+    taskb  number|booker|date|time|hours|rate|paid|venue|phone|email
+
+Dates are stored as day ordinals, start times as minutes from midnight
+and created stamps (TaskG only) as seconds since 1970-01-01, like
+TaskG/task_g_table.py.
+
+Usage (from the repository root):
+    python3 shared/reservation_store.py --db reservations.db import TaskG/reservations.txt
+    python3 shared/reservation_store.py --db reservations.db report TaskG/reservations.txt
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sqlite3
+import sys
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+# Also runnable as a script, so make the repository root importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared.datetime_fields import parse_date, parse_datetime, parse_time  # noqa: E402
+
+# Rows inserted per transaction
+BATCH_ROWS = 10_000
+
+# Bookings of at least this many hours are "long"
+LONG_HOURS = 3
+
+EPOCH = datetime(1970, 1, 1)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    id        INTEGER PRIMARY KEY,
+    path      TEXT NOT NULL UNIQUE,
+    layout    TEXT NOT NULL,
+    size      INTEGER NOT NULL,
+    mtime_ns  INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS reservations (
+    source     INTEGER NOT NULL REFERENCES sources(id),
+    id         INTEGER NOT NULL,
+    name       TEXT NOT NULL,
+    email      TEXT NOT NULL,
+    phone      TEXT NOT NULL,
+    day        INTEGER NOT NULL,
+    start_min  INTEGER NOT NULL,
+    duration   INTEGER NOT NULL,
+    price      REAL NOT NULL,
+    confirmed  INTEGER NOT NULL,
+    resource   TEXT NOT NULL,
+    created    INTEGER
+);
+CREATE INDEX IF NOT EXISTS reservations_resource ON reservations (resource, day);
+CREATE INDEX IF NOT EXISTS reservations_day ON reservations (day);
+CREATE INDEX IF NOT EXISTS reservations_confirmed ON reservations (source, confirmed);
+"""
+
+INSERT = (
+    "INSERT INTO reservations (source, id, name, email, phone, day, start_min, duration,"
+    " price, confirmed, resource, created) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+COLUMNS = "id, name, email, phone, day, start_min, duration, price, confirmed, resource, created"
+
+Row = Tuple[int, str, str, str, int, int, int, float, int, str, int | None]
+
+
+def _minutes(value: str) -> int:
+    t = parse_time(value)
+    return t.hour * 60 + t.minute
+
+
+def taskg_row(parts: List[str]) -> Row:
+    """One TaskG line (split on '|') as a reservations row."""
+    created = parse_datetime(parts[10])
+    return (
+        int(parts[0]), parts[1], parts[2], parts[3],
+        parse_date(parts[4]).toordinal(), _minutes(parts[5]),
+        int(parts[6]), float(parts[7]), parts[8].strip().lower() == "true",
+        parts[9], (created - EPOCH) // timedelta(seconds=1),
+    )
+
+
+def taskb_row(parts: List[str]) -> Row:
+    """One TaskB line (split on '|') as a reservations row."""
+    return (
+        int(parts[0]), parts[1], parts[9], parts[8],
+        parse_date(parts[2]).toordinal(), _minutes(parts[3]),
+        int(parts[4]), float(parts[5].replace(",", ".")),
+        parts[6].strip().lower() in ("yes", "true", "1"),
+        parts[7], None,
+    )
+
+
+LAYOUTS: Dict[str, Callable[[List[str]], Row]] = {"taskg": taskg_row, "taskb": taskb_row}
+
+
+@dataclass(frozen=True, slots=True)
+class StoredReservation:
+    """One reservation read back from the database."""
+    reservation_id: int
+    name: str
+    email: str
+    phone: str
+    date: date
+    time: time
+    duration: int
+    price: float
+    confirmed: bool
+    resource: str
+    created: datetime | None
+
+    def is_confirmed(self) -> bool:
+        return self.confirmed
+
+    def is_long(self) -> bool:
+        return self.duration >= LONG_HOURS
+
+    def total_price(self) -> float:
+        return self.duration * self.price
+
+
+def _reservation(cursor: sqlite3.Cursor, row: tuple) -> StoredReservation:
+    rid, name, email, phone, day, start_min, duration, price, confirmed, resource, created = row
+    return StoredReservation(
+        rid, name, email, phone,
+        date.fromordinal(day), time(*divmod(start_min, 60)),
+        duration, price, bool(confirmed), resource,
+        None if created is None else EPOCH + timedelta(seconds=created),
+    )
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open (or create) a reservation database."""
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _lines(filename: str, parse: Callable[[List[str]], Row], source: int) -> Iterator[tuple]:
+    with open(filename, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield (source, *parse(line.split("|")))
+
+
+def import_file(conn: sqlite3.Connection, filename: str, layout: str, batch_rows: int = BATCH_ROWS) -> int | None:
+    """
+    Import a reservation file unless the database already has this version.
+
+    The file's old rows are replaced, batch_rows rows per transaction.
+    Returns the number of rows imported, or None if the file was unchanged.
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"unknown layout {layout!r}, expected one of {', '.join(LAYOUTS)}")
+    path = os.path.abspath(filename)
+    st = os.stat(filename)
+
+    found = conn.execute("SELECT id, layout, size, mtime_ns FROM sources WHERE path = ?", (path,)).fetchone()
+    if found is not None and tuple(found[1:]) == (layout, st.st_size, st.st_mtime_ns):
+        return None
+
+    with conn:
+        if found is not None:
+            conn.execute("DELETE FROM reservations WHERE source = ?", (found[0],))
+            conn.execute("DELETE FROM sources WHERE id = ?", (found[0],))
+        # Size -1 marks the import as unfinished until the last batch is in
+        source = conn.execute(
+            "INSERT INTO sources (path, layout, size, mtime_ns) VALUES (?, ?, -1, -1)", (path, layout)
+        ).lastrowid
+
+    count = 0
+    rows = _lines(filename, LAYOUTS[layout], source)
+    while True:
+        batch = list(islice(rows, batch_rows))
+        if not batch:
+            break
+        with conn:
+            conn.executemany(INSERT, batch)
+        count += len(batch)
+
+    with conn:
+        conn.execute(
+            "UPDATE sources SET size = ?, mtime_ns = ? WHERE id = ?", (st.st_size, st.st_mtime_ns, source)
+        )
+    return count
+
+
+def source_id(conn: sqlite3.Connection, filename: str) -> int:
+    """Database id of an imported file (KeyError if it was never imported)."""
+    found = conn.execute("SELECT id FROM sources WHERE path = ?", (os.path.abspath(filename),)).fetchone()
+    if found is None:
+        raise KeyError(filename)
+    return found[0]
+
+
+def _query(conn: sqlite3.Connection, where: str, params: Iterable) -> Iterator[StoredReservation]:
+    cursor = conn.cursor()
+    cursor.row_factory = _reservation
+    return cursor.execute(f"SELECT {COLUMNS} FROM reservations WHERE {where} ORDER BY rowid", tuple(params))
+
+
+def all_reservations(conn: sqlite3.Connection, source: int) -> Iterator[StoredReservation]:
+    """Every reservation of one file, in file order."""
+    return _query(conn, "source = ?", (source,))
+
+
+def confirmed_reservations(conn: sqlite3.Connection, source: int) -> Iterator[StoredReservation]:
+    """Confirmed reservations of one file, in file order."""
+    return _query(conn, "source = ? AND confirmed = 1", (source,))
+
+
+def long_reservations(conn: sqlite3.Connection, source: int, hours: int = LONG_HOURS) -> Iterator[StoredReservation]:
+    """Reservations of at least hours hours, in file order."""
+    return _query(conn, "source = ? AND duration >= ?", (source, hours))
+
+
+def find_reservations(
+    conn: sqlite3.Connection,
+    source: int | None = None,
+    confirmed: bool | None = None,
+    resource: str | None = None,
+    start: date | None = None,
+    end: date | None = None,
+    min_duration: int | None = None,
+    max_duration: int | None = None,
+) -> Iterator[StoredReservation]:
+    """
+    Reservations matching every given filter (None = any), in import order.
+    Dates are inclusive; without a source every imported file is searched.
+    """
+    filters = [
+        ("source = ?", source),
+        ("confirmed = ?", None if confirmed is None else int(confirmed)),
+        ("resource = ?", resource),
+        ("day >= ?", None if start is None else start.toordinal()),
+        ("day <= ?", None if end is None else end.toordinal()),
+        ("duration >= ?", min_duration),
+        ("duration <= ?", max_duration),
+    ]
+    used = [(clause, value) for clause, value in filters if value is not None]
+    where = " AND ".join(clause for clause, _ in used) or "1"
+    return _query(conn, where, [value for _, value in used])
+
+
+def confirmed_revenue(conn: sqlite3.Connection, source: int) -> float:
+    """Sum of duration * price over the confirmed reservations of one file."""
+    (total,) = conn.execute(
+        "SELECT TOTAL(duration * price) FROM reservations WHERE source = ? AND confirmed = 1", (source,)
+    ).fetchone()
+    return total
+
+
+def open_file(db_path: str, filename: str, layout: str) -> Tuple[sqlite3.Connection, int]:
+    """Open the database, import the file if it is new or changed, return (connection, source id)."""
+    conn = connect(db_path)
+    import_file(conn, filename, layout)
+    return conn, source_id(conn, filename)
+
+
+def print_report(conn: sqlite3.Connection, source: int) -> None:
+    """The TaskG report (confirmed list, long bookings, confirmed revenue) from SQL queries."""
+    print("Confirmed reservations:")
+    for r in confirmed_reservations(conn, source):
+        print(
+            f"- {r.name}, {r.resource}, "
+            f"{r.date.strftime('%d.%m.%Y')} at {r.time.strftime('%H.%M')}"
+        )
+
+    print("\nLong reservations (duration >= 3h):")
+    for r in long_reservations(conn, source):
+        print(f"- {r.name} ({r.duration}h), total {r.total_price():.2f} €")
+
+    print(f"\nTotal revenue (confirmed): {confirmed_revenue(conn, source):.2f} €")
+
+
+def main() -> None:
+    """Command line: import reservation files, or print the report of one."""
+    parser = argparse.ArgumentParser(description="SQLite store for reservation files.")
+    parser.add_argument("--db", default="reservations.db", help="database file (default: reservations.db)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    imp = commands.add_parser("import", help="import (or re-import changed) reservation files")
+    imp.add_argument("files", nargs="+")
+    imp.add_argument("--layout", choices=sorted(LAYOUTS), default="taskg")
+    imp.add_argument("--batch-rows", type=int, default=BATCH_ROWS)
+
+    report = commands.add_parser("report", help="confirmed list, long bookings and revenue of one file")
+    report.add_argument("file")
+    report.add_argument("--layout", choices=sorted(LAYOUTS), default="taskg")
+    args = parser.parse_args()
+
+    if args.command == "import":
+        conn = connect(args.db)
+        for name in args.files:
+            count = import_file(conn, name, args.layout, args.batch_rows)
+            print(f"{name}: " + ("unchanged" if count is None else f"{count} rows imported"))
+    else:
+        conn, source = open_file(args.db, args.file, args.layout)
+        print_report(conn, source)
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
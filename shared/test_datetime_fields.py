@@ -0,0 +1,81 @@
+# Copyright (c) 2026 Ismail Hossain
+# License: MIT
+
+"""
+Checks parse_date(), parse_time() and parse_datetime() against
+datetime.strptime() on random valid and damaged fields.
+
+Run from the repository root:
+    python3 -m unittest shared.test_datetime_fields
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import unittest
+from datetime import datetime
+from typing import Callable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared.datetime_fields import (  # noqa: E402
+    DATE_FORMAT, DATETIME_FORMAT, TIME_FORMAT, parse_date, parse_datetime, parse_time,
+)
+
+# Random fields tried per parser
+CASES = 20_000
+
+# Characters a damaged field may pick up
+NOISE = "0123456789 -:+_x٣"
+
+
+def outcome(parse: Callable[[str], object], value: str) -> tuple:
+    """What parsing gives: ('ok', result) or ('error', message)."""
+    try:
+        return ("ok", parse(value))
+    except ValueError as error:
+        return ("error", str(error))
+
+
+def damage(rng: random.Random, value: str) -> str:
+    """The value with one character replaced, inserted or removed."""
+    i = rng.randrange(len(value) + 1)
+    kind = rng.randrange(3)
+    if kind == 0 and i < len(value):
+        return value[:i] + rng.choice(NOISE) + value[i + 1:]
+    if kind == 1:
+        return value[:i] + rng.choice(NOISE) + value[i:]
+    return value[:i] + value[i + 1:]
+
+
+def random_field(rng: random.Random) -> str:
+    """A date and time with out-of-range parts now and then, as 'YYYY-MM-DD HH:MM:SS'."""
+    return (
+        f"{rng.randint(1, 9999):04d}-{rng.randint(0, 13):02d}-{rng.randint(0, 32):02d} "
+        f"{rng.randint(0, 25):02d}:{rng.randint(0, 61):02d}:{rng.randint(0, 61):02d}"
+    )
+
+
+class ParserTest(unittest.TestCase):
+
+    def check(self, parse: Callable[[str], object], reference: Callable[[str], object], cut: slice) -> None:
+        rng = random.Random(parse.__name__)
+        for _ in range(CASES):
+            value = random_field(rng)[cut]
+            if rng.random() < 0.5:
+                value = damage(rng, value)
+            self.assertEqual(outcome(parse, value), outcome(reference, value), value)
+
+    def test_parse_date(self) -> None:
+        self.check(parse_date, lambda value: datetime.strptime(value, DATE_FORMAT).date(), slice(0, 10))
+
+    def test_parse_time(self) -> None:
+        self.check(parse_time, lambda value: datetime.strptime(value, TIME_FORMAT).time(), slice(11, 16))
+
+    def test_parse_datetime(self) -> None:
+        self.check(parse_datetime, lambda value: datetime.strptime(value, DATETIME_FORMAT), slice(0, 19))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# Copyright (c) 2026 Ismail Hossain
+# License: MIT
+
+"""
+Checks reservation_store.find_reservations() against a plain loop over
+the lines of random TaskG reservation files.
+
+Run from the repository root:
+    python3 -m unittest shared.test_reservation_store
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared import reservation_store  # noqa: E402
+
+RESOURCES = ["Red Room", "Flower Room", "Botanical Lab", "Forest Area 1"]
+FIRST_DAY = date(2025, 9, 1)
+DAYS = 90
+
+
+def write_file(path: str, rng: random.Random, rows: int, first_id: int) -> None:
+    """A TaskG reservations file of random rows."""
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(first_id, first_id + rows):
+            day = FIRST_DAY + timedelta(days=rng.randrange(DAYS))
+            f.write("|".join([
+                str(i), f"Guest {rng.randrange(50)}", f"guest{i}@example.org", "0400000000",
+                day.isoformat(), f"{rng.randrange(24):02d}:{rng.choice([0, 15, 30, 45]):02d}",
+                str(rng.randint(1, 6)), f"{rng.randint(500, 4000) / 100:.2f}", rng.choice(["True", "False"]),
+                rng.choice(RESOURCES), "2025-08-01 10:00:00",
+            ]) + "\n")
+
+
+def read_file(path: str) -> List[dict]:
+    """The file's rows as dicts, parsed with strptime()."""
+    rows = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            parts = line.strip().split("|")
+            rows.append({
+                "id": int(parts[0]),
+                "date": datetime.strptime(parts[4], "%Y-%m-%d").date(),
+                "duration": int(parts[6]),
+                "confirmed": parts[8] == "True",
+                "resource": parts[9],
+            })
+    return rows
+
+
+def random_filters(rng: random.Random) -> Dict[str, object]:
+    filters: Dict[str, object] = {
+        "confirmed": rng.choice([None, None, True, False]),
+        "resource": rng.choice([None, None, "Storage Area N", *RESOURCES]),
+        "min_duration": rng.choice([None, None, 1, 3, 5, 7]),
+        "max_duration": rng.choice([None, None, 0, 2, 4]),
+    }
+    for name in ("start", "end"):
+        filters[name] = FIRST_DAY + timedelta(days=rng.randrange(-5, DAYS + 5)) if rng.random() < 0.6 else None
+    return filters
+
+
+def brute_force(rows: List[dict], filters: Dict[str, object]) -> List[int]:
+    """Ids of the matching rows in file order, testing every row."""
+    return [
+        row["id"] for row in rows
+        if (filters["confirmed"] is None or row["confirmed"] == filters["confirmed"])
+        and (filters["resource"] is None or row["resource"] == filters["resource"])
+        and (filters["start"] is None or row["date"] >= filters["start"])
+        and (filters["end"] is None or row["date"] <= filters["end"])
+        and (filters["min_duration"] is None or row["duration"] >= filters["min_duration"])
+        and (filters["max_duration"] is None or row["duration"] <= filters["max_duration"])
+    ]
+
+
+class FindReservationsTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        rng = random.Random(25)
+        self.files = [os.path.join(folder.name, name) for name in ("a.txt", "b.txt")]
+        for i, path in enumerate(self.files):
+            write_file(path, rng, 300, first_id=1000 * (i + 1))
+        self.conn = reservation_store.connect(os.path.join(folder.name, "reservations.db"))
+        self.addCleanup(self.conn.close)
+        for path in self.files:
+            # Small batches so an import spans several transactions
+            self.assertEqual(reservation_store.import_file(self.conn, path, "taskg", batch_rows=64), 300)
+
+    def test_matches_brute_force(self) -> None:
+        rng = random.Random(250)
+        for path in self.files:
+            rows = read_file(path)
+            source = reservation_store.source_id(self.conn, path)
+            for _ in range(200):
+                filters = random_filters(rng)
+                found = reservation_store.find_reservations(self.conn, source, **filters)
+                self.assertEqual([r.reservation_id for r in found], brute_force(rows, filters), filters)
+
+    def test_all_sources(self) -> None:
+        rng = random.Random(251)
+        rows = read_file(self.files[0]) + read_file(self.files[1])
+        for _ in range(50):
+            filters = random_filters(rng)
+            found = reservation_store.find_reservations(self.conn, None, **filters)
+            self.assertEqual([r.reservation_id for r in found], brute_force(rows, filters), filters)
+
+    def test_unchanged_file_is_not_imported_again(self) -> None:
+        self.assertIsNone(reservation_store.import_file(self.conn, self.files[0], "taskg"))
+
+
+if __name__ == "__main__":
+    unittest.main()